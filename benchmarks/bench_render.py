@@ -0,0 +1,107 @@
+"""Micro-benchmark for template rendering in a large workspace.
+
+Builds a workspace with 100 members in a temporary directory and times
+the README.md and pyproject.toml rendering done by ``parse_docs`` against
+the previous copy-then-``str.replace`` approach.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_render.py [--members N] [--repeat N]
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from argparse import Namespace
+from collections.abc import Callable
+from pathlib import Path
+
+from uv_start.parse_docs import (
+    TEMPLATE_DIR,
+    _parse_replacement,
+    _render_template,
+    _update_content,
+)
+from uv_start.workspace import Workspace
+
+PYPROJECT = """\
+[project]
+name = "{package_name}"
+version = "0.1.0"
+requires-python = ">={python_version}"
+authors = [{{ name = "{author}", email = "{email}" }}]
+
+[tool.commitizen]
+version_files = ["src/{module_name}/__init__.py:__version__"]
+"""
+
+
+def make_workspace(root: Path, members: int) -> Path:
+    """Create a project with ``members`` packages and their pyproject.toml."""
+    project_dir = root / "bench-root"
+    for i in range(members):
+        member = project_dir / "packages" / f"member-{i:03d}"
+        member.mkdir(parents=True)
+    for path in Workspace.scan(project_dir).files("pyproject.toml"):
+        path.write_text(PYPROJECT)
+    return project_dir
+
+
+def legacy_render(args: Namespace, project_dir: Path) -> None:
+    """Copy README.md everywhere, then re-read and replace entry by entry."""
+    for path in Workspace.scan(project_dir).files("README.md"):
+        shutil.copy(TEMPLATE_DIR / "README.md", path)
+    for name in ["README.md", "pyproject.toml"]:
+        for path in Workspace.scan(project_dir).files(name):
+            replacements = _parse_replacement(args, path)
+            content = path.read_text()
+            for old, new in replacements.items():
+                content = content.replace(old, new)
+            path.write_text(content)
+
+
+def compiled_render(args: Namespace, project_dir: Path) -> None:
+    """Render README.md from the template and pyproject.toml in place."""
+    _render_template(
+        args, "README.md", Workspace.scan(project_dir).files("README.md")
+    )
+    _update_content(project_dir, args, "pyproject.toml")
+
+
+def best_of(
+    render: Callable[[Namespace, Path], None], members: int, repeat: int
+) -> float:
+    """Return the fastest of ``repeat`` runs on a fresh workspace."""
+    args = Namespace(project_name="bench-root", python="3.13")
+    timings = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            project_dir = make_workspace(Path(tmp), members)
+            start = time.perf_counter()
+            render(args, project_dir)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    # Silence the per-file progress output while timing
+    import uv_start.parse_docs
+
+    uv_start.parse_docs.rprint = lambda *args, **kwargs: None
+
+    legacy = best_of(legacy_render, options.members, options.repeat)
+    compiled = best_of(compiled_render, options.members, options.repeat)
+    print(f"{options.members} members, best of {options.repeat}")
+    print(f"  legacy   {legacy * 1000:8.2f} ms")
+    print(f"  compiled {compiled * 1000:8.2f} ms")
+    print(f"  speedup  {legacy / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
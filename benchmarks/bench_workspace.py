@@ -0,0 +1,86 @@
+"""Stress benchmark for per-member work in a large workspace.
+
+Generates a workspace with hundreds of members as ``uv init`` would leave
+it, then times the file work uv-start does for every member: merging the
+dev configs, rendering README.md and pyproject.toml and writing the
+version files. Each size is run with a single member worker and with the
+default pool, so the effect of the thread pool is visible.
+
+Run from the repository root:
+
+    uv run python benchmarks/bench_workspace.py [--members N ...]
+"""
+
+import argparse
+import tempfile
+import time
+from argparse import Namespace
+from pathlib import Path
+
+import uv_start.dev_deps
+import uv_start.parse_docs
+import uv_start.workspace
+from uv_start.dev_deps import parse_dev_configs
+from uv_start.parse_docs import render_pyproject, render_templates
+from uv_start.workspace import Workspace
+
+ROOT = "stress-root"
+
+
+def make_workspace(parent: Path, members: int) -> Path:
+    """Lay out a root project and ``members`` packages."""
+    root = parent / ROOT
+    names = [f"member-{i:04d}" for i in range(members)]
+    for path, name in [(root, ROOT)] + [
+        (root / "packages" / name, name) for name in names
+    ]:
+        module = name.replace("-", "_")
+        (path / "src" / module).mkdir(parents=True)
+        (path / "src" / module / "__init__.py").write_text("")
+        (path / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\nversion = "0.1.0"\n'
+        )
+    return root
+
+
+def run_once(members: int, workers: int) -> float:
+    """Time the per-member pipeline on a fresh workspace."""
+    uv_start.workspace.MEMBER_WORKERS = workers
+    args = Namespace(project_name=ROOT, python="3.13", github=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = make_workspace(Path(tmp), members)
+        start = time.perf_counter()
+        workspace = Workspace.scan(root)
+        render_templates(args, root, workspace)
+        parse_dev_configs(root, workspace)
+        render_pyproject(args, root, workspace)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--members", type=int, nargs="+", default=[100, 300, 600]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args()
+
+    # Silence the per-file progress output while timing
+    for module in (uv_start.dev_deps, uv_start.parse_docs):
+        module.rprint = lambda *args, **kwargs: None
+
+    default_workers = uv_start.workspace.MEMBER_WORKERS
+    print(f"{'members':>8} {'serial':>10} {'pool':>10} {'speedup':>8}")
+    for members in options.members:
+        serial = min(run_once(members, 1) for _ in range(options.repeat))
+        pooled = min(
+            run_once(members, default_workers) for _ in range(options.repeat)
+        )
+        print(
+            f"{members:>8} {serial * 1000:>8.1f}ms {pooled * 1000:>8.1f}ms "
+            f"{serial / pooled:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
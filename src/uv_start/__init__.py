@@ -1,4 +1,16 @@
 __version__ = "0.5.2"
 import __main__
 
-__all__ = ["__version__", "__main__"]
+# Library API, imported on first use to keep ``uv-start --help`` fast
+_API = ("ProjectSpec", "Result", "create_project", "resume_project")
+
+
+def __getattr__(name: str) -> object:
+    if name in _API:
+        from uv_start import api
+
+        return getattr(api, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["__version__", "__main__", *_API]
@@ -1,89 +1,223 @@
+"""Command-line entry point of uv-start.
+
+Only the argument parser is imported up front; the modules that create
+projects, warm caches or record timings load when a command needs them,
+so ``--help``, ``--config`` and argument errors return quickly.
+"""
+
 import os
-import shutil
 import sys
 from argparse import Namespace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich import print as rprint
-from rich.panel import Panel
 
-from uv_start.cli import parse_args
-from uv_start.dev_deps import add_dev_dependencies, parse_dev_configs
-from uv_start.exceptions import GitSetupError, UvInitError
-from uv_start.parse_docs import parse_docs, parse_docs_data
-from uv_start.router import CommandDispatcher
-from uv_start.setup_git_repo import setup_git_repo
+from uv_start.cli import (
+    parse_args,
+    parse_batch_args,
+    parse_stats_args,
+    parse_warm_args,
+)
+from uv_start.exceptions import UvInitError
 
+if TYPE_CHECKING:
+    from uv_start.timings import TimingRecorder
 
-def _rollback(project_path: Path) -> None:
-    """Remove an incomplete project directory after a failed creation."""
-    if project_path.exists():
-        shutil.rmtree(project_path)
-        rprint(
-            "[yellow]Rolled back: removed incomplete project directory[/yellow]"
+
+def _fail(title: str, error: UvInitError) -> None:
+    """Show ``error`` in a red panel and exit with status 1."""
+    from rich.panel import Panel
+
+    rprint(
+        Panel.fit(
+            f"[red]Error:[/red] {error}", title=title, border_style="red"
         )
+    )
+    sys.exit(1)
+
 
+def _original_cwd() -> Path:
+    """Return the directory new projects are created in."""
+    return Path(os.environ.get("UV_ORIGINAL_CWD", os.getcwd()))
 
-def initialize_uv_start(args: Namespace) -> None:
-    """Initialize a new uv project with two-phase execution.
 
-    Phase 1 (local): scaffolding, deps, configs, templates.
-        On failure, rolls back (removes) the project directory.
-    Phase 2 (remote): git commit + GitHub repo creation.
-        On failure, warns the user but keeps the local project.
+def initialize_uv_start(
+    args: Namespace, recorder: "TimingRecorder | None" = None
+) -> None:
+    """Create the project ``args`` asks for and report the outcome.
+
+    A thin layer over :mod:`uv_start.api`: errors are shown in a panel
+    and exit with status 1. A failed GitHub setup only warns, since the
+    project is complete locally. With ``args.resume`` the options and
+    finished steps are taken from the journal of the named project.
+
+    With ``--events json`` progress is streamed as NDJSON and the run
+    ends with a ``result`` event instead of a panel. With ``--events
+    live`` the steps are shown in a live view with an ETA from the run
+    history.
     """
-    original_cwd = Path(os.environ.get("UV_ORIGINAL_CWD", os.getcwd()))
-    dispatcher = CommandDispatcher(args=args, original_cwd=original_cwd)
-    dispatcher.check_dir_exists()
+    from contextlib import nullcontext
+
+    from uv_start.api import create_from_args, resume_project
+    from uv_start.reporting import ConsoleReporter, JsonReporter, Reporter
 
+    events = live = None
+    reporter: Reporter
+    mode = getattr(args, "events", "console")
+    if mode == "json":
+        reporter = events = JsonReporter()
+    elif mode == "live":
+        from uv_start.history import Estimate, estimate
+        from uv_start.live import LiveReporter
+
+        # A resumed run skips finished steps, so earlier runs do not
+        # tell how long it will take
+        expected = (
+            Estimate(0, None, {})
+            if getattr(args, "resume", None)
+            else estimate(args)
+        )
+        reporter = live = LiveReporter(expected)
+    else:
+        reporter = ConsoleReporter()
+    options = {"reporter": reporter, "recorder": recorder}
     try:
-        # Phase 1: Local project creation (rollback on failure)
-        dispatcher.dispatch()
-        if getattr(args, "data", False):
-            parse_docs_data(args, dispatcher.project_path)
-        else:
-            add_dev_dependencies(args.project_name, dispatcher.project_path)
-            parse_dev_configs(dispatcher.project_path)
-            parse_docs(args, dispatcher.project_path)
+        with live or nullcontext():
+            if getattr(args, "resume", None):
+                result = resume_project(
+                    args.resume, _original_cwd(), **options
+                )
+            else:
+                result = create_from_args(args, _original_cwd(), **options)
     except UvInitError as e:
-        _rollback(dispatcher.project_path)
+        if events is not None:
+            events.emit("result", ok=False, error=str(e))
+            sys.exit(1)
+        title = "Resume Failed" if getattr(args, "resume", None) else None
+        _fail(title or "Project Creation Failed", e)
+
+    if events is not None:
+        events.emit(
+            "result",
+            ok=True,
+            path=str(result.path),
+            duration=round(result.duration, 6),
+            steps={
+                name: round(duration, 6)
+                for name, duration in result.steps.items()
+            },
+            publish_error=result.publish_error and str(result.publish_error),
+        )
+    elif result.publish_error is not None:
+        from rich.panel import Panel
+
         rprint(
             Panel.fit(
-                f"[red]Error:[/red] {e}",
-                title="Project Creation Failed",
-                border_style="red",
+                "[yellow]Warning:[/yellow] GitHub setup failed: "
+                f"{result.publish_error}\n\n"
+                f"Your project was created successfully at:\n"
+                f"[blue]{result.path}[/blue]\n\n"
+                f"Retry with: uv-start --resume {result.path.name}",
+                title="GitHub Setup Failed",
+                border_style="yellow",
             )
         )
+
+
+def batch(argv: list[str]) -> None:
+    """Run ``uv-start batch``; exits non-zero if any project failed."""
+    from uv_start.api import create_from_args
+    from uv_start.batch import load_manifest, run_batch, summary_table
+    from uv_start.reporting import ConsoleReporter
+
+    options = parse_batch_args(argv)
+    original_cwd = _original_cwd()
+    try:
+        projects = load_manifest(options.manifest)
+    except UvInitError as e:
+        _fail("Invalid Manifest", e)
+
+    def create(args: Namespace) -> None:
+        result = create_from_args(
+            args, original_cwd, reporter=ConsoleReporter()
+        )
+        if result.publish_error is not None:
+            raise result.publish_error
+
+    results = run_batch(projects, create, jobs=options.jobs)
+    rprint(summary_table(results))
+    if not all(result.ok for result in results):
         sys.exit(1)
 
-    # Phase 2: Git/GitHub setup (no rollback — project is complete locally)
-    if args.github:
-        try:
-            setup_git_repo(
-                args.project_name,
-                dispatcher.project_path,
-                private=args.private,
-            )
-        except GitSetupError as e:
-            rprint(
-                Panel.fit(
-                    f"[yellow]Warning:[/yellow] GitHub setup failed: {e}\n\n"
-                    f"Your project was created successfully at:\n"
-                    f"[blue]{dispatcher.project_path}[/blue]",
-                    title="GitHub Setup Failed",
-                    border_style="yellow",
-                )
-            )
+
+def warm(argv: list[str]) -> None:
+    """Run ``uv-start warm``; exits non-zero if any cache step fails."""
+    from uv_start.warm import warm_caches
+
+    args = parse_warm_args(argv)
+    try:
+        warm_caches(args.pythons, data=args.data, hooks=args.hooks)
+    except UvInitError as e:
+        _fail("Cache Warm-up Failed", e)
+
+
+def stats(argv: list[str]) -> None:
+    """Run ``uv-start stats``: summarise the run history."""
+    from uv_start.history import (
+        HISTORY_FILE,
+        load_runs,
+        regression_table,
+        step_table,
+        type_table,
+    )
+
+    args = parse_stats_args(argv)
+    runs = load_runs()
+    if args.last:
+        runs = runs[-args.last :]
+    if not runs:
+        rprint(f"[yellow]No runs recorded yet in {HISTORY_FILE}[/yellow]")
+        return
+    rprint(step_table(runs))
+    rprint(type_table(runs))
+    regressions = regression_table(runs)
+    if regressions is not None:
+        rprint(regressions)
 
 
 def main() -> None:
+    if sys.argv[1:2] == ["warm"]:
+        warm(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["batch"]:
+        batch(sys.argv[2:])
+        return
+    if sys.argv[1:2] == ["stats"]:
+        stats(sys.argv[2:])
+        return
     args = parse_args()
     if args.config:
         from uv_start.config import save_config
 
         save_config(name=args.config[0], email=args.config[1])
         return
-    initialize_uv_start(args)
+    if not (args.timings or args.trace):
+        initialize_uv_start(args)
+        return
+
+    from uv_start.timings import TimingRecorder
+
+    recorder = TimingRecorder()
+    try:
+        initialize_uv_start(args, recorder)
+    finally:
+        if args.timings:
+            rprint(recorder.summary_table())
+        if args.trace:
+            recorder.write_trace(args.trace)
+            if args.events != "json":
+                rprint(f"[green]Trace written to {args.trace}[/green]")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+"""Create projects from Python code.
+
+:func:`create_project` runs the same pipeline as the ``uv-start``
+command: preflight, build in staging, move into place, provision and
+publish. It uses no argparse and, unless given a reporter, prints
+nothing::
+
+    from uv_start import ProjectSpec, create_project
+
+    result = create_project(ProjectSpec("study-utils", python="3.13"))
+    print(result.path, result.steps)
+
+A failure raises the :class:`~uv_start.exceptions.UvInitError` subclass
+of the step that failed. As with the command line, the project is rolled
+back, or kept for :func:`resume_project` once its dependencies are
+installed. A failed GitHub setup does not raise, since the project is
+complete locally: it is returned with :attr:`Result.publish_error` set
+and can be published with :func:`resume_project`.
+
+Every run is appended to the run history (see :mod:`uv_start.history`).
+"""
+
+import argparse
+import time
+from argparse import Namespace
+from dataclasses import dataclass
+from pathlib import Path
+
+from uv_start.cli import PYTHON_VERSIONS, validate_project_name
+from uv_start.exceptions import ConfigError, GitSetupError
+from uv_start.history import record_run
+from uv_start.interpreters import AUTO
+from uv_start.journal import Journal, find_journal
+from uv_start.pipeline import create_local_project, publish_project
+from uv_start.reporting import Reporter, report, reporting
+from uv_start.router import MEMBER_FLAGS
+from uv_start.timings import Span, TimingRecorder, recording, step_durations
+
+PROJECT_TYPES = ("lib", "app", "package")
+SYNC_MODES = ("full", "background", "none")
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """What to create; the fields mirror the command-line options.
+
+    Raises:
+        ConfigError: If the options are invalid or contradict each
+            other.
+    """
+
+    name: str
+    type: str = "lib"
+    python: str = AUTO
+    members: tuple[tuple[str, str], ...] = ()
+    workspace: bool = False
+    github: bool = False
+    private: bool = False
+    data: bool = False
+    cache: bool = False
+    sync: str = "full"
+
+    def __post_init__(self) -> None:
+        names = [self.name, *(name for name, _ in self.members)]
+        for name in names:
+            try:
+                validate_project_name(name)
+            except argparse.ArgumentTypeError as e:
+                raise ConfigError(
+                    f"Invalid project name '{name}': {e}"
+                ) from None
+        for option, value, choices in [
+            ("type", self.type, PROJECT_TYPES),
+            ("python", self.python, [AUTO, *PYTHON_VERSIONS]),
+            ("sync", self.sync, SYNC_MODES),
+            *(("member type", kind, MEMBER_FLAGS) for _, kind in self.members),
+        ]:
+            if value not in choices:
+                raise ConfigError(
+                    f"Invalid {option} '{value}', expected one of "
+                    f"{', '.join(choices)}"
+                )
+        if len(set(names)) != len(names):
+            raise ConfigError(
+                "Workspace members need unique names, "
+                "different from the project name"
+            )
+        if self.workspace and not self.members:
+            raise ConfigError(
+                "A workspace needs members, since member prompts "
+                "cannot be answered"
+            )
+        if self.private and not self.github:
+            raise ConfigError("private can only be used with github")
+
+    def to_args(self) -> Namespace:
+        """Return the arguments ``uv_start.cli.parse_args`` would."""
+        return Namespace(
+            project_name=self.name,
+            config=None,
+            type=self.type,
+            python=self.python,
+            workspace=bool(self.members),
+            members=list(self.members) or None,
+            github=self.github,
+            private=self.private,
+            data=self.data,
+            cache=self.cache,
+            sync=self.sync,
+            resume=None,
+            timings=False,
+            trace=None,
+            events="console",
+        )
+
+
+@dataclass(frozen=True)
+class Result:
+    """A created project and how long creating it took."""
+
+    path: Path
+    spans: tuple[Span, ...]
+    duration: float
+    publish_error: GitSetupError | None = None
+
+    @property
+    def steps(self) -> dict[str, float]:
+        """Seconds spent in each phase and pipeline step, in start order.
+
+        Steps finished by an earlier, resumed run are not included.
+        """
+        return step_durations(self.spans)
+
+
+def create_project(
+    spec: ProjectSpec,
+    directory: Path | None = None,
+    *,
+    reporter: Reporter | None = None,
+    recorder: TimingRecorder | None = None,
+) -> Result:
+    """Create the project ``spec`` describes inside ``directory``.
+
+    ``directory`` defaults to the working directory. Progress goes to
+    ``reporter`` (silent by default) and timings to ``recorder`` (a new
+    one by default; its spans end up on the result).
+
+    Raises:
+        UvInitError: If the project could not be created.
+    """
+    return create_from_args(
+        spec.to_args(), directory, reporter=reporter, recorder=recorder
+    )
+
+
+def resume_project(
+    name: str,
+    directory: Path | None = None,
+    *,
+    reporter: Reporter | None = None,
+    recorder: TimingRecorder | None = None,
+) -> Result:
+    """Finish an interrupted run of project ``name``, like ``--resume``.
+
+    Raises:
+        ConfigError: If there is nothing to resume.
+        UvInitError: If the project could not be finished.
+    """
+    directory = directory or Path.cwd()
+    journal = find_journal(directory, name)
+    return _run(journal.args, directory, journal, reporter, recorder)
+
+
+def create_from_args(
+    args: Namespace,
+    directory: Path | None = None,
+    *,
+    reporter: Reporter | None = None,
+    recorder: TimingRecorder | None = None,
+) -> Result:
+    """Create a project from parsed command-line arguments.
+
+    The entry point of the command line and ``uv-start batch``;
+    unlike :class:`ProjectSpec`, ``args`` may ask for a workspace whose
+    members are prompted for.
+    """
+    return _run(args, directory or Path.cwd(), None, reporter, recorder)
+
+
+def _run(
+    args: Namespace,
+    directory: Path,
+    journal: Journal | None,
+    reporter: Reporter | None,
+    recorder: TimingRecorder | None,
+) -> Result:
+    recorder = recorder or TimingRecorder()
+    start = time.perf_counter()
+    resumed = journal is not None
+    publish_error = None
+    try:
+        with reporting(reporter or Reporter()), recording(recorder):
+            if journal is not None:
+                done = ", ".join(journal.completed) or "nothing"
+                report(
+                    f"[green]Resuming '{args.project_name}' "
+                    f"(done: {done})[/green]"
+                )
+            project_path, journal = create_local_project(
+                args, directory, journal
+            )
+            try:
+                publish_project(args, project_path, journal)
+            except GitSetupError as e:
+                publish_error = e
+    except BaseException as e:
+        record_run(
+            args,
+            recorder.spans,
+            time.perf_counter() - start,
+            error=e,
+            resumed=resumed,
+        )
+        raise
+    duration = time.perf_counter() - start
+    record_run(
+        args,
+        recorder.spans,
+        duration,
+        error=publish_error,
+        resumed=resumed,
+    )
+    return Result(
+        path=project_path,
+        spans=tuple(recorder.spans),
+        duration=duration,
+        publish_error=publish_error,
+    )
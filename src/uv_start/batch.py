@@ -0,0 +1,201 @@
+"""Create several projects from a TOML manifest.
+
+A manifest lists one ``[[project]]`` table per project. The keys are the
+long option names of ``uv-start`` and an optional ``[defaults]`` table
+applies to every project::
+
+    [defaults]
+    python = "3.13"
+    github = true
+
+    [[project]]
+    name = "study-utils"
+    type = "lib"
+
+    [[project]]
+    name = "study-analysis"
+    data = true
+
+    [[project]]
+    name = "study-platform"
+    members = ["study-core:lib", "study-api:app"]
+
+Every entry is validated through :func:`uv_start.cli.parse_args`, so a
+manifest accepts exactly what the command line does. Projects are then
+created concurrently, each with its own rollback.
+"""
+
+import time
+import tomllib
+from argparse import Namespace
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.table import Table
+
+from uv_start.cli import parse_args
+from uv_start.exceptions import ConfigError, GitSetupError, UvInitError
+
+# Manifest keys, mapped to the command-line options they stand for:
+# options that take a string value and flags that take true or false
+VALUE_OPTIONS = ("type", "python")
+FLAG_OPTIONS = (
+    "workspace",
+    "github",
+    "private",
+    "data",
+    "cache",
+    "no-sync",
+    "background-sync",
+)
+MANIFEST_OPTIONS = VALUE_OPTIONS + FLAG_OPTIONS
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of one project in a batch."""
+
+    name: str
+    ok: bool
+    duration: float
+    detail: str = ""
+
+
+def load_manifest(path: Path) -> list[Namespace]:
+    """Read a manifest and return the parsed arguments of every project.
+
+    Raises:
+        ConfigError: If the manifest is missing, malformed or has an
+            entry the command line would reject.
+    """
+    try:
+        with path.open("rb") as f:
+            manifest = tomllib.load(f)
+    except FileNotFoundError as e:
+        raise ConfigError(f"Manifest not found: {path}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ConfigError(f"Invalid manifest {path}: {e}") from e
+
+    defaults = manifest.get("defaults", {})
+    entries = manifest.get("project", [])
+    if not entries:
+        raise ConfigError(f"No [[project]] entries in {path}")
+
+    projects = []
+    for entry in entries:
+        args = _entry_args({**defaults, **entry}, path)
+        if any(p.project_name == args.project_name for p in projects):
+            raise ConfigError(
+                f"Project '{args.project_name}' is listed twice in {path}"
+            )
+        projects.append(args)
+    return projects
+
+
+def _entry_args(entry: dict[str, object], path: Path) -> Namespace:
+    """Turn a manifest entry into the arguments ``parse_args`` returns."""
+    name = entry.get("name")
+    if not isinstance(name, str):
+        raise ConfigError(f"Every project in {path} needs a 'name'")
+    members = entry.get("members", [])
+    if not isinstance(members, list):
+        raise ConfigError(f"Project '{name}': 'members' must be a list")
+    if entry.get("workspace") and not members:
+        raise ConfigError(
+            f"Project '{name}': a workspace in a batch needs 'members', "
+            "since member prompts cannot be answered"
+        )
+    unknown = set(entry) - {"name", "members", *MANIFEST_OPTIONS}
+    if unknown:
+        raise ConfigError(
+            f"Project '{name}': unknown option(s) {', '.join(sorted(unknown))}"
+        )
+
+    argv = [name]
+    for option in VALUE_OPTIONS:
+        value = entry.get(option)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            raise ConfigError(
+                f"Project '{name}': '{option}' must be a quoted string, "
+                f"not {value!r}"
+            )
+        argv.extend([f"--{option}", value])
+    for option in FLAG_OPTIONS:
+        value = entry.get(option, False)
+        if not isinstance(value, bool):
+            raise ConfigError(
+                f"Project '{name}': '{option}' must be true or false, "
+                f"not {value!r}"
+            )
+        if value:
+            argv.append(f"--{option}")
+    for member in members:
+        argv.extend(["--member", str(member)])
+    try:
+        return parse_args(argv)
+    except SystemExit:
+        # parse_args has already shown the offending option
+        raise ConfigError(f"Project '{name}': invalid options") from None
+
+
+def run_batch(
+    projects: list[Namespace],
+    create: Callable[[Namespace], None],
+    jobs: int,
+) -> list[ProjectResult]:
+    """Create ``projects`` with at most ``jobs`` running at once.
+
+    ``create`` builds one project and raises :class:`UvInitError` on
+    failure (after rolling back its own directory). One failing project
+    does not stop the others. Results are returned in manifest order.
+    """
+    with ThreadPoolExecutor(
+        max_workers=jobs, thread_name_prefix="uv-start-batch"
+    ) as pool:
+        futures = [
+            pool.submit(copy_context().run, _create_one, args, create)
+            for args in projects
+        ]
+        return [future.result() for future in futures]
+
+
+def _create_one(
+    args: Namespace, create: Callable[[Namespace], None]
+) -> ProjectResult:
+    """Create one project and record how it went."""
+    start = time.perf_counter()
+    try:
+        create(args)
+    except GitSetupError as e:
+        # The local project is complete; only the GitHub step failed
+        return ProjectResult(
+            args.project_name,
+            True,
+            time.perf_counter() - start,
+            f"GitHub setup failed: {e}",
+        )
+    except UvInitError as e:
+        return ProjectResult(
+            args.project_name, False, time.perf_counter() - start, str(e)
+        )
+    return ProjectResult(args.project_name, True, time.perf_counter() - start)
+
+
+def summary_table(results: list[ProjectResult]) -> Table:
+    """Render the per-project outcome and timing."""
+    table = Table(title="uv-start batch")
+    table.add_column("Project", style="bold")
+    table.add_column("Status")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Detail", overflow="fold")
+    for result in results:
+        status = "[green]created[/green]" if result.ok else "[red]failed[/red]"
+        table.add_row(
+            result.name, status, f"{result.duration:.1f}", result.detail
+        )
+    return table
@@ -9,12 +9,20 @@ Returns:
 
 import argparse
 import sys
+from pathlib import Path
 from typing import IO, NoReturn
 
 from rich import print as rprint
 from rich.panel import Panel
 from rich.text import Text
 
+from uv_start.interpreters import AUTO, listed_versions
+
+PYTHON_VERSIONS = ["3.14", "3.13", "3.12", "3.11", "3.10"]
+
+# Projects created concurrently by ``uv-start batch``
+DEFAULT_JOBS = 2
+
 
 class RichArgumentParser(argparse.ArgumentParser):
     def format_help(self) -> str:
@@ -42,12 +50,34 @@ class RichArgumentParser(argparse.ArgumentParser):
         help_text.append("The type of project to create (default: lib)\n")
 
         help_text.append("  -p, --python ", style="bold yellow")
-        help_text.append("[3.14|3.13|3.12|3.11|3.10] ", style="italic green")
-        help_text.append("The python version to use (default: 3.12)\n")
+        help_text.append(
+            f"[{AUTO}|{'|'.join(PYTHON_VERSIONS)}] ", style="italic green"
+        )
+        help_text.append(
+            "The python version to use (default: auto, the newest installed)\n"
+        )
+        # Listing the interpreters takes seconds; help only shows a
+        # listing an earlier run saved
+        listed = listed_versions()
+        if listed is not None:
+            installed = [v for v in PYTHON_VERSIONS if v in listed]
+            help_text.append(
+                "      installed: "
+                f"{', '.join(installed) or 'none, uv downloads the one asked for'}"
+                "\n",
+                style="dim",
+            )
 
         help_text.append("  -w, --workspace ", style="bold yellow")
         help_text.append("Create a workspace\n")
 
+        help_text.append("  -m, --member ", style="bold yellow")
+        help_text.append("NAME[:lib|app] ", style="italic green")
+        help_text.append(
+            "Add a workspace member without prompting, repeatable "
+            "(implies --workspace)\n"
+        )
+
         help_text.append("  -g, --github ", style="bold yellow")
         help_text.append("Create and initialize a GitHub repository\n")
 
@@ -61,11 +91,68 @@ class RichArgumentParser(argparse.ArgumentParser):
             "Create a data analysis project (jupyter, pandas, matplotlib, seaborn)\n"
         )
 
+        help_text.append("  --cache ", style="bold yellow")
+        help_text.append(
+            "Create the project from a cached, fully provisioned snapshot\n"
+        )
+
+        help_text.append("  --no-sync ", style="bold yellow")
+        help_text.append(
+            "Only write uv.lock; .venv is built by the first uv run\n"
+        )
+
+        help_text.append("  --background-sync ", style="bold yellow")
+        help_text.append(
+            "Like --no-sync, then build .venv and the git hooks in a "
+            "detached process\n"
+        )
+
+        help_text.append("  --resume NAME ", style="bold yellow")
+        help_text.append(
+            "Continue an interrupted run from its first unfinished step\n"
+        )
+
+        help_text.append("  --timings ", style="bold yellow")
+        help_text.append(
+            "Print a per-step timing breakdown at the end of the run\n"
+        )
+
+        help_text.append("  --trace FILE ", style="bold yellow")
+        help_text.append(
+            "Write the step timings as trace-event JSON (chrome://tracing)\n"
+        )
+
+        help_text.append("  --events ", style="bold yellow")
+        help_text.append("[console|live|json] ", style="italic green")
+        help_text.append(
+            "Report progress as rich console output (default), as a live "
+            "view of the steps with an ETA, or as one JSON event per line "
+            "on stdout\n"
+        )
+
         help_text.append("\n  --config NAME EMAIL ", style="bold yellow")
         help_text.append(
             "Configure author name and email for project templates\n"
         )
 
+        # Commands
+        help_text.append("\nCommands:\n", style="bold cyan")
+        help_text.append("  warm ", style="bold yellow")
+        help_text.append(
+            "Pre-fetch interpreters, packages and pre-commit hooks "
+            "(see uv-start warm --help)\n"
+        )
+        help_text.append("  batch MANIFEST ", style="bold yellow")
+        help_text.append(
+            "Create every project listed in a TOML manifest "
+            "(see uv-start batch --help)\n"
+        )
+        help_text.append("  stats ", style="bold yellow")
+        help_text.append(
+            "Show p50/p95 step timings from the run history "
+            "(see uv-start stats --help)\n"
+        )
+
         # Epilog
         help_text.append(f"\n{self.epilog}\n", style="bold blue")
 
@@ -92,15 +179,101 @@ class RichArgumentParser(argparse.ArgumentParser):
         sys.exit(2)
 
 
-def parse_args() -> argparse.Namespace:
+class WarmArgumentParser(RichArgumentParser):
+    def format_help(self) -> str:
+        help_text = Text()
+
+        help_text.append("\nDescription:\n", style="bold cyan")
+        help_text.append(f"  {self.description}\n\n")
+
+        help_text.append("Usage:\n", style="bold cyan")
+        help_text.append(f"  {self.usage}\n\n")
+
+        help_text.append("Options:\n", style="bold cyan")
+        help_text.append("  -p, --python ", style="bold yellow")
+        help_text.append(
+            f"[{'|'.join(PYTHON_VERSIONS)}] ", style="italic green"
+        )
+        help_text.append(
+            "Interpreter to warm, repeatable (default: all of them)\n"
+        )
+
+        help_text.append("  --no-data ", style="bold yellow")
+        help_text.append("Skip the data analysis stack (jupyter, pandas...)\n")
+
+        help_text.append("  --no-hooks ", style="bold yellow")
+        help_text.append("Skip building pre-commit hook environments\n")
+
+        help_text.append(f"\n{self.epilog}\n", style="bold blue")
+
+        return str(help_text)
+
+
+class BatchArgumentParser(RichArgumentParser):
+    def format_help(self) -> str:
+        help_text = Text()
+
+        help_text.append("\nDescription:\n", style="bold cyan")
+        help_text.append(f"  {self.description}\n\n")
+
+        help_text.append("Usage:\n", style="bold cyan")
+        help_text.append(f"  {self.usage}\n\n")
+
+        help_text.append("Arguments:\n", style="bold cyan")
+        help_text.append("  manifest ", style="bold yellow")
+        help_text.append(
+            "TOML file with one [[project]] table per project; keys are "
+            "the long option names (type, python, github, private, data, "
+            "cache, no-sync, background-sync)\n"
+        )
+
+        help_text.append("\nOptions:\n", style="bold cyan")
+        help_text.append("  -j, --jobs N ", style="bold yellow")
+        help_text.append(
+            f"Projects to create at the same time (default: {DEFAULT_JOBS})\n"
+        )
+
+        help_text.append(f"\n{self.epilog}\n", style="bold blue")
+
+        return str(help_text)
+
+
+class StatsArgumentParser(RichArgumentParser):
+    def format_help(self) -> str:
+        help_text = Text()
+
+        help_text.append("\nDescription:\n", style="bold cyan")
+        help_text.append(f"  {self.description}\n\n")
+
+        help_text.append("Usage:\n", style="bold cyan")
+        help_text.append(f"  {self.usage}\n\n")
+
+        help_text.append("Options:\n", style="bold cyan")
+        help_text.append("  --last N ", style="bold yellow")
+        help_text.append(
+            "Only use the N most recent runs (default: all of them)\n"
+        )
+
+        help_text.append(f"\n{self.epilog}\n", style="bold blue")
+
+        return str(help_text)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = RichArgumentParser(
         description="Initialize a new Python project with uv",
         usage=(
             "uv-start project_name "
             "[-t lib|package|app] "
-            "[-p 3.14|3.13|3.12|3.11|3.10] "
-            "[-w] [-g] [--private]\n"
-            "       uv-start --config NAME EMAIL"
+            f"[-p {AUTO}|{'|'.join(PYTHON_VERSIONS)}] "
+            "[-w] [-m NAME[:lib|app] ...] [-g] [--private] [--cache] "
+            "[--no-sync | --background-sync] [--timings] [--trace FILE] "
+            "[--events console|live|json]\n"
+            "       uv-start --resume NAME [--events console|live|json]\n"
+            "       uv-start --config NAME EMAIL\n"
+            "       uv-start warm [-p VERSION ...] [--no-data] [--no-hooks]\n"
+            "       uv-start batch MANIFEST [-j N]\n"
+            "       uv-start stats [--last N]"
         ),
         epilog="Thanks for using uv_start!",
     )
@@ -130,9 +303,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "-p",
         "--python",
-        help="The python version to use",
-        default="3.13",
-        choices=["3.14", "3.13", "3.12", "3.11", "3.10"],
+        help="The python version to use (auto: newest installed)",
+        default=AUTO,
+        choices=[AUTO, *PYTHON_VERSIONS],
     )
 
     parser.add_argument(
@@ -143,6 +316,16 @@ def parse_args() -> argparse.Namespace:
         default=False,
     )
 
+    parser.add_argument(
+        "-m",
+        "--member",
+        help="Add a workspace member NAME[:lib|app] (repeatable)",
+        action="append",
+        dest="members",
+        metavar="NAME[:lib|app]",
+        type=parse_member,
+    )
+
     parser.add_argument(
         "-g",
         "--github",
@@ -165,16 +348,95 @@ def parse_args() -> argparse.Namespace:
         default=False,
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        help="Create the project from a cached, fully provisioned snapshot",
+        action="store_true",
+        default=False,
+    )
+
+    sync = parser.add_mutually_exclusive_group()
+    sync.add_argument(
+        "--no-sync",
+        help="Only write uv.lock; do not build .venv or install git hooks",
+        action="store_const",
+        dest="sync",
+        const="none",
+        default="full",
+    )
+    sync.add_argument(
+        "--background-sync",
+        help="Write uv.lock, then build .venv in a detached process",
+        action="store_const",
+        dest="sync",
+        const="background",
+    )
+
+    parser.add_argument(
+        "--resume",
+        help="Continue an interrupted run of project NAME",
+        metavar="NAME",
+        type=validate_project_name,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--timings",
+        help="Print a per-step timing breakdown at the end of the run",
+        action="store_true",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--trace",
+        help="Write the step timings as trace-event JSON to FILE",
+        metavar="FILE",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--events",
+        help=(
+            "Report progress as console output, a live view with an ETA "
+            "or NDJSON events on stdout"
+        ),
+        choices=["console", "live", "json"],
+        default="console",
+    )
+
+    args = parser.parse_args(argv)
 
     # --config mode: no project_name needed
     if args.config:
         return args
 
+    # --resume mode: the options come from the project's journal
+    if args.resume:
+        if args.project_name is not None:
+            parser.error("--resume takes the project name; do not repeat it")
+        return args
+
     # Normal mode: project_name is required
     if args.project_name is None:
         parser.error("project_name is required (or use --config NAME EMAIL)")
 
+    if args.members:
+        args.workspace = True
+        names = [name for name, _ in args.members]
+        if len(set(names)) != len(names):
+            parser.error("workspace member names must be unique")
+        if args.project_name in names:
+            parser.error("a workspace member cannot share the project name")
+
+    if args.events == "json" and args.timings:
+        parser.error("--timings prints a table; use --trace FILE instead")
+    if args.events != "console" and args.workspace and not args.members:
+        parser.error(
+            f"--events {args.events} cannot prompt for workspace members; "
+            "pass them with --member"
+        )
+
     # Validate that --private is only used with --github
     if args.private and not args.github:
         parser.error("--private can only be used with --github")
@@ -188,3 +450,113 @@ def validate_project_name(name: str) -> str:
             "Project name cannot contain spaces or under-scores"
         )
     return name
+
+
+def parse_member(value: str) -> tuple[str, str]:
+    """Split ``NAME[:lib|app]`` into the member name and kind."""
+    name, _, kind = value.partition(":")
+    kind = kind or "lib"
+    if not name:
+        raise argparse.ArgumentTypeError("Member name cannot be empty")
+    if kind not in ("lib", "app"):
+        raise argparse.ArgumentTypeError(
+            f"Member type must be lib or app, got '{kind}'"
+        )
+    return validate_project_name(name), kind
+
+
+def parse_warm_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of ``uv-start warm``."""
+    parser = WarmArgumentParser(
+        prog="uv-start warm",
+        description=(
+            "Pre-populate the uv and pre-commit caches so later project "
+            "creation works from cache"
+        ),
+        usage="uv-start warm [-p VERSION ...] [--no-data] [--no-hooks]",
+        epilog="Thanks for using uv_start!",
+    )
+
+    parser.add_argument(
+        "-p",
+        "--python",
+        help="Interpreter to warm (repeatable, default: all)",
+        action="append",
+        choices=PYTHON_VERSIONS,
+        dest="pythons",
+    )
+
+    parser.add_argument(
+        "--no-data",
+        help="Skip the data analysis stack",
+        action="store_false",
+        dest="data",
+    )
+
+    parser.add_argument(
+        "--no-hooks",
+        help="Skip building pre-commit hook environments",
+        action="store_false",
+        dest="hooks",
+    )
+
+    args = parser.parse_args(argv)
+    if not args.pythons:
+        args.pythons = list(PYTHON_VERSIONS)
+    return args
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def parse_batch_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of ``uv-start batch``."""
+    parser = BatchArgumentParser(
+        prog="uv-start batch",
+        description="Create every project listed in a TOML manifest",
+        usage="uv-start batch MANIFEST [-j N]",
+        epilog="Thanks for using uv_start!",
+    )
+
+    parser.add_argument(
+        "manifest",
+        help="TOML file listing the projects to create",
+        type=Path,
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of projects to create at the same time",
+        type=positive_int,
+        default=DEFAULT_JOBS,
+    )
+
+    return parser.parse_args(argv)
+
+
+def parse_stats_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the arguments of ``uv-start stats``."""
+    parser = StatsArgumentParser(
+        prog="uv-start stats",
+        description=(
+            "Summarise the run history: step timings, run timings per "
+            "project type and regressions since the last upgrade"
+        ),
+        usage="uv-start stats [--last N]",
+        epilog="Thanks for using uv_start!",
+    )
+
+    parser.add_argument(
+        "--last",
+        help="Only use the N most recent runs",
+        metavar="N",
+        type=positive_int,
+        default=None,
+    )
+
+    return parser.parse_args(argv)
@@ -2,17 +2,44 @@
 
 Provides a fallback chain for author info: config file -> git config -> defaults.
 Config is stored at ~/.config/uv-start/config.toml.
+
+Besides ``[user]``, the config file may contain an ``[env]`` section with
+extra environment variables to pass to subprocesses and a ``[uv]`` section
+with package index and cache settings::
+
+    [uv]
+    index_url = "https://pypi.mirror.example/simple"
+    extra_index_urls = ["https://wheels.example/simple"]
+    cache_dir = "/shared/uv-cache"
+    link_mode = "hardlink"
+
+and a ``[network]`` section with the timeout and retries of network-bound
+commands (``uv lock``/``uv sync``, ``uv init``, ``git push``)::
+
+    [network]
+    timeout = 300      # seconds per attempt (default: the command's own)
+    retries = 2        # extra attempts after a network error or timeout
+    backoff = 1.0      # base delay, doubled per retry, with jitter
+    max_backoff = 30.0
 """
 
+import functools
 import os
-import subprocess
+import re
 import tomllib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
 
 from rich import print as rprint
 from rich.panel import Panel
 
+from uv_start.exceptions import ConfigError
+
+if TYPE_CHECKING:
+    from uv_start.runner import RetryPolicy
+
 CONFIG_DIR = Path.home() / ".config" / "uv-start"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
@@ -38,13 +65,173 @@ _ENV_ALLOWLIST = {
 }
 
 
+# uv settings that only affect speed, caching and where packages come
+# from. Passing them through lets shared caches and local mirrors work
+# inside uv-start.
+_UV_PERFORMANCE_ENV = {
+    "UV_CACHE_DIR",
+    "UV_LINK_MODE",
+    "UV_CONCURRENT_DOWNLOADS",
+    "UV_CONCURRENT_INSTALLS",
+    "UV_CONCURRENT_BUILDS",
+    "UV_INDEX_URL",
+    "UV_EXTRA_INDEX_URL",
+    "UV_DEFAULT_INDEX",
+    "UV_INDEX",
+    "UV_FIND_LINKS",
+    "UV_OFFLINE",
+    "UV_HTTP_TIMEOUT",
+    "UV_PYTHON_INSTALL_DIR",
+    "UV_PYTHON_DOWNLOADS",
+    "UV_PYTHON_PREFERENCE",
+}
+
+# Variables whose name contains one of these are never passed through,
+# even when listed in the config file.
+_SECRET_MARKERS = ("TOKEN", "SECRET", "PASSWORD", "CREDENTIAL", "AUTH", "KEY")
+
+# Except the credentials of a named package index, which uv reads from
+# the environment so they never have to be written into pyproject.toml
+_INDEX_CREDENTIALS = re.compile(r"UV_INDEX_[A-Z0-9_]+_(USERNAME|PASSWORD)")
+
+
 def clean_env() -> dict[str, str]:
     """Return a minimal environment safe for uv/git subprocesses.
 
-    Only passes through variables needed for process execution, explicitly
-    excluding secrets and tokens that may be exported in the shell session.
+    Only passes through variables needed for process execution, the uv
+    performance settings in ``_UV_PERFORMANCE_ENV`` and any extra names
+    listed under ``[env] passthrough`` in the config file. Secrets and
+    tokens that may be exported in the shell session are always excluded,
+    apart from the ``UV_INDEX_<NAME>_USERNAME``/``_PASSWORD`` credentials
+    of package indexes. The config file is read once per run (see
+    :func:`reload_config`).
+    """
+    allowed = _ENV_ALLOWLIST | _UV_PERFORMANCE_ENV | _extra_passthrough()
+    env = {
+        k: v
+        for k, v in os.environ.items()
+        if (k in allowed and not _is_secret(k))
+        or _INDEX_CREDENTIALS.fullmatch(k)
+    }
+    # [uv] settings apply unless the shell overrides them
+    for key, value in load_uv_settings().env().items():
+        env.setdefault(key, value)
+    return env
+
+
+def _extra_passthrough() -> set[str]:
+    """Read additional variable names from ``[env] passthrough``."""
+    names = _read_config_file().get("env", {}).get("passthrough", [])
+    return {name for name in names if isinstance(name, str)}
+
+
+def _is_secret(name: str) -> bool:
+    upper = name.upper()
+    return any(marker in upper for marker in _SECRET_MARKERS)
+
+
+@functools.cache
+def _read_config_file() -> dict:
+    """Return the parsed config file, or an empty dict if there is none.
+
+    Every subprocess asks for :func:`clean_env`, so the file is parsed
+    once and kept until :func:`reload_config`. Do not modify the result.
     """
-    return {k: v for k, v in os.environ.items() if k in _ENV_ALLOWLIST}
+    try:
+        with CONFIG_FILE.open("rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def reload_config() -> None:
+    """Forget the config read so far, e.g. after the file changed."""
+    _read_config_file.cache_clear()
+    get_user_config.cache_clear()
+
+
+_LINK_MODES = {"clone", "copy", "hardlink", "symlink"}
+
+
+def without_credentials(url: str) -> str:
+    """Return ``url`` without its ``user:password@`` part, if any."""
+    parts = urlsplit(url)
+    if parts.username is None and parts.password is None:
+        return url
+    host = parts.netloc.rpartition("@")[2]
+    return urlunsplit(parts._replace(netloc=host))
+
+
+@dataclass
+class UvSettings:
+    """Package index and cache settings from the ``[uv]`` section."""
+
+    index_url: str | None = None
+    extra_index_urls: list[str] = field(default_factory=list)
+    cache_dir: str | None = None
+    link_mode: str | None = None
+
+    def env(self) -> dict[str, str]:
+        """Translate the settings into uv environment variables."""
+        env = {}
+        if self.index_url:
+            env["UV_DEFAULT_INDEX"] = self.index_url
+        if self.extra_index_urls:
+            env["UV_INDEX"] = " ".join(self.extra_index_urls)
+        if self.cache_dir:
+            env["UV_CACHE_DIR"] = str(Path(self.cache_dir).expanduser())
+        if self.link_mode:
+            env["UV_LINK_MODE"] = self.link_mode
+        return env
+
+
+def load_uv_settings() -> UvSettings:
+    """Load the ``[uv]`` section of the config file."""
+    uv = _read_config_file().get("uv", {})
+    settings = UvSettings(
+        index_url=uv.get("index_url"),
+        extra_index_urls=list(uv.get("extra_index_urls", [])),
+        cache_dir=uv.get("cache_dir"),
+        link_mode=uv.get("link_mode"),
+    )
+    if settings.link_mode and settings.link_mode not in _LINK_MODES:
+        raise ConfigError(
+            f"Invalid [uv] link_mode '{settings.link_mode}' in {CONFIG_FILE}; "
+            f"expected one of: {', '.join(sorted(_LINK_MODES))}"
+        )
+    return settings
+
+
+def load_retry_policy() -> "RetryPolicy":
+    """Load the ``[network]`` section of the config file."""
+    from uv_start.runner import RetryPolicy
+
+    network = _read_config_file().get("network", {})
+    defaults = RetryPolicy()
+    try:
+        timeout = network.get("timeout")
+        policy = RetryPolicy(
+            timeout=None if timeout is None else float(timeout),
+            retries=int(network.get("retries", defaults.retries)),
+            backoff=float(network.get("backoff", defaults.backoff)),
+            max_backoff=float(
+                network.get("max_backoff", defaults.max_backoff)
+            ),
+        )
+    except (TypeError, ValueError) as e:
+        raise ConfigError(
+            f"Invalid [network] settings in {CONFIG_FILE}: {e}"
+        ) from e
+    if (
+        (policy.timeout is not None and policy.timeout <= 0)
+        or policy.retries < 0
+        or policy.backoff < 0
+    ):
+        raise ConfigError(
+            f"Invalid [network] settings in {CONFIG_FILE}: timeout must "
+            "be positive, retries and backoff must not be negative"
+        )
+    return policy
 
 
 @dataclass
@@ -58,18 +245,14 @@ class UserConfig:
 def load_config() -> UserConfig:
     """Load user config with fallback chain: config file -> git -> defaults."""
     # 1. Try config file
-    if CONFIG_FILE.exists():
-        with CONFIG_FILE.open("rb") as f:
-            data = tomllib.load(f)
-        user = data.get("user", {})
-        name = user.get("name")
-        email = user.get("email")
-        if name and email:
-            return UserConfig(author_name=name, author_email=email)
+    user = _read_config_file().get("user", {})
+    name = user.get("name")
+    email = user.get("email")
+    if name and email:
+        return UserConfig(author_name=name, author_email=email)
 
     # 2. Try git config
-    name = _git_config("user.name")
-    email = _git_config("user.email")
+    name, email = _git_identity()
     if name and email:
         return UserConfig(author_name=name, author_email=email)
 
@@ -80,26 +263,56 @@ def load_config() -> UserConfig:
     )
 
 
-def _git_config(key: str) -> str | None:
-    """Read a value from git global config."""
+@functools.cache
+def get_user_config() -> UserConfig:
+    """Return the author identity, resolved once per run.
+
+    Rendering a project needs the identity for every file it touches;
+    caching it keeps that to a single config read and git call.
+    """
+    return load_config()
+
+
+def _git_identity() -> tuple[str | None, str | None]:
+    """Read ``user.name`` and ``user.email`` from git global config.
+
+    Both keys are fetched with a single ``git config`` call.
+    """
+    from uv_start.runner import run_command
+
     try:
-        result = subprocess.run(
-            ["git", "config", "--global", key],
+        result = run_command(
+            [
+                "git",
+                "config",
+                "--global",
+                "--get-regexp",
+                r"^user\.(name|email)$",
+            ],
             capture_output=True,
-            text=True,
             check=False,
         )
-        value = result.stdout.strip()
-        return value if value else None
     except FileNotFoundError:
-        return None
+        return None, None
+    values: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip():
+            values[key.lower()] = value.strip()
+    return values.get("user.name"), values.get("user.email")
 
 
 def save_config(name: str, email: str) -> None:
-    """Write user config to ~/.config/uv-start/config.toml."""
+    """Write user config to ~/.config/uv-start/config.toml.
+
+    Other sections already in the file (``[env]``, ...) are preserved.
+    """
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     content = f'[user]\nname = "{name}"\nemail = "{email}"\n'
+    if CONFIG_FILE.exists():
+        content += _strip_table(CONFIG_FILE.read_text(), "user")
     CONFIG_FILE.write_text(content)
+    reload_config()
     rprint(
         Panel(
             f"[green]Configuration saved:[/green]\n"
@@ -110,3 +323,17 @@ def save_config(name: str, email: str) -> None:
             border_style="green",
         )
     )
+
+
+def _strip_table(text: str, table: str) -> str:
+    """Remove a top-level ``[table]`` and its keys from TOML text."""
+    kept: list[str] = []
+    skipping = False
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith("["):
+            skipping = stripped == f"[{table}]"
+        if not skipping:
+            kept.append(line)
+    rest = "".join(kept).strip("\n")
+    return f"\n{rest}\n" if rest else ""
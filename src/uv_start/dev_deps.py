@@ -1,146 +1,347 @@
+import json
+import re
 import subprocess
+import sys
+import time
+import tomllib
+from argparse import Namespace
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from rich import print as rprint
-
-from uv_start.config import clean_env
-from uv_start.exceptions import ConfigError, DependencyError
+from uv_start.config import (
+    UvSettings,
+    clean_env,
+    load_retry_policy,
+    load_uv_settings,
+    without_credentials,
+)
+from uv_start.exceptions import DependencyError
+from uv_start.journal import JOURNAL_DIR
+from uv_start.pyproject import merge, with_version_files
+from uv_start.reporting import report
+from uv_start.runner import run_command
+from uv_start.timings import span
+from uv_start.workspace import Member, Workspace, for_each
 
 TEMPLATE_DIR = Path(__file__).resolve().parent / "template"
 
+# Config templates merged into every pyproject.toml of a project
+SHARED_CONFIGS = ["ty-config.toml", "ruff-config.toml", "pytest-config.toml"]
+
+RUNTIME_DEPENDENCIES = ["python-dotenv"]
+DEV_DEPENDENCIES = ["ruff", "pytest", "ty", "commitizen", "pre-commit"]
+DATA_DEPENDENCIES = ["jupyter", "pandas", "matplotlib", "seaborn"]
+
+# Output of a background sync, next to the journal in the ignored
+# .uv-start/ directory
+SYNC_LOG = Path(JOURNAL_DIR) / "sync.log"
+
+# Run by a detached interpreter: the commands in argv[2], in order, until
+# one fails, appending their output to the log in argv[1]
+_RUN_IN_ORDER = """
+import json, shlex, subprocess, sys
+with open(sys.argv[1], "a") as log:
+    for command in json.loads(sys.argv[2]):
+        print("$", shlex.join(command), file=log, flush=True)
+        if subprocess.run(command, stdout=log, stderr=log).returncode:
+            print("uv-start: background sync failed", file=log)
+            sys.exit(1)
+    print("uv-start: environment ready", file=log)
+"""
+
+
+@dataclass
+class DependencyPlan:
+    """Runtime and dev requirements applied in one uv resolution."""
+
+    runtime: list[str] = field(default_factory=list)
+    dev: list[str] = field(default_factory=list)
+
+    def add_commands(self) -> list[list[str]]:
+        """Return the ``uv add`` calls that record the plan without locking."""
+        commands = []
+        if self.runtime:
+            commands.append(["uv", "add", "--frozen", *self.runtime])
+        if self.dev:
+            commands.append(["uv", "add", "--frozen", "--dev", *self.dev])
+        return commands
+
+    def bounded(self, locked: dict[str, str]) -> "DependencyPlan":
+        """Return the plan with each requirement at least its locked version.
+
+        That is the ``name>=version`` a resolving ``uv add`` writes.
+        Requirements that are not in ``locked`` stay as they are.
+        """
+
+        def bound(requirement: str) -> str:
+            version = locked.get(_normalise(requirement))
+            return f"{requirement}>={version}" if version else requirement
+
+        return DependencyPlan(
+            runtime=[bound(r) for r in self.runtime],
+            dev=[bound(r) for r in self.dev],
+        )
+
+
+def plan_dependencies(args: Namespace) -> DependencyPlan:
+    """Collect every requirement the chosen project type needs."""
+    if getattr(args, "data", False):
+        return DependencyPlan(runtime=list(DATA_DEPENDENCIES))
+    return DependencyPlan(
+        runtime=list(RUNTIME_DEPENDENCIES), dev=list(DEV_DEPENDENCIES)
+    )
+
+
+def install_dependencies(
+    plan: DependencyPlan, project_path: Path, sync: bool = True
+) -> float:
+    """Apply a dependency plan in a single resolve/lock/sync cycle.
 
-def add_dev_dependencies(project_name: str, project_path: Path) -> None:
-    """Add dev dependencies to the project"""
+    Requirements are first recorded in pyproject.toml with
+    ``uv add --frozen``, which neither resolves nor touches the lockfile.
+    A single ``uv sync`` then resolves, locks and installs everything.
+    With ``sync=False`` only ``uv lock`` runs; the environment is built
+    later by :func:`provision`. Finally the locked versions are written
+    back as lower bounds (see :meth:`DependencyPlan.bounded`), which only
+    updates the lockfile's metadata and works from uv's cache.
+
+    Returns:
+        float: Wall-clock seconds spent applying the plan.
+    """
+    start = time.perf_counter()
+    _add_index_config(project_path, load_uv_settings())
     try:
-        # Add python-dotenv as a regular dependency first
-        subprocess.run(
-            ["uv", "add", "python-dotenv"],
+        with span("install dependencies", "dev_deps"):
+            for command in plan.add_commands():
+                run_command(
+                    command,
+                    check=True,
+                    cwd=project_path,
+                    env=clean_env(),
+                )
+            run_command(
+                ["uv", "sync" if sync else "lock"],
+                check=True,
+                cwd=project_path,
+                env=clean_env(),
+                retry=load_retry_policy(),
+            )
+            _bound_requirements(plan, project_path)
+    except subprocess.SubprocessError as e:
+        raise DependencyError(f"Failed to install dependencies: {e}") from e
+    elapsed = time.perf_counter() - start
+    done = "locked and synced" if sync else "and locked"
+    report(f"[green]Dependencies resolved, {done} in {elapsed:.1f}s[/green]")
+    return elapsed
+
+
+def _bound_requirements(plan: DependencyPlan, project_path: Path) -> None:
+    bounded = plan.bounded(_locked_versions(project_path))
+    if bounded == plan:
+        return
+    for command in bounded.add_commands():
+        run_command(command, check=True, cwd=project_path, env=clean_env())
+    # The locked versions meet their own bounds, so nothing is resolved
+    # again unless uv's cache was cleared
+    offline = run_command(
+        ["uv", "lock", "--offline"],
+        capture_output=True,
+        cwd=project_path,
+        env=clean_env(),
+    )
+    if offline.returncode:
+        run_command(
+            ["uv", "lock"],
             check=True,
             cwd=project_path,
             env=clean_env(),
+            retry=load_retry_policy(),
         )
-        subprocess.run(
+
+
+def _locked_versions(project_path: Path) -> dict[str, str]:
+    """Return the version of every package in uv.lock by its name."""
+    try:
+        with (project_path / "uv.lock").open("rb") as f:
+            packages = tomllib.load(f).get("package", [])
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    return {
+        package["name"]: package["version"]
+        for package in packages
+        if "name" in package and "version" in package
+    }
+
+
+def _normalise(name: str) -> str:
+    """Return the PEP 503 form of a project name, as uv.lock uses it."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def provision(project_path: Path, hooks: bool = True) -> None:
+    """Build ``.venv`` from ``uv.lock`` and install the git hooks.
+
+    Must run where the project will live: virtual environments and git
+    hooks record absolute paths, so neither survives a move.
+    """
+    retry = load_retry_policy()
+    try:
+        with span("provision environment", "dev_deps"):
+            for command in _provision_commands(hooks):
+                run_command(
+                    command,
+                    check=True,
+                    cwd=project_path,
+                    env=clean_env(),
+                    # Only the download of the environment needs the network
+                    retry=retry if command[:2] == ["uv", "sync"] else None,
+                )
+    except subprocess.SubprocessError as e:
+        raise DependencyError(f"Failed to provision project: {e}") from e
+
+
+def provision_in_background(project_path: Path, hooks: bool = True) -> Path:
+    """Start :func:`provision` in a detached process and return its log.
+
+    The process outlives uv-start, so the command returns as soon as the
+    lockfile is written. Its output goes to ``.uv-start/sync.log``.
+
+    Raises:
+        DependencyError: If the process cannot be started.
+    """
+    log = project_path / SYNC_LOG
+    log.parent.mkdir(exist_ok=True)
+    # Create the log now, so the directory is not cleaned up as empty
+    log.touch()
+    try:
+        subprocess.Popen(
             [
-                "uv",
-                "add",
-                "--dev",
-                "ruff",
-                "pytest",
-                "ty",
-                "commitizen",
-                "pre-commit",
+                sys.executable,
+                "-c",
+                _RUN_IN_ORDER,
+                str(log),
+                json.dumps(_provision_commands(hooks)),
             ],
-            check=True,
             cwd=project_path,
             env=clean_env(),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
-        # Install pre-commit hooks
-        subprocess.run(
+    except OSError as e:
+        raise DependencyError(f"Failed to start background sync: {e}") from e
+    return log
+
+
+def _provision_commands(hooks: bool) -> list[list[str]]:
+    commands = [["uv", "sync", "--frozen"]]
+    if hooks:
+        commands.append(
             [
                 "uv",
                 "run",
+                "--frozen",
                 "pre-commit",
                 "install",
                 "--hook-type",
                 "pre-commit",
                 "--hook-type",
                 "commit-msg",
-            ],
-            check=True,
-            cwd=project_path,
-            env=clean_env(),
+            ]
         )
-        rprint(
-            "[green]Development dependencies and pre-commit hooks added successfully.[/green]"
+    return commands
+
+
+def _add_index_config(project_path: Path, settings: UvSettings) -> None:
+    """Record the configured package indexes in the new pyproject.toml.
+
+    The project then keeps resolving against the same mirror outside
+    uv-start. Cache dir and link mode are machine-specific and are only
+    applied through the environment. Credentials in a URL are left out,
+    since the project may be pushed; uv reads them from
+    ``UV_INDEX_<NAME>_USERNAME`` and ``UV_INDEX_<NAME>_PASSWORD``.
+    """
+    urls = [settings.index_url] if settings.index_url else []
+    urls += settings.extra_index_urls
+    if not urls:
+        return
+    blocks = []
+    if settings.index_url:
+        blocks.append(_index_block("mirror", settings.index_url, default=True))
+    blocks += [
+        _index_block(f"extra-{i}", url)
+        for i, url in enumerate(settings.extra_index_urls, start=1)
+    ]
+    merge(project_path / "pyproject.toml", ["\n".join(blocks)])
+
+
+def _index_block(name: str, url: str, default: bool = False) -> str:
+    public = without_credentials(url)
+    if public != url:
+        variable = f"UV_INDEX_{name.upper().replace('-', '_')}"
+        report(
+            f"[yellow]Left the credentials of {public} out of "
+            f"pyproject.toml; set {variable}_USERNAME and "
+            f"{variable}_PASSWORD to use it outside uv-start[/yellow]"
         )
-    except subprocess.CalledProcessError as e:
-        raise DependencyError(
-            f"Failed to add development dependencies: {e}"
-        ) from e
+    block = f"[[tool.uv.index]]\nname = {json.dumps(name)}\nurl = {json.dumps(public)}\n"
+    if default:
+        block += "default = true\n"
+    return block
 
 
-def parse_dev_configs(project_path: Path) -> None:
+def parse_dev_configs(
+    project_path: Path, workspace: Workspace | None = None
+) -> None:
     """Parse dev configs from the project directory.
 
-    Shared configs (ruff, ty, pytest) are appended to all pyproject.toml
-    files. Commitizen config is only added to the root pyproject.toml
-    with version_files covering all sub-packages for synchronized
-    versioning.
+    Shared configs (ruff, ty, pytest) are merged into all pyproject.toml
+    files, one thread per file. Commitizen config is only added to the
+    root pyproject.toml with version_files covering all sub-packages for
+    synchronized versioning. Each file is parsed and written once, and
+    sections that already exist are left alone.
     """
-    config_dir = TEMPLATE_DIR
-    shared_config_files = [
-        config_dir / "ty-config.toml",
-        config_dir / "ruff-config.toml",
-        config_dir / "pytest-config.toml",
+    workspace = workspace or Workspace.scan(project_path)
+    # Read the fragments once for every pyproject.toml
+    shared = _read_fragments(SHARED_CONFIGS)
+    root = shared + [
+        with_version_files(cz, _member_version_files(workspace.members))
+        for cz in _read_fragments(["commitizen-config.toml"])
     ]
-    packages = (
-        [
-            package
-            for package in (project_path / "packages").iterdir()
-            if package.is_dir()
-        ]
-        if (project_path / "packages").exists()
-        else []
+    root_pyproject = project_path / "pyproject.toml"
+
+    for_each(
+        lambda pyproject: merge(
+            pyproject, root if pyproject == root_pyproject else shared
+        ),
+        workspace.pyprojects,
     )
-    pyproject_toml_list = [project_path / "pyproject.toml"] + [
-        package / "pyproject.toml" for package in packages
+    report("[green]Added config files to pyproject[/green]")
+
+
+def _read_fragments(names: list[str]) -> list[str]:
+    """Read the config templates that exist."""
+    return [
+        (TEMPLATE_DIR / name).read_text()
+        for name in names
+        if (TEMPLATE_DIR / name).exists()
     ]
 
-    try:
-        # Append shared configs to ALL pyproject.toml files
-        for pyproject_toml in pyproject_toml_list:
-            with pyproject_toml.open("a") as pyproject_file:
-                for config_file in shared_config_files:
-                    if config_file.exists():
-                        with config_file.open("r") as cf:
-                            pyproject_file.write(f"\n{cf.read()}\n")
-
-        # Append commitizen config ONLY to root pyproject.toml
-        cz_config = config_dir / "commitizen-config.toml"
-        if cz_config.exists():
-            with (
-                (project_path / "pyproject.toml").open("a") as f,
-                cz_config.open("r") as cf,
-            ):
-                f.write(f"\n{cf.read()}\n")
-
-            # Add sub-package version_files for synchronized versioning
-            if packages:
-                _add_workspace_version_files(project_path, packages)
-
-        rprint("[green]Added config files to pyproject[/green]")
-
-    except FileNotFoundError as e:
-        raise ConfigError(f"pyproject.toml not found: {e}") from e
-
-
-def _add_workspace_version_files(
-    project_path: Path, packages: list[Path]
-) -> None:
-    """Add sub-package paths to the root commitizen version_files.
+
+def _member_version_files(members: Iterable[Member]) -> list[str]:
+    """Return the commitizen version_files of the workspace members.
 
     This ensures a single ``cz bump`` at the root updates version
     strings in all sub-packages.
     """
-    root_pyproject = project_path / "pyproject.toml"
-    content = root_pyproject.read_text()
-
-    extra_entries = ""
-    for package in packages:
-        pkg_module = package.name.replace("-", "_")
-        rel = f"packages/{package.name}"
-        extra_entries += (
-            f'    "{rel}/src/{pkg_module}/__init__.py:__version__",\n'
-            f'    "{rel}/pyproject.toml:version",\n'
-            f'    "{rel}/README.md:version-[0-9]+\\\\.[0-9]+\\\\.[0-9]+",\n'
-        )
-
-    # Insert extra entries before the closing ] of version_files
-    content = content.replace(
-        '    "README.md:version-[0-9]+\\\\.[0-9]+\\\\.[0-9]+"\n]',
-        '    "README.md:version-[0-9]+\\\\.[0-9]+\\\\.[0-9]+",\n'
-        + extra_entries.rstrip(",\n")
-        + "\n]",
-    )
-
-    root_pyproject.write_text(content)
+    entries = []
+    for member in members:
+        rel = f"packages/{member.name}"
+        entries += [
+            f"{rel}/src/{member.module_name}/__init__.py:__version__",
+            f"{rel}/pyproject.toml:version",
+            f"{rel}/README.md:version-[0-9]+\\.[0-9]+\\.[0-9]+",
+        ]
+    return entries
@@ -5,6 +5,10 @@ class UvInitError(Exception):
     """Base exception for uv-start errors."""
 
 
+class PreflightError(UvInitError):
+    """The environment cannot create the project (checked up front)."""
+
+
 class ProjectCreationError(UvInitError):
     """Failed during project scaffolding (uv init, workspace setup)."""
 
@@ -0,0 +1,320 @@
+"""Keep a history of runs and summarise it for ``uv-start stats``.
+
+Every project creation, from the command line or the library API,
+appends one JSON line to :data:`HISTORY_FILE` with the options, the
+outcome, the uv-start and uv versions and the duration of every phase and
+step. ``uv-start stats`` turns the history into p50/p95 tables per step
+and per project type, and compares the runs of the newest uv-start/uv
+versions with the versions before them, so it shows when a template,
+dependency or tool upgrade made scaffolding slower. :func:`estimate`
+gives the live progress view (``--events live``) its expected timings.
+
+Recording never fails a run; delete the file to start over.
+"""
+
+import json
+import math
+import time
+from argparse import Namespace
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+from uv_start import __version__
+from uv_start.config import CONFIG_DIR
+from uv_start.exceptions import UvInitError
+from uv_start.timings import Span, step_durations
+
+HISTORY_FILE = CONFIG_DIR / "history.jsonl"
+
+# Options stored with every run
+RECORDED_OPTIONS = (
+    "type",
+    "python",
+    "workspace",
+    "github",
+    "private",
+    "data",
+    "cache",
+    "sync",
+)
+
+# A step counts as a regression when its median grew by this factor and
+# by at least this many seconds
+REGRESSION_RATIO = 1.25
+REGRESSION_MIN_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class Run:
+    """One recorded project creation."""
+
+    time: float
+    uv_start: str
+    uv: str | None
+    project_type: str
+    ok: bool
+    duration: float
+    steps: dict[str, float]
+    options: dict[str, Any] = field(default_factory=dict)
+    # The entries of ``steps`` that are phases, which run one after another
+    phases: list[str] = field(default_factory=list)
+    resumed: bool = False
+    error: str | None = None
+
+    @property
+    def versions(self) -> str:
+        """The uv-start and uv versions the run used."""
+        return f"uv-start {self.uv_start}, {self.uv or 'uv ?'}"
+
+
+def project_type(args: Namespace) -> str:
+    """Classify a run for the per-type statistics."""
+    if getattr(args, "data", False):
+        return "data"
+    if getattr(args, "workspace", False):
+        return "workspace"
+    return getattr(args, "type", "lib")
+
+
+def record_run(
+    args: Namespace,
+    spans: Iterable[Span],
+    duration: float,
+    *,
+    error: BaseException | None = None,
+    resumed: bool = False,
+) -> None:
+    """Append a run to the history, ignoring any failure to do so."""
+    spans = sorted(spans, key=lambda span: span.start)
+    run = Run(
+        time=time.time(),
+        uv_start=__version__,
+        uv=_uv_version(),
+        project_type=project_type(args),
+        ok=error is None,
+        duration=round(duration, 3),
+        steps={
+            name: round(seconds, 3)
+            for name, seconds in step_durations(spans).items()
+        },
+        phases=[span.name for span in spans if span.category == "phase"],
+        options={
+            option: getattr(args, option)
+            for option in RECORDED_OPTIONS
+            if hasattr(args, option)
+        },
+        resumed=resumed,
+        error=None if error is None else str(error) or type(error).__name__,
+    )
+    try:
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with HISTORY_FILE.open("a") as f:
+            f.write(json.dumps(run.__dict__) + "\n")
+    except OSError:
+        # The history is only a diagnostic aid
+        pass
+
+
+def load_runs(path: Path | None = None) -> list[Run]:
+    """Read the history, oldest first, skipping unreadable lines."""
+    path = path or HISTORY_FILE
+    try:
+        lines = path.read_text().splitlines()
+    except FileNotFoundError:
+        return []
+    runs = []
+    for line in lines:
+        try:
+            runs.append(Run(**json.loads(line)))
+        except (ValueError, TypeError):
+            continue
+    return runs
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the ``q`` quantile (0-1) of ``values``, interpolated."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q
+    low, high = math.floor(position), math.ceil(position)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Typical timings of earlier runs like the one about to start."""
+
+    runs: int
+    total: float | None
+    steps: dict[str, float]
+    phases: tuple[str, ...] = ()
+
+
+def estimate(args: Namespace, runs: list[Run] | None = None) -> Estimate:
+    """p50 timings of the complete, successful runs like ``args``.
+
+    Runs count when they created the same project type with the same
+    ``sync`` and ``cache`` options, which change the duration most.
+    """
+    like = [
+        run
+        for run in (load_runs() if runs is None else runs)
+        if run.ok
+        and not run.resumed
+        and run.project_type == project_type(args)
+        and run.options.get("sync", "full") == getattr(args, "sync", "full")
+        and run.options.get("cache", False) == getattr(args, "cache", False)
+    ]
+    if not like:
+        return Estimate(0, None, {})
+    return Estimate(
+        runs=len(like),
+        total=percentile([run.duration for run in like], 0.5),
+        steps={
+            step: percentile(values, 0.5)
+            for step, values in _step_samples(like).items()
+        },
+        phases=tuple(dict.fromkeys(p for run in like for p in run.phases)),
+    )
+
+
+def step_table(runs: list[Run]) -> Table:
+    """p50/p95 of every step over the complete, successful runs.
+
+    Resumed runs are left out, since they skip the steps an earlier
+    attempt finished.
+    """
+    table = _percentile_table("Step timings", "Step")
+    complete = (run for run in runs if run.ok and not run.resumed)
+    for step, values in _step_samples(complete).items():
+        _add_percentile_row(table, step, values)
+    return table
+
+
+def type_table(runs: list[Run]) -> Table:
+    """p50/p95 of the total duration of complete runs per project type."""
+    samples: dict[str, list[float]] = {}
+    failures = Counter(run.project_type for run in runs if not run.ok)
+    for run in runs:
+        if run.ok and not run.resumed:
+            samples.setdefault(run.project_type, []).append(run.duration)
+    table = _percentile_table("Run timings by project type", "Type")
+    table.add_column("Failed", justify="right")
+    for kind, values in sorted(samples.items()):
+        _add_percentile_row(table, kind, values, str(failures[kind]))
+    return table
+
+
+def regressions(
+    runs: list[Run],
+) -> tuple[str, str, list[tuple[str, str, float, float]]] | None:
+    """Compare the newest versions' runs with the versions before them.
+
+    Returns the previous and current version labels and the project type
+    and step of every step whose median slowed down by
+    :data:`REGRESSION_RATIO` and :data:`REGRESSION_MIN_SECONDS`, or None
+    without an upgrade to compare. Like :func:`estimate`, only complete,
+    successful runs count, and each project type is compared with itself,
+    so a change in the mix of project types is not a regression.
+    """
+    complete = [run for run in runs if run.ok and not run.resumed]
+    if not complete:
+        return None
+    current = complete[-1].versions
+    before = [run for run in complete if run.versions != current]
+    if not before:
+        return None
+    previous = before[-1].versions
+    slower = []
+    for kind in sorted({run.project_type for run in complete}):
+        old = _step_samples(
+            run
+            for run in complete
+            if run.versions == previous and run.project_type == kind
+        )
+        new = _step_samples(
+            run
+            for run in complete
+            if run.versions == current and run.project_type == kind
+        )
+        for step, values in new.items():
+            if step not in old:
+                continue
+            was, now = percentile(old[step], 0.5), percentile(values, 0.5)
+            if (
+                now >= was * REGRESSION_RATIO
+                and now - was >= REGRESSION_MIN_SECONDS
+            ):
+                slower.append((kind, step, was, now))
+    return previous, current, slower
+
+
+def regression_table(runs: list[Run]) -> Table | None:
+    """Render :func:`regressions`, or None without an upgrade."""
+    comparison = regressions(runs)
+    if comparison is None:
+        return None
+    previous, current, slower = comparison
+    table = Table(
+        title=f"Since {previous} → {current}",
+        title_justify="left",
+    )
+    table.add_column("Type", style="bold")
+    table.add_column("Step", style="bold")
+    table.add_column("p50 before (s)", justify="right")
+    table.add_column("p50 now (s)", justify="right")
+    table.add_column("Change", justify="right")
+    for kind, step, was, now in slower:
+        table.add_row(
+            kind,
+            step,
+            f"{was:.2f}",
+            f"{now:.2f}",
+            f"+{(now / was - 1) * 100:.0f}%" if was else "new",
+            style="red",
+        )
+    if not slower:
+        table.add_row("no regressions", "", "", "", "", style="green")
+    return table
+
+
+def _step_samples(runs: Iterable[Run]) -> dict[str, list[float]]:
+    samples: dict[str, list[float]] = {}
+    for run in runs:
+        for step, seconds in run.steps.items():
+            samples.setdefault(step, []).append(seconds)
+    return samples
+
+
+def _percentile_table(title: str, label: str) -> Table:
+    table = Table(title=title, title_justify="left")
+    table.add_column(label, style="bold")
+    table.add_column("Runs", justify="right")
+    table.add_column("p50 (s)", justify="right", style="green")
+    table.add_column("p95 (s)", justify="right", style="yellow")
+    return table
+
+
+def _add_percentile_row(
+    table: Table, label: str, values: list[float], *extra: str
+) -> None:
+    table.add_row(
+        label,
+        str(len(values)),
+        f"{percentile(values, 0.5):.2f}",
+        f"{percentile(values, 0.95):.2f}",
+        *extra,
+    )
+
+
+def _uv_version() -> str | None:
+    from uv_start.snapshot import uv_version
+
+    try:
+        return uv_version()
+    except UvInitError:
+        return None
@@ -0,0 +1,165 @@
+"""Discover the Python interpreters installed on this machine.
+
+``uv python list --only-installed`` takes a second or two, so its result
+is kept in ``~/.cache/uv-start/pythons.json`` for :data:`LISTING_TTL`
+seconds and in memory for the rest of the run. ``uv-start warm`` drops
+the listing after installing interpreters. ``uv-start --help`` shows a
+saved listing through :func:`listed_versions`, which never runs uv, so
+help stays fast on a cold cache.
+
+``--python auto`` uses :func:`resolve_python` to pick the newest
+installed version uv-start supports, so creating a project never waits
+for an interpreter download unless a version was asked for. It runs as
+one of the concurrent preflight checks (see ``preflight``), under their
+timeout, and a listing that fails is reported as such rather than as
+"no installed Python".
+"""
+
+import functools
+import json
+import os
+import time
+from pathlib import Path
+
+LISTING_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "uv-start"
+    / "pythons.json"
+)
+
+# Seconds a saved listing stays valid
+LISTING_TTL = 3600
+
+AUTO = "auto"
+
+
+@functools.cache
+def installed_versions(timeout: float | None = None) -> tuple[str, ...]:
+    """Return the installed CPython minor versions, newest first.
+
+    ``timeout`` limits ``uv python list`` instead of the default command
+    timeout.
+
+    Raises:
+        FileNotFoundError: If uv is not installed.
+        subprocess.SubprocessError: If uv fails or does not answer in
+            time.
+        ValueError: If uv's output is not the expected listing.
+    """
+    versions = _read_listing()
+    if versions is None:
+        versions = _list_installed(timeout)
+        if versions:
+            _write_listing(versions)
+    return versions
+
+
+def listed_versions() -> tuple[str, ...] | None:
+    """Return the saved installed versions, without running uv.
+
+    None means there is no fresh listing yet.
+    """
+    return _read_listing()
+
+
+def forget_installed() -> None:
+    """Drop the cached listing, e.g. after installing interpreters."""
+    installed_versions.cache_clear()
+    LISTING_FILE.unlink(missing_ok=True)
+
+
+def resolve_python(
+    requested: str, supported: list[str], timeout: float | None = None
+) -> str:
+    """Turn ``auto`` into the newest installed version in ``supported``.
+
+    ``timeout`` limits the listing (see :func:`installed_versions`).
+
+    Raises:
+        PreflightError: If ``auto`` was requested and none is installed,
+            or uv could not list the installed versions.
+        FileNotFoundError: If ``auto`` was requested and uv is not
+            installed.
+        subprocess.TimeoutExpired: If the listing took longer than
+            ``timeout``.
+    """
+    import subprocess
+
+    from uv_start.exceptions import PreflightError
+
+    if requested != AUTO:
+        return requested
+    try:
+        installed = installed_versions(timeout)
+    except subprocess.CalledProcessError as e:
+        raise PreflightError(
+            "--python auto could not list the installed Pythons: "
+            f"{(e.stderr or '').strip() or e}"
+        ) from e
+    except (ValueError, KeyError, TypeError) as e:
+        raise PreflightError(
+            "--python auto could not read the output of 'uv python list'"
+        ) from e
+    for version in supported:
+        if version in installed:
+            return version
+    raise PreflightError(
+        "--python auto found no installed Python among "
+        f"{', '.join(supported)}; pass --python VERSION to let uv "
+        "download one"
+    )
+
+
+def _list_installed(timeout: float | None) -> tuple[str, ...]:
+    from uv_start.config import clean_env
+    from uv_start.runner import run_command
+
+    limit = {} if timeout is None else {"timeout": timeout}
+    result = run_command(
+        [
+            "uv",
+            "python",
+            "list",
+            "--only-installed",
+            "--output-format",
+            "json",
+        ],
+        capture_output=True,
+        check=True,
+        env=clean_env(),
+        **limit,
+    )
+    entries = json.loads(result.stdout)
+    minors = {
+        (entry["version_parts"]["major"], entry["version_parts"]["minor"])
+        for entry in entries
+        if entry.get("implementation") == "cpython"
+        and entry.get("variant", "default") == "default"
+    }
+    return tuple(
+        f"{major}.{minor}" for major, minor in sorted(minors, reverse=True)
+    )
+
+
+def _read_listing() -> tuple[str, ...] | None:
+    """Return the saved listing, or None if it is missing or stale."""
+    try:
+        data = json.loads(LISTING_FILE.read_text())
+        if time.time() - data["created"] > LISTING_TTL:
+            return None
+        return tuple(data["versions"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_listing(versions: tuple[str, ...]) -> None:
+    try:
+        LISTING_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = LISTING_FILE.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"created": time.time(), "versions": list(versions)})
+        )
+        tmp.replace(LISTING_FILE)
+    except OSError:
+        # The listing is only an optimisation
+        pass
@@ -0,0 +1,160 @@
+"""Record finished creation steps so a failed run can be resumed.
+
+The journal lives in ``<project>/.uv-start/journal.json`` (ignored by the
+template ``.gitignore``) and holds the project options plus the names of
+the steps that have completed. ``uv-start --resume NAME`` reloads it and
+skips those steps. Once every step has finished the journal is removed.
+"""
+
+import contextlib
+import json
+import threading
+from argparse import Namespace
+from collections.abc import Callable
+from pathlib import Path
+
+from uv_start.exceptions import ConfigError
+from uv_start.scheduler import Step
+from uv_start.staging import STAGING_MARKER
+
+JOURNAL_DIR = ".uv-start"
+JOURNAL_FILE = "journal.json"
+
+# Options that define the project; everything else belongs to one run
+PROJECT_OPTIONS = (
+    "project_name",
+    "type",
+    "python",
+    "workspace",
+    "members",
+    "github",
+    "private",
+    "data",
+    "cache",
+    "sync",
+)
+
+# Steps whose loss makes a rollback expensive; once one has finished a
+# failed project is kept for --resume instead of being discarded
+EXPENSIVE_STEPS = ("dependencies", "snapshot")
+
+
+class Journal:
+    """The completed steps of one project, saved after every step.
+
+    ``resumed`` is set on journals loaded from an earlier run, whose
+    unfinished steps may have done part of their work.
+    """
+
+    def __init__(
+        self,
+        project_path: Path,
+        args: Namespace,
+        completed: list[str] | None = None,
+        resumed: bool = False,
+    ) -> None:
+        self.project_path = project_path
+        self.args = args
+        self.completed = list(completed or [])
+        self.resumed = resumed
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self.project_path / JOURNAL_DIR / JOURNAL_FILE
+
+    def done(self, step: str) -> bool:
+        return step in self.completed
+
+    def record(self, step: str) -> None:
+        """Mark ``step`` as finished and save the journal."""
+        with self._lock:
+            if step not in self.completed:
+                self.completed.append(step)
+            self._save()
+
+    def run(self, step: str, func: Callable[[], None]) -> None:
+        """Run ``func`` unless ``step`` already finished, then record it."""
+        if self.done(step):
+            return
+        func()
+        self.record(step)
+
+    def wrap(self, steps: list[Step]) -> list[Step]:
+        """Return steps that skip finished work and record new progress."""
+        return [
+            Step(
+                step.name,
+                (lambda step=step: self.run(step.name, step.func)),
+                step.depends_on,
+            )
+            for step in steps
+        ]
+
+    def worth_keeping(self) -> bool:
+        """Whether a failed project holds work that is slow to redo."""
+        return any(self.done(step) for step in EXPENSIVE_STEPS)
+
+    def remove(self) -> None:
+        """Delete the journal once the project is complete.
+
+        The directory is kept while it holds anything else, such as the
+        log of a background sync.
+        """
+        self.path.unlink(missing_ok=True)
+        with contextlib.suppress(OSError):
+            self.path.parent.rmdir()
+
+    def _save(self) -> None:
+        options = {
+            key: getattr(self.args, key)
+            for key in PROJECT_OPTIONS
+            if hasattr(self.args, key)
+        }
+        self.path.parent.mkdir(exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {"args": options, "completed": self.completed}, indent=2
+            )
+        )
+        tmp.replace(self.path)
+
+    @classmethod
+    def load(cls, project_path: Path) -> "Journal":
+        """Read the journal of ``project_path``.
+
+        Raises:
+            ConfigError: If there is no readable journal.
+        """
+        path = project_path / JOURNAL_DIR / JOURNAL_FILE
+        try:
+            data = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise ConfigError(f"No usable journal at {path}: {e}") from e
+        args = Namespace(**data["args"])
+        if getattr(args, "members", None):
+            args.members = [tuple(member) for member in args.members]
+        return cls(project_path, args, data["completed"], resumed=True)
+
+
+def find_journal(original_cwd: Path, project_name: str) -> Journal:
+    """Locate the journal of an unfinished project.
+
+    Looks in the project directory first, then in staging directories
+    left by a run that failed before the project was moved into place.
+
+    Raises:
+        ConfigError: If there is nothing to resume.
+    """
+    staged = sorted(
+        original_cwd.glob(f".{project_name}{STAGING_MARKER}*/{project_name}"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for project_path in [original_cwd / project_name, *staged]:
+        if (project_path / JOURNAL_DIR / JOURNAL_FILE).exists():
+            return Journal.load(project_path)
+    raise ConfigError(
+        f"Nothing to resume for '{project_name}' in {original_cwd}"
+    )
@@ -0,0 +1,291 @@
+"""Live progress view for ``--events live``.
+
+:class:`LiveReporter` redraws a list of the run's phases and steps while
+they run. Each step shows its duration next to the p50 of earlier runs
+(see :func:`uv_start.history.estimate`). The output of its commands
+goes into a pane under the step: expanded with the latest lines while
+the step runs, collapsed to a line count once it finishes and left
+expanded when it fails. A progress bar at the bottom shows the expected
+time left: the p50 of each phase still to come plus what is left of the
+running phase's p50. Phases run one after another, unlike the steps
+inside them, so finished phases no longer count however long they took.
+Once the run is over it shows the total time against the p50 instead.
+Status lines and retry notices are printed above the view.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+from rich.console import Console, Group, RenderableType
+from rich.live import Live
+from rich.panel import Panel
+from rich.progress_bar import ProgressBar
+from rich.spinner import Spinner
+from rich.table import Table
+from rich.text import Text
+
+from uv_start.history import Estimate
+from uv_start.reporting import Reporter
+from uv_start.timings import current_span
+
+# Output lines shown in the pane of a running or failed step
+OUTPUT_TAIL = 6
+
+# Span kinds that get a row of their own (see ``LiveReporter._is_row``)
+_ROW_KINDS = ("phase", "step")
+
+
+@dataclass
+class _Row:
+    name: str
+    indent: bool
+    started: float | None = None
+    duration: float | None = None
+    failed: bool = False
+    lines: int = 0
+    tail: deque[Text] = field(
+        default_factory=lambda: deque(maxlen=OUTPUT_TAIL)
+    )
+
+
+class LiveReporter(Reporter):
+    """Show the steps of a run as they progress, with an ETA.
+
+    Use it as a context manager around the run::
+
+        with LiveReporter(estimate(args)) as reporter:
+            create_from_args(args, reporter=reporter)
+    """
+
+    def __init__(
+        self, expected: Estimate, console: Console | None = None
+    ) -> None:
+        self._expected = expected
+        self._console = console or Console(highlight=False)
+        self._rows: dict[str, _Row] = {}
+        self._spans: dict[str, tuple[str, str | None]] = {}
+        self._start = time.monotonic()
+        self._end: float | None = None
+        self._lock = threading.Lock()
+        self._spinner = Spinner("dots", style="cyan")
+        self._live = Live(
+            console=self._console,
+            get_renderable=self._render,
+            refresh_per_second=8,
+            redirect_stdout=False,
+            redirect_stderr=False,
+        )
+        # Steps seen in earlier runs are listed before they start
+        for step in expected.steps:
+            self._rows[step] = _Row(step, indent=False)
+
+    def __enter__(self) -> "LiveReporter":
+        self._start = time.monotonic()
+        self._end = None
+        self._live.start(refresh=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        with self._lock:
+            self._rows = {
+                name: row for name, row in self._rows.items() if row.started
+            }
+        self._end = time.monotonic()
+        self._live.stop()
+        if not self._console.is_terminal:
+            # Only a terminal gets a newline after the last render
+            self._console.line()
+
+    def message(self, text: str) -> None:
+        self._live.console.print(text)
+
+    def notice(self, text: str, style: str) -> None:
+        self._live.console.print(Text(text, style=style))
+
+    def output(self, line: str, label: str | None, stderr: bool) -> None:
+        text = Text(line, style="red" if stderr else "dim")
+        if label:
+            text = Text.assemble((f"{label} | ", "dim"), text)
+        with self._lock:
+            row = self._row_of(current_span())
+            if row is not None:
+                row.lines += 1
+                row.tail.append(text)
+
+    def started(self, name: str, kind: str, details: dict[str, Any]) -> None:
+        parent = details.get("parent")
+        with self._lock:
+            self._spans[name] = (kind, parent)
+            if self._is_row(name):
+                row = self._rows.get(name) or _Row(name, indent=False)
+                row.indent = parent is not None
+                row.started = time.monotonic()
+                row.duration = None
+                # Started rows keep their start order; pending ones follow
+                self._rows.pop(name, None)
+                self._rows = {
+                    **{n: r for n, r in self._rows.items() if r.started},
+                    name: row,
+                    **{n: r for n, r in self._rows.items() if not r.started},
+                }
+
+    def finished(
+        self,
+        name: str,
+        kind: str,
+        details: dict[str, Any],
+        duration: float,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            row = self._rows.get(name)
+            if row is not None and row.started is not None:
+                row.duration = duration
+                row.failed = error is not None
+
+    def _is_row(self, name: str) -> bool:
+        """Phases and the spans directly inside a phase get a row."""
+        kind, parent = self._spans[name]
+        if kind == "subprocess":
+            return False
+        if parent is None:
+            return kind in _ROW_KINDS
+        return self._spans.get(parent, ("", None))[0] == "phase"
+
+    def _row_of(self, name: str | None) -> _Row | None:
+        """Return the row of the span ``name`` or of its nearest ancestor."""
+        while name is not None:
+            row = self._rows.get(name)
+            if row is not None and row.started is not None:
+                return row
+            name = self._spans.get(name, ("", None))[1]
+        return None
+
+    def _render(self) -> RenderableType:
+        with self._lock:
+            rows = list(self._rows.values())
+            parts: list[RenderableType] = [
+                self._render_row(row) for row in rows
+            ]
+        parts.append(self._render_eta())
+        return Group(*parts)
+
+    def _render_row(self, row: _Row) -> RenderableType:
+        expected = self._expected.steps.get(row.name)
+        line = Table.grid(padding=(0, 1))
+        line.add_column(width=1)
+        line.add_column()
+        line.add_column()
+        typical = f" (usually {expected:.1f}s)" if expected else ""
+        if row.started is None:
+            status: RenderableType = Text("·", style="dim")
+            timing = Text(typical.strip(), style="dim")
+            name = Text(row.name, style="dim")
+        elif row.duration is None:
+            status = self._spinner
+            elapsed = time.monotonic() - row.started
+            timing = Text(f"{elapsed:.1f}s{typical}")
+            name = Text(row.name, style="bold")
+        else:
+            status = Text("✗", "red") if row.failed else Text("✓", "green")
+            folded = f" · {row.lines} lines" if row.lines else ""
+            timing = Text(f"{row.duration:.2f}s{folded}", style="dim")
+            name = Text(row.name)
+        if row.indent:
+            name = Text.assemble("  ", name)
+        line.add_row(status, name, timing)
+
+        expanded = row.started is not None and (
+            row.duration is None or row.failed
+        )
+        if not expanded or not row.tail:
+            return line
+        pane = Panel(
+            Group(*row.tail),
+            border_style="red" if row.failed else "dim",
+            title_align="left",
+            title=(
+                f"last {len(row.tail)} of {row.lines} lines"
+                if row.lines > len(row.tail)
+                else None
+            ),
+            padding=(0, 1),
+        )
+        indented = Table.grid(padding=(0, 0, 0, 4 if row.indent else 2))
+        indented.add_row(pane)
+        return Group(line, indented)
+
+    def _remaining(self, now: float) -> float | None:
+        """Seconds the unfinished phases usually take from ``now`` on.
+
+        None if the earlier runs did not record their phases.
+        """
+        left = 0.0
+        with self._lock:
+            for phase in self._expected.phases:
+                expected = self._expected.steps.get(phase)
+                row = self._rows.get(phase)
+                if expected is None or row is None:
+                    continue
+                if row.started is None:
+                    left += expected
+                elif row.duration is None:
+                    left += max(0.0, expected - (now - row.started))
+        return left if self._expected.phases else None
+
+    def _is_done(self) -> bool:
+        """Whether the run is over or every expected phase has finished."""
+        if self._end is not None:
+            return True
+        with self._lock:
+            rows = [self._rows.get(phase) for phase in self._expected.phases]
+        return bool(rows) and all(
+            row is not None and row.duration is not None for row in rows
+        )
+
+    def _render_eta(self) -> RenderableType:
+        now = time.monotonic() if self._end is None else self._end
+        elapsed = now - self._start
+        total = self._expected.total
+        done = self._is_done()
+        if total is None:
+            if done:
+                status = f"done in {elapsed:.1f}s"
+            else:
+                status = f"{elapsed:.1f}s elapsed"
+            return Text(
+                f"{status} · no earlier runs like this one to estimate from",
+                style="dim",
+            )
+        if done:
+            remaining = 0.0
+            pace = "faster" if elapsed <= total else "slower"
+            eta = f"done in {elapsed:.1f}s, {pace} than usual"
+        else:
+            left = self._remaining(now)
+            remaining = max(0.0, total - elapsed) if left is None else left
+            if remaining > 0:
+                eta = f"{elapsed:.1f}s · about {remaining:.0f}s left"
+            else:
+                eta = f"{elapsed:.1f}s · taking longer than usual"
+        footer = Table.grid(padding=(0, 1))
+        footer.add_row(
+            ProgressBar(
+                total=elapsed + remaining, completed=elapsed, width=30
+            ),
+            Text(
+                f"{eta} (p50 {total:.1f}s of "
+                f"{self._expected.runs} earlier runs)",
+                style="dim",
+            ),
+        )
+        return footer
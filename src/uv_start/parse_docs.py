@@ -7,24 +7,28 @@ import shutil
 from argparse import Namespace
 from pathlib import Path
 
-from rich import print as rprint
-
-from uv_start.config import load_config
+from uv_start.config import get_user_config
 from uv_start.exceptions import TemplateError
+from uv_start.render import Renderer, compile_renderer
+from uv_start.reporting import report
+from uv_start.timings import span
+from uv_start.workspace import Member, Workspace, for_each
 
 TEMPLATE_DIR = Path(__file__).resolve().parent / "template"
 
 
-def parse_docs(args: Namespace, project_dir: Path) -> None:
-    """Parse the README.md file and update the content with project information."""
-    for template in [
-        "README.md",
-        "LICENSE",
-        ".gitignore",
-        ".pre-commit-config.yaml",
-        ".env.example",
-    ]:
+def render_templates(
+    args: Namespace, project_dir: Path, workspace: Workspace | None = None
+) -> None:
+    """Copy and render every template that does not touch pyproject.toml.
+
+    Safe to run while uv is still editing pyproject.toml.
+    """
+    workspace = workspace or Workspace.scan(project_dir)
+    for template in [".gitignore", ".pre-commit-config.yaml", ".env.example"]:
         _copy_template(template, project_dir)
+    _render_template(args, "README.md", workspace.files("README.md"))
+    _render_template(args, "LICENSE", [project_dir / "LICENSE"])
 
     # Copy config.py to src/project_name
     module_name = args.project_name.replace("-", "_")
@@ -36,11 +40,16 @@ def parse_docs(args: Namespace, project_dir: Path) -> None:
     _copy_template("settings.json", vs_code_dir)
     _copy_template("launch.json", vs_code_dir)
     if args.github:
-        _add_github_workflows(project_dir)
-        _update_content(project_dir, args, ".github/workflows/ci.yml")
-        _update_content(project_dir, args, ".github/workflows/release.yml")
-    _update_configs(project_dir, args)
-    _init_version(args, project_dir)
+        _add_github_workflows(args, project_dir)
+    _init_version(args, project_dir, workspace)
+
+
+def render_pyproject(
+    args: Namespace, project_dir: Path, workspace: Workspace | None = None
+) -> None:
+    """Fill the project placeholders in every pyproject.toml."""
+    workspace = workspace or Workspace.scan(project_dir)
+    _update_content(project_dir, args, "pyproject.toml", workspace)
 
 
 def parse_docs_data(args: Namespace, project_dir: Path) -> None:
@@ -49,32 +58,25 @@ def parse_docs_data(args: Namespace, project_dir: Path) -> None:
     Copies .gitignore, .env.example, the hhlab matplotlib style, and a
     starter sample.ipynb into the project root. No src/ structure is created.
     """
-    for template in [".gitignore", ".env.example", "README.md"]:
+    for template in [".gitignore", ".env.example"]:
         _copy_template(template, project_dir)
 
     _copy_template("hhlab_style01.mplstyle", project_dir)
     _copy_template("colors.py", project_dir)
-    _copy_template("sample.ipynb", project_dir)
+    _render_template(args, "README.md", [project_dir / "README.md"])
+    _render_template(args, "sample.ipynb", [project_dir / "sample.ipynb"])
 
     # CLAUDE.md is stored as data-CLAUDE.md in the template dir to avoid
     # conflicting with this project's own CLAUDE.md during development.
-    src = TEMPLATE_DIR / "data-CLAUDE.md"
-    dest = project_dir / "CLAUDE.md"
-    shutil.copy(src, dest)
-    rprint("[green]CLAUDE.md copied to project root[/green]")
-
-    _update_content(project_dir, args, "README.md")
-    _update_content(project_dir, args, "sample.ipynb")
-    _update_content(project_dir, args, "CLAUDE.md")
+    _render_template(args, "data-CLAUDE.md", [project_dir / "CLAUDE.md"])
+
     vs_code_dir = project_dir / ".vscode"
     vs_code_dir.mkdir(parents=True, exist_ok=True)
     _copy_template("settings.json", vs_code_dir)
     _copy_template("launch.json", vs_code_dir)
     if args.github:
-        _add_github_workflows(project_dir)
-        _update_content(project_dir, args, ".github/workflows/ci.yml")
-        _update_content(project_dir, args, ".github/workflows/release.yml")
-    rprint("[green]Data project template files copied successfully.[/green]")
+        _add_github_workflows(args, project_dir)
+    report("[green]Data project template files copied successfully.[/green]")
 
 
 def _copy_template(template: str, project_dir: Path) -> None:
@@ -82,26 +84,44 @@ def _copy_template(template: str, project_dir: Path) -> None:
     try:
         copy_path = TEMPLATE_DIR / template
         paste_path = project_dir / f"{template}"
-        shutil.copy(copy_path, paste_path)
-        rprint(f"[green]{template} copied to root project[/green]")
-        if template == "README.md" and (project_dir / "packages").exists():
-            for package in (project_dir / "packages").iterdir():
-                if package.is_dir():
-                    shutil.copy(copy_path, package)
-            rprint(f"[green]{template} successfully copied[/green]")
+        with span(f"copy {template}", "parse_docs"):
+            shutil.copy(copy_path, paste_path)
+            report(f"[green]{template} copied to root project[/green]")
     except FileNotFoundError as e:
         raise TemplateError(f"{template} template not found") from e
 
 
-def _update_configs(project_dir: Path, args: Namespace) -> None:
-    """Update the configuration files with project information."""
-    for template in ["README.md", "LICENSE", "pyproject.toml"]:
-        _update_content(project_dir, args, template)
+def _renderer(args: Namespace, content_path: Path) -> Renderer:
+    """Return the compiled renderer for a file's directory."""
+    replacements = _parse_replacement(args, content_path)
+    return compile_renderer(tuple(replacements.items()))
+
+
+def _render_template(
+    args: Namespace, template: str, destinations: list[Path]
+) -> None:
+    """Render a template straight from TEMPLATE_DIR into each destination.
+
+    The template is read once; every destination is written once, with
+    workspace members rendered concurrently.
+    """
+
+    def write(dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_text(_renderer(args, dest).render(text))
+
+    try:
+        with span(f"render {template}", "parse_docs"):
+            text = (TEMPLATE_DIR / template).read_text()
+            for_each(write, destinations)
+    except FileNotFoundError as e:
+        raise TemplateError(f"{template} template not found") from e
+    report(f"[green]{destinations[0].name} successfully rendered[/green]")
 
 
 def _parse_replacement(args: Namespace, content_path: Path) -> dict[str, str]:
     """Load replacements for the README.md files into dictionary."""
-    user_config = load_config()
+    user_config = get_user_config()
     AUTHOR_NAME = user_config.author_name
     AUTHOR_EMAIL = user_config.author_email
 
@@ -124,41 +144,27 @@ def _parse_replacement(args: Namespace, content_path: Path) -> dict[str, str]:
 
 
 def _update_content(
-    project_dir: Path, args: Namespace, content_type: str
+    project_dir: Path,
+    args: Namespace,
+    content_type: str,
+    workspace: Workspace | None = None,
 ) -> None:
-    """Update the content of a file with project information."""
+    """Render a file in the root and every member, in place."""
+    workspace = workspace or Workspace.scan(project_dir)
     try:
-        # Files that should only exist in root directory
-        root_only_files = [
-            "LICENSE",
-            ".github/workflows/ci.yml",
-            ".github/workflows/release.yml",
-        ]
-
-        content_path = [project_dir / content_type] + (
-            [
-                package / content_type
-                for package in (project_dir / "packages").iterdir()
-                if package.is_dir()
-            ]
-            if (project_dir / "packages").exists()
-            and content_type not in root_only_files
-            else []
-        )
-        for file in content_path:
-            replacements = _parse_replacement(args, file)
-            with file.open("r") as f:
-                content = f.read()
-            for old, new in replacements.items():
-                content = content.replace(old, new)
-            with file.open("w") as f:
-                f.write(content)
-        rprint(f"[green]{content_type} successfully updated[/green]")
+        with span(f"render {content_type}", "parse_docs"):
+            for_each(
+                lambda file: _renderer(args, file).render_file(file, file),
+                workspace.files(content_type),
+            )
+        report(f"[green]{content_type} successfully updated[/green]")
     except FileNotFoundError as e:
         raise TemplateError(f"Failed to update {content_type}: {e}") from e
 
 
-def _init_version(args: Namespace, project_dir: Path) -> None:
+def _init_version(
+    args: Namespace, project_dir: Path, workspace: Workspace
+) -> None:
     """Initialize the version file with imports and version."""
     try:
         package_name = args.project_name.replace("-", "_")
@@ -172,41 +178,26 @@ def _init_version(args: Namespace, project_dir: Path) -> None:
                 "# Initialize environment variables\n"
                 "set_env_vars()\n"
             )
-        rprint("[green]Root __init__.py initialized with config setup[/green]")
+        report("[green]Root __init__.py initialized with config setup[/green]")
 
         # Handle sub-packages (if workspace)
-        if (project_dir / "packages").exists():
-            for sub_package in (project_dir / "packages").iterdir():
-                if sub_package.is_dir():
-                    sub_package_name = sub_package.name.replace("-", "_")
-                    sub_init = (
-                        sub_package / f"src/{sub_package_name}/__init__.py"
-                    )
-                    with sub_init.open("w") as f:
-                        f.write('__version__ = "0.1.0"\n')
-                    rprint(
-                        f"[green]Version file initialized for {sub_package_name}[/green]"
-                    )
+        for_each(_init_member_version, list(workspace.members))
 
     except FileNotFoundError as e:
         raise TemplateError("Version file not found") from e
 
 
-def _add_github_workflows(project_dir: Path) -> None:
+def _init_member_version(member: Member) -> None:
+    """Write the version file of a workspace member."""
+    member.version_file.write_text('__version__ = "0.1.0"\n')
+    report(f"[green]Version file initialized for {member.module_name}[/green]")
+
+
+def _add_github_workflows(args: Namespace, project_dir: Path) -> None:
     """Add GitHub workflow configurations to the project."""
-    try:
-        # Create .github/workflows directory
-        workflows_dir = project_dir / ".github" / "workflows"
-        workflows_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy workflow files
-        for workflow in ["ci.yml", "release.yml"]:
-            source = TEMPLATE_DIR / ".github" / "workflows" / workflow
-            dest = workflows_dir / workflow
-            shutil.copy(source, dest)
-
-        rprint(
-            "[green]GitHub workflow configurations added successfully[/green]"
+    workflows_dir = project_dir / ".github" / "workflows"
+    for workflow in ["ci.yml", "release.yml"]:
+        _render_template(
+            args, f".github/workflows/{workflow}", [workflows_dir / workflow]
         )
-    except FileNotFoundError as e:
-        raise TemplateError(f"Failed to add GitHub workflows: {e}") from e
+    report("[green]GitHub workflow configurations added successfully[/green]")
@@ -0,0 +1,234 @@
+"""Create a project: preflight, build, move into place, provision, publish.
+
+Phase 1 builds the project in a staging directory and is rolled back on
+failure (or kept for ``--resume`` once the expensive steps are done).
+Phase 2 commits and publishes it. Everything here is imported only when
+a project is actually created, which keeps ``uv-start --help`` fast.
+"""
+
+from argparse import Namespace
+from pathlib import Path
+
+from uv_start.dev_deps import (
+    SYNC_LOG,
+    install_dependencies,
+    parse_dev_configs,
+    plan_dependencies,
+    provision,
+    provision_in_background,
+)
+from uv_start.journal import Journal
+from uv_start.parse_docs import (
+    parse_docs_data,
+    render_pyproject,
+    render_templates,
+)
+from uv_start.preflight import run_preflight
+from uv_start.reporting import report
+from uv_start.router import CommandDispatcher
+from uv_start.scheduler import Step, run_steps
+from uv_start.setup_git_repo import create_github_repo, initial_commit, push
+from uv_start.snapshot import is_cacheable, materialise
+from uv_start.staging import create_staging, discard, promote
+from uv_start.timings import span
+from uv_start.workspace import Workspace
+
+
+def _rollback(*paths: Path) -> None:
+    """Discard incomplete project directories after a failed creation.
+
+    The directories are renamed away at once and deleted in the
+    background (see ``staging.discard``).
+    """
+    discarded = [discard(path) for path in paths]
+    if any(discarded):
+        report(
+            "[yellow]Rolled back: removed incomplete project directory[/yellow]"
+        )
+
+
+def build_steps(args: Namespace, dispatcher: CommandDispatcher) -> list[Step]:
+    """Describe phase 1 as a dependency graph.
+
+    Template rendering only needs the scaffold, so it overlaps with the
+    network-bound dependency install. Everything that edits
+    pyproject.toml waits for uv to finish with it. The scaffold step
+    leaves the scanned workspace on ``dispatcher.workspace`` for the
+    steps after it. Dependencies are only locked here; ``.venv`` and the
+    git hooks are built once the project is in its final place.
+    """
+    project_path = dispatcher.project_path
+    plan = plan_dependencies(args)
+    if getattr(args, "data", False):
+        return [
+            Step("scaffold", dispatcher.dispatch),
+            Step(
+                "dependencies",
+                lambda: install_dependencies(plan, project_path, sync=False),
+                depends_on=("scaffold",),
+            ),
+            Step(
+                "templates",
+                lambda: parse_docs_data(args, project_path),
+                depends_on=("scaffold",),
+            ),
+        ]
+    return [
+        Step("scaffold", dispatcher.dispatch),
+        Step(
+            "dependencies",
+            lambda: install_dependencies(plan, project_path, sync=False),
+            depends_on=("scaffold",),
+        ),
+        Step(
+            "templates",
+            lambda: render_templates(args, project_path, dispatcher.workspace),
+            depends_on=("scaffold",),
+        ),
+        Step(
+            "configs",
+            lambda: parse_dev_configs(project_path, dispatcher.workspace),
+            depends_on=("dependencies",),
+        ),
+        Step(
+            "pyproject",
+            lambda: render_pyproject(args, project_path, dispatcher.workspace),
+            depends_on=("configs",),
+        ),
+    ]
+
+
+def build_project(
+    args: Namespace, original_cwd: Path, journal: Journal | None = None
+) -> None:
+    """Run phase 1 for ``args`` inside ``original_cwd``.
+
+    With a journal, finished steps are skipped and new ones recorded.
+    """
+    dispatcher = CommandDispatcher(args=args, original_cwd=original_cwd)
+    steps = build_steps(args, dispatcher)
+    if journal is not None:
+        if journal.done("scaffold"):
+            dispatcher.workspace = Workspace.scan(dispatcher.project_path)
+        steps = journal.wrap(steps)
+    run_steps(steps)
+
+
+def create_local_project(
+    args: Namespace, original_cwd: Path, journal: Journal | None = None
+) -> tuple[Path, Journal]:
+    """Run phase 1 and return the project path and its journal.
+
+    Preflight checks, which also resolve ``--python auto``, run first
+    (see ``preflight``). The project is
+    built in a staging directory (independent steps run
+    concurrently, see ``build_steps``), moved into place with one
+    rename and then provisioned. Every finished step is journaled; pass
+    the journal of an earlier run to resume it. On failure the project
+    is rolled back, unless dependencies were already installed or it was
+    moved into place, in which case it is kept for ``--resume``. The
+    error is re-raised.
+    """
+    run_preflight(args, original_cwd)
+    project_path = original_cwd / args.project_name
+    if journal is None:
+        CommandDispatcher(
+            args=args, original_cwd=original_cwd
+        ).check_dir_exists()
+        staging = create_staging(original_cwd, args.project_name)
+        journal = Journal(staging / args.project_name, args)
+    staging = journal.project_path.parent
+    try:
+        with span("phase 1: local project"):
+            if not journal.done("promote"):
+                staged = journal.project_path
+                if getattr(args, "cache", False) and is_cacheable(args):
+                    journal.run(
+                        "snapshot",
+                        lambda: materialise(args, staged, build_project),
+                    )
+                else:
+                    build_project(args, staging, journal)
+                promote(staged, project_path)
+                journal.project_path = project_path
+                journal.record("promote")
+            _provision(args, project_path, journal)
+    except BaseException:
+        if journal.done("promote") or journal.worth_keeping():
+            report(
+                "[yellow]Kept the partial project; run "
+                f"'uv-start --resume {args.project_name}' to continue[/yellow]"
+            )
+        else:
+            _rollback(staging)
+        raise
+    return project_path, journal
+
+
+def _provision(args: Namespace, project_path: Path, journal: Journal) -> None:
+    """Build the environment and hooks as ``args.sync`` asks.
+
+    ``full`` provisions now, ``background`` hands the same work to a
+    detached process and ``none`` leaves ``.venv`` to the first
+    ``uv run``.
+    """
+    hooks = not getattr(args, "data", False)
+    match getattr(args, "sync", "full"):
+        case "full":
+            journal.run(
+                "provision", lambda: provision(project_path, hooks=hooks)
+            )
+        case "background":
+            log = project_path / SYNC_LOG
+            journal.run(
+                "provision",
+                lambda: provision_in_background(project_path, hooks=hooks),
+            )
+            report(
+                f"[green]Building .venv in the background (log: {log})[/green]"
+            )
+        case _:
+            hint = " && uv run pre-commit install" if hooks else ""
+            report(
+                "[yellow]Skipped building .venv; run 'uv sync"
+                f"{hint}' or any 'uv run' to create it[/yellow]"
+            )
+
+
+def publish_project(
+    args: Namespace, project_path: Path, journal: Journal
+) -> None:
+    """Run phase 2: initial commit and GitHub repository, if requested.
+
+    Commit, repository and push are journaled separately, so ``--resume``
+    after a failure retries only what is left. With ``--background-sync``
+    the hooks may or may not be installed by the time of the initial
+    commit, so it skips them rather than depend on the race.
+    """
+    if args.github:
+        background = getattr(args, "sync", "full") == "background"
+        if background:
+            report(
+                "[yellow]Making the initial commit without git hooks; "
+                "they are installed in the background[/yellow]"
+            )
+        with span("phase 2: git/GitHub"):
+            journal.run(
+                "commit",
+                lambda: initial_commit(project_path, verify=not background),
+            )
+            journal.run(
+                "repository",
+                lambda: create_github_repo(
+                    args.project_name,
+                    project_path,
+                    private=args.private,
+                    resuming=journal.resumed,
+                ),
+            )
+            journal.run("push", lambda: push(project_path))
+        report(
+            f"[green]GitHub repository {args.project_name} created and "
+            "configured successfully[/green]"
+        )
+    journal.remove()
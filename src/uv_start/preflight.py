@@ -0,0 +1,183 @@
+"""Check the environment before any work is done.
+
+Every check runs at the same time and has a short timeout, so a missing
+tool, an unauthenticated ``gh`` or a full disk is reported within a
+couple of seconds instead of after the dependencies were installed.
+All problems are reported together. ``--python auto`` is resolved by
+one of the checks, so a missing uv is reported as such and the slow
+interpreter listing overlaps with the other checks.
+"""
+
+import asyncio
+import re
+import shlex
+import shutil
+import subprocess
+from argparse import Namespace
+from collections.abc import Awaitable
+from pathlib import Path
+
+from uv_start.cli import PYTHON_VERSIONS
+from uv_start.config import clean_env
+from uv_start.exceptions import PreflightError
+from uv_start.interpreters import AUTO, resolve_python
+from uv_start.reporting import report
+from uv_start.runner import run_async
+from uv_start.setup_git_repo import gh_env
+from uv_start.timings import span
+
+# Seconds any single check may take, so an unreachable network or a hung
+# gh stalls the run for no more than a couple of seconds
+PREFLIGHT_TIMEOUT = 2.0
+
+# Oldest uv with every flag uv-start passes (uv add --frozen, uv init
+# --no-workspace/--vcs, [[tool.uv.index]] and UV_DEFAULT_INDEX)
+MIN_UV_VERSION = (0, 5, 0)
+
+# Free space needed in the target directory for a project and its .venv
+MIN_FREE_BYTES = 512 * 1024**2
+
+# Values of UV_PYTHON_DOWNLOADS under which uv will not fetch interpreters
+_NO_DOWNLOADS = ("never", "manual")
+
+
+def run_preflight(args: Namespace, original_cwd: Path) -> None:
+    """Run all checks that apply to ``args`` concurrently.
+
+    ``args.python`` is set to the resolved version if it was ``auto``.
+
+    Raises:
+        PreflightError: Listing every check that failed.
+    """
+    auto = args.python == AUTO
+    with span("preflight"):
+        problems = asyncio.run(_run_checks(args, original_cwd))
+    if problems:
+        raise PreflightError(
+            "Preflight checks failed:\n"
+            + "\n".join(f"  • {problem}" for problem in problems)
+        )
+    if auto:
+        report(f"[green]Using Python {args.python} (newest installed)[/green]")
+    report("[green]✓[/green] Preflight checks passed")
+
+
+async def _run_checks(args: Namespace, original_cwd: Path) -> list[str]:
+    checks = [
+        _check_uv(),
+        _check_python(args),
+        _check_disk_space(original_cwd),
+    ]
+    if getattr(args, "github", False):
+        checks += [_check_gh_auth(), _check_git_identity(original_cwd)]
+    results = await asyncio.gather(*(_guard(check) for check in checks))
+    # Several checks report the same missing executable
+    return list(dict.fromkeys(problem for problem in results if problem))
+
+
+async def _guard(check: Awaitable[str | None]) -> str | None:
+    """Turn a missing executable or a hung command into a problem."""
+    try:
+        return await check
+    except FileNotFoundError as e:
+        return f"'{e.filename}' is not installed or not on PATH"
+    except subprocess.TimeoutExpired as e:
+        return f"'{shlex.join(e.cmd)}' did not answer within {e.timeout:g}s"
+
+
+async def _check(
+    cmd: list[str], env: dict[str, str], cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    return await run_async(
+        cmd,
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        timeout=PREFLIGHT_TIMEOUT,
+    )
+
+
+async def _check_uv() -> str | None:
+    result = await _check(["uv", "--version"], clean_env())
+    match = re.search(r"(\d+)\.(\d+)\.(\d+)", result.stdout)
+    if result.returncode or match is None:
+        return f"Could not determine the uv version: {result.stderr.strip()}"
+    version = tuple(int(part) for part in match.groups())
+    if version < MIN_UV_VERSION:
+        needed = ".".join(map(str, MIN_UV_VERSION))
+        return (
+            f"uv {match.group()} is too old, uv-start needs {needed} or "
+            "newer (run 'uv self update')"
+        )
+    return None
+
+
+async def _check_python(args: Namespace) -> str | None:
+    if args.python == AUTO:
+        return await _resolve_auto(args)
+    version = args.python
+    env = clean_env()
+    result = await _check(["uv", "python", "find", version], env)
+    downloads = env.get("UV_PYTHON_DOWNLOADS", "automatic")
+    if result.returncode and downloads in _NO_DOWNLOADS:
+        return (
+            f"Python {version} is not installed and "
+            f"UV_PYTHON_DOWNLOADS={downloads} stops uv from fetching it "
+            f"(run 'uv python install {version}')"
+        )
+    return None
+
+
+async def _resolve_auto(args: Namespace) -> str | None:
+    """Pick the newest installed interpreter for ``--python auto``.
+
+    The listing runs in a thread, under the same timeout as every other
+    check.
+    """
+    listing = asyncio.to_thread(
+        resolve_python, AUTO, PYTHON_VERSIONS, PREFLIGHT_TIMEOUT
+    )
+    try:
+        args.python = await asyncio.wait_for(listing, PREFLIGHT_TIMEOUT)
+    except PreflightError as e:
+        return str(e)
+    except TimeoutError:
+        return f"'uv python list' did not answer within {PREFLIGHT_TIMEOUT:g}s"
+    return None
+
+
+async def _check_disk_space(target: Path) -> str | None:
+    free = shutil.disk_usage(target).free
+    if free < MIN_FREE_BYTES:
+        return (
+            f"Only {free / 1024**2:.0f} MiB free in {target}, at least "
+            f"{MIN_FREE_BYTES / 1024**2:.0f} MiB are needed"
+        )
+    return None
+
+
+async def _check_gh_auth() -> str | None:
+    result = await _check(["gh", "auth", "status"], gh_env())
+    if result.returncode:
+        return "gh is not authenticated (run 'gh auth login')"
+    return None
+
+
+async def _check_git_identity(target: Path) -> str | None:
+    result = await _check(
+        ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
+        clean_env(),
+        cwd=target,
+    )
+    keys = {
+        line.split(maxsplit=1)[0].lower()
+        for line in result.stdout.splitlines()
+        if len(line.split(maxsplit=1)) == 2
+    }
+    missing = sorted({"user.name", "user.email"} - keys)
+    if missing:
+        return (
+            f"git has no {' or '.join(missing)} for the initial commit "
+            f"(run 'git config --global {missing[0]} ...')"
+        )
+    return None
@@ -0,0 +1,103 @@
+"""Merge uv-start's TOML fragments into pyproject.toml files.
+
+A fragment is a block of TOML text that owns one table, for example
+``[tool.ruff]`` or ``[tool.commitizen]``. The owned table is read from
+the fragment itself: the path of single nested tables down to the first
+table with real content (``tool.pytest.ini_options``, ``tool.uv.index``).
+
+:func:`merge` parses the target file once, keeps only the fragments whose
+table is missing, and writes the file once. Fragments are appended as
+text, so their comments and layout survive, and running the merge again
+over an existing project changes nothing.
+"""
+
+import functools
+import json
+import re
+import tomllib
+from pathlib import Path
+
+from uv_start.exceptions import ConfigError
+
+
+@functools.cache
+def owned_table(fragment: str) -> tuple[str, ...]:
+    """Return the dotted path of the table a fragment defines."""
+    node = tomllib.loads(fragment)
+    path: list[str] = []
+    while len(node) == 1:
+        ((key, value),) = node.items()
+        if isinstance(value, list) and all(
+            isinstance(item, dict) for item in value
+        ):
+            # An array of tables, such as [[tool.uv.index]]
+            path.append(key)
+            break
+        if not isinstance(value, dict):
+            break
+        path.append(key)
+        node = value
+    return tuple(path)
+
+
+def has_table(document: dict, path: tuple[str, ...]) -> bool:
+    """Return whether ``path`` exists in a parsed TOML document."""
+    node = document
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return False
+        node = node[key]
+    return True
+
+
+def merge(pyproject: Path, fragments: list[str]) -> bool:
+    """Append every fragment whose table ``pyproject`` does not have yet.
+
+    Returns:
+        bool: Whether the file was written.
+
+    Raises:
+        ConfigError: If the file is missing or is not valid TOML.
+    """
+    try:
+        text = pyproject.read_text()
+    except FileNotFoundError as e:
+        raise ConfigError(f"pyproject.toml not found: {e}") from e
+    try:
+        document = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise ConfigError(f"Invalid TOML in {pyproject}: {e}") from e
+
+    missing = [
+        fragment
+        for fragment in fragments
+        if not has_table(document, owned_table(fragment))
+    ]
+    if not missing:
+        return False
+    pyproject.write_text(
+        text + "".join(f"\n{fragment}\n" for fragment in missing)
+    )
+    return True
+
+
+def with_version_files(fragment: str, extra: list[str]) -> str:
+    """Return the commitizen fragment with ``extra`` version_files added.
+
+    The list is rebuilt from the parsed fragment, so the entries are
+    always valid TOML strings.
+    """
+    if not extra:
+        return fragment
+    files = tomllib.loads(fragment)["tool"]["commitizen"]["version_files"]
+    entries = ",\n".join(
+        f"    {json.dumps(entry, ensure_ascii=False)}"
+        for entry in [*files, *extra]
+    )
+    return re.sub(
+        r"^version_files = \[.*?^\]",
+        lambda _: f"version_files = [\n{entries}\n]",
+        fragment,
+        count=1,
+        flags=re.MULTILINE | re.DOTALL,
+    )
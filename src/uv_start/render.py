@@ -0,0 +1,47 @@
+"""Single-pass placeholder rendering.
+
+A :class:`Renderer` compiles a replacement table into one regular
+expression, so each template is scanned once no matter how many
+placeholders it has. Longer placeholders are tried first, which lets
+entries such as ``src/{module_name}/__init__.py`` win over
+``{module_name}``.
+"""
+
+import functools
+import re
+from pathlib import Path
+
+
+class Renderer:
+    """Substitute a fixed set of placeholders in one pass."""
+
+    def __init__(self, replacements: dict[str, str]) -> None:
+        self.replacements = dict(replacements)
+        keys = sorted(self.replacements, key=len, reverse=True)
+        self._pattern = (
+            re.compile("|".join(re.escape(key) for key in keys))
+            if keys
+            else None
+        )
+
+    def render(self, text: str) -> str:
+        """Return ``text`` with every placeholder replaced."""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(
+            lambda match: self.replacements[match.group(0)], text
+        )
+
+    def render_file(self, source: Path, dest: Path) -> None:
+        """Render ``source`` into ``dest``; both may be the same file."""
+        dest.write_text(self.render(source.read_text()))
+
+
+@functools.cache
+def compile_renderer(items: tuple[tuple[str, str], ...]) -> Renderer:
+    """Return a shared renderer for a replacement table.
+
+    Every directory with the same table (for example a workspace member
+    rendering README.md and pyproject.toml) reuses one compiled pattern.
+    """
+    return Renderer(dict(items))
@@ -0,0 +1,158 @@
+"""Where a run reports its progress.
+
+Everything uv-start tells the user while creating a project (status
+lines, retry notices and the output of the commands it runs) goes to
+the active :class:`Reporter`, and so does the start and end of every
+phase, step and command (see :func:`uv_start.timings.span`). The command
+line uses a :class:`ConsoleReporter`, which is also the default, or a
+:class:`JsonReporter` with ``--events json``; the library API
+(:mod:`uv_start.api`) uses the silent base class unless given another
+one.
+
+Like the timing recorder, the active reporter is held in a context
+variable, so the threads and asyncio tasks of a run report to it too.
+"""
+
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from rich import print as rprint
+from rich.console import Console
+from rich.text import Text
+
+
+class Reporter:
+    """Receive the progress of a run; this base class discards it."""
+
+    def message(self, text: str) -> None:
+        """A status line in rich markup."""
+
+    def notice(self, text: str, style: str) -> None:
+        """A plain-text line about the run itself, such as a retry."""
+
+    def output(self, line: str, label: str | None, stderr: bool) -> None:
+        """One line of output from a command, without its newline."""
+
+    def started(self, name: str, kind: str, details: dict[str, Any]) -> None:
+        """A phase, step or (``kind`` "subprocess") command began."""
+
+    def finished(
+        self,
+        name: str,
+        kind: str,
+        details: dict[str, Any],
+        duration: float,
+        error: BaseException | None,
+    ) -> None:
+        """A phase, step or command ended, with ``error`` if it raised."""
+
+
+class ConsoleReporter(Reporter):
+    """Print progress to the terminal with rich."""
+
+    def __init__(self) -> None:
+        self._stdout = Console(highlight=False, soft_wrap=True)
+        self._stderr = Console(stderr=True, highlight=False, soft_wrap=True)
+
+    def message(self, text: str) -> None:
+        rprint(text)
+
+    def notice(self, text: str, style: str) -> None:
+        # Commands may contain rich markup characters
+        self._stderr.print(Text(text, style=style))
+
+    def output(self, line: str, label: str | None, stderr: bool) -> None:
+        text = Text(line)
+        if label:
+            text = Text.assemble((f"{label} | ", "dim"), text)
+        (self._stderr if stderr else self._stdout).print(text)
+
+
+class JsonReporter(Reporter):
+    """Write one JSON object per line (NDJSON) to standard output.
+
+    Every object has an ``event`` (start, finish, fail, message, notice
+    or output) and a ``time`` in seconds since the reporter was created,
+    from a monotonic clock. Phases, steps and commands add ``name``,
+    ``kind`` and ``parent`` (the enclosing span), commands their
+    ``command`` and ``exit_code``, and finish and fail events the
+    ``duration``; fail events carry the ``error``.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.monotonic()
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Write one event; safe to call from any thread."""
+        record = {
+            "event": event,
+            "time": round(time.monotonic() - self._origin, 6),
+            **fields,
+        }
+        line = json.dumps(record, default=str)
+        with self._lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def message(self, text: str) -> None:
+        self.emit("message", text=Text.from_markup(text).plain)
+
+    def notice(self, text: str, style: str) -> None:
+        self.emit("notice", text=text)
+
+    def output(self, line: str, label: str | None, stderr: bool) -> None:
+        stream = "stderr" if stderr else "stdout"
+        self.emit("output", label=label, stream=stream, line=line)
+
+    def started(self, name: str, kind: str, details: dict[str, Any]) -> None:
+        self.emit("start", name=name, kind=kind, **details)
+
+    def finished(
+        self,
+        name: str,
+        kind: str,
+        details: dict[str, Any],
+        duration: float,
+        error: BaseException | None,
+    ) -> None:
+        fields = {"name": name, "kind": kind, **details}
+        fields["duration"] = round(duration, 6)
+        if error is None:
+            self.emit("finish", **fields)
+        else:
+            self.emit(
+                "fail", **fields, error=str(error) or type(error).__name__
+            )
+
+
+_active: ContextVar[Reporter | None] = ContextVar(
+    "uv_start_reporter", default=None
+)
+_console = ConsoleReporter()
+
+
+@contextmanager
+def reporting(reporter: Reporter) -> Iterator[Reporter]:
+    """Make ``reporter`` the active reporter inside the block."""
+    token = _active.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _active.reset(token)
+
+
+def get_reporter() -> Reporter:
+    """Return the active reporter, or the console when none is set."""
+    return _active.get() or _console
+
+
+def report(text: str) -> None:
+    """Send a status line in rich markup to the active reporter."""
+    get_reporter().message(text)
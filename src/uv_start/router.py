@@ -3,11 +3,20 @@ from argparse import Namespace
 from dataclasses import dataclass
 from pathlib import Path
 
-from rich import print as rprint
 from rich.prompt import Prompt
 
-from uv_start.config import clean_env
+from uv_start.config import clean_env, load_retry_policy
 from uv_start.exceptions import ProjectCreationError
+from uv_start.reporting import report
+from uv_start.runner import Command, run_all, run_command
+from uv_start.timings import span
+from uv_start.workspace import Workspace
+
+# uv flags for each workspace member kind
+MEMBER_FLAGS = {"lib": ["--lib"], "app": ["--package", "--app"]}
+
+# Upper bound on concurrent ``uv init`` calls for workspace members
+MAX_MEMBER_WORKERS = 8
 
 
 @dataclass
@@ -19,6 +28,7 @@ class CommandDispatcher:
 
     def __post_init__(self) -> None:
         self.project_path = self.original_cwd / self.args.project_name
+        self.workspace = Workspace(self.project_path)
 
     def check_dir_exists(self) -> None:
         if self.project_path.exists():
@@ -29,12 +39,16 @@ class CommandDispatcher:
             )
 
     def dispatch(self) -> None:
-        """Route to appropriate command handler based on argument pattern"""
+        """Route to appropriate command handler based on argument pattern
+
+        Afterwards ``self.workspace`` describes the created members.
+        """
         if getattr(self.args, "data", False):
             self._create_data_project()
             return
         flags = self._get_project_flags()
         self._create_project(flags, workspace=self.args.workspace)
+        self.workspace = Workspace.scan(self.project_path)
 
     def _get_project_flags(self) -> list[str]:
         """Convert project type to uv flags"""
@@ -53,11 +67,11 @@ class CommandDispatcher:
     ) -> None:
         """Create a new project with specified flags"""
         project_type = " ".join(flag.strip("-") for flag in flags)
-        rprint(
+        report(
             f"[green]Creating {project_type} project at {self.original_cwd}...[/green]"
         )
         try:
-            subprocess.run(
+            run_command(
                 [
                     "uv",
                     "init",
@@ -69,6 +83,8 @@ class CommandDispatcher:
                 check=True,
                 cwd=self.original_cwd,
                 env=clean_env(),
+                # May download the requested interpreter
+                retry=load_retry_policy(),
             )
             # Create tests directory
             tests_dir = self.project_path / "tests"
@@ -78,14 +94,14 @@ class CommandDispatcher:
             with open(tests_dir / "test_init.py", "w") as f:
                 f.write("def test_init():\n    assert True\n")
 
-            rprint(
+            report(
                 f"[green]✓[/green] Successfully created {project_type} project '[bold]{self.args.project_name}[/bold]'"
             )
 
             if workspace:
                 self._initialize_workspace()
 
-        except subprocess.CalledProcessError as e:
+        except subprocess.SubprocessError as e:
             raise ProjectCreationError(
                 f"Failed to create {project_type} project: {e}"
             ) from e
@@ -94,7 +110,14 @@ class CommandDispatcher:
         """Initialize workspace configuration after project creation"""
         packages_path = self.project_path / "packages"
         packages_path.mkdir(exist_ok=True)
-        rprint("[green]Initializing workspace...[/green]")
+        report("[green]Initializing workspace...[/green]")
+        members = getattr(self.args, "members", None) or self._ask_members()
+        if members:
+            self._add_members(members)
+
+    def _ask_members(self) -> list[tuple[str, str]]:
+        """Prompt for a utils library and an application member."""
+        members = []
         common_utils = Prompt.ask(
             "Do you want to add common utilities?",
             choices=["y", "n"],
@@ -103,7 +126,7 @@ class CommandDispatcher:
 
         if common_utils == "y":
             utils_name = Prompt.ask("Enter the name of the utils library: ")
-            self._add_common_utils(utils_name)
+            members.append((utils_name, "lib"))
         other_projects = Prompt.ask(
             "Do you want to add other projects?",
             choices=["y", "n"],
@@ -111,46 +134,82 @@ class CommandDispatcher:
         )
         if other_projects == "y":
             project_name = Prompt.ask("Enter the project-name: ")
-            self._add_other_projects(project_name)
-
-    def _add_common_utils(self, utils_name: str) -> None:
-        """Add common utilities to the workspace"""
-        try:
-            subprocess.run(
+            members.append((project_name, "app"))
+        return members
+
+    def _add_members(self, members: list[tuple[str, str]]) -> None:
+        """Create all members concurrently, then register them at once.
+
+        Members are created with ``--no-workspace`` so the concurrent
+        ``uv init`` calls never edit the root pyproject.toml; the root
+        gets the member list and a single ``uv add`` afterwards. If one
+        member fails the others are cancelled.
+        """
+        commands = [
+            Command(
                 [
                     "uv",
                     "init",
-                    utils_name,
-                    "--lib",
+                    name,
+                    *MEMBER_FLAGS[kind],
+                    "--no-workspace",
+                    "--vcs",
+                    "none",
                 ],
-                check=True,
                 cwd=self.project_path / "packages",
                 env=clean_env(),
+                label=name,
             )
-            subprocess.run(
-                [
-                    "uv",
-                    "add",
-                    f"./packages/{utils_name}",
-                    "--editable",
-                ],
-                check=True,
-                cwd=self.project_path,
-                env=clean_env(),
-            )
-            rprint("[green]✓[/green] Successfully added common_utils'")
-        except subprocess.CalledProcessError as e:
+            for name, kind in members
+        ]
+        try:
+            with span("add members", "router"):
+                run_all(commands, limit=MAX_MEMBER_WORKERS)
+        except subprocess.SubprocessError as e:
+            raise ProjectCreationError(
+                f"Failed to create workspace member: {e}"
+            ) from e
+        for name, _ in members:
+            report(f"[green]✓[/green] Successfully created {name}")
+        self._register_members([name for name, _ in members])
+
+    def _register_members(self, names: list[str]) -> None:
+        """Declare the members and add them to the root as editables"""
+        pyproject = self.project_path / "pyproject.toml"
+        entries = "".join(f'    "packages/{name}",\n' for name in names)
+        with pyproject.open("a") as f:
+            f.write(f"\n[tool.uv.workspace]\nmembers = [\n{entries}]\n")
+        try:
+            with span("register members", "router"):
+                # Register without locking; the dependency plan resolves once
+                run_command(
+                    [
+                        "uv",
+                        "add",
+                        "--frozen",
+                        "--editable",
+                        *(f"./packages/{name}" for name in names),
+                    ],
+                    check=True,
+                    cwd=self.project_path,
+                    env=clean_env(),
+                )
+        except subprocess.SubprocessError as e:
             raise ProjectCreationError(
-                f"Failed to create common_utils: {e}"
+                f"Failed to register workspace members: {e}"
             ) from e
 
     def _create_data_project(self) -> None:
-        """Create a plain data analysis project with scientific Python stack."""
-        rprint(
+        """Create a plain data analysis project.
+
+        The scientific Python stack is installed later together with the
+        rest of the dependency plan (see ``dev_deps.plan_dependencies``).
+        """
+        report(
             f"[green]Creating data analysis project at {self.original_cwd}...[/green]"
         )
         try:
-            subprocess.run(
+            run_command(
                 [
                     "uv",
                     "init",
@@ -161,56 +220,13 @@ class CommandDispatcher:
                 check=True,
                 cwd=self.original_cwd,
                 env=clean_env(),
+                # May download the requested interpreter
+                retry=load_retry_policy(),
             )
-            subprocess.run(
-                [
-                    "uv",
-                    "add",
-                    "jupyter",
-                    "pandas",
-                    "matplotlib",
-                    "seaborn",
-                ],
-                check=True,
-                cwd=self.project_path,
-                env=clean_env(),
-            )
-            rprint(
+            report(
                 f"[green]✓[/green] Successfully created data project '[bold]{self.args.project_name}[/bold]'"
             )
-        except subprocess.CalledProcessError as e:
+        except subprocess.SubprocessError as e:
             raise ProjectCreationError(
                 f"Failed to create data project: {e}"
             ) from e
-
-    def _add_other_projects(self, project_name: str) -> None:
-        """Add other projects to the workspace"""
-        try:
-            subprocess.run(
-                [
-                    "uv",
-                    "init",
-                    project_name,
-                    "--package",
-                    "--app",
-                ],
-                check=True,
-                cwd=self.project_path / "packages",
-                env=clean_env(),
-            )
-            subprocess.run(
-                [
-                    "uv",
-                    "add",
-                    f"./packages/{project_name}",
-                    "--editable",
-                ],
-                check=True,
-                cwd=self.project_path,
-                env=clean_env(),
-            )
-            rprint(f"[green]✓[/green] Successfully created {project_name}")
-        except subprocess.CalledProcessError as e:
-            raise ProjectCreationError(
-                f"Failed to create {project_name}: {e}"
-            ) from e
@@ -0,0 +1,338 @@
+"""Run external commands through one asyncio subprocess engine.
+
+Every ``uv``, ``git`` and ``gh`` call goes through :func:`run_async`.
+Output that is not captured is streamed to the active reporter (see
+:mod:`uv_start.reporting`) line by line as it arrives, so concurrent
+commands never interleave mid-line; the text is
+also kept on the returned :class:`subprocess.CompletedProcess`. Each
+command has a timeout, and a command that times out or is cancelled is
+killed rather than left running. Network-bound commands pass a
+:class:`RetryPolicy` (loaded from the ``[network]`` section of the config
+file) and are retried with jittered exponential backoff when they time
+out or fail with a network error (see :func:`is_transient`); every retry
+and its latency is reported. Other failures, such as a resolution
+conflict, are raised at once.
+
+Synchronous code uses :func:`run_command` for one command and
+:func:`run_all` for several independent ones. ``run_all`` runs them
+concurrently and, as soon as one fails, cancels (kills) the rest.
+
+Errors are the familiar :mod:`subprocess` ones: ``CalledProcessError``
+for a non-zero exit with ``check=True``, ``TimeoutExpired`` for a
+timeout and ``FileNotFoundError`` for a missing executable.
+"""
+
+import asyncio
+import random
+import shlex
+import subprocess
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from uv_start.reporting import get_reporter
+from uv_start.timings import span
+
+# Seconds a single command may run; a cold ``uv sync`` of the data stack
+# is the slowest thing uv-start runs
+DEFAULT_TIMEOUT = 900.0
+
+# Longest line read from a command's output
+STREAM_LIMIT = 1024 * 1024
+
+
+# Output of a failed command that points at a transient network problem,
+# in the wording of uv (reqwest), git and gh
+TRANSIENT_MARKERS = (
+    "error sending request",
+    "failed to fetch",
+    "failed to download",
+    "connection reset",
+    "connection refused",
+    "connection closed",
+    "connection timed out",
+    "operation timed out",
+    "timed out",
+    "i/o timeout",
+    "dns error",
+    "failed to lookup address",
+    "could not resolve host",
+    "temporary failure in name resolution",
+    "network is unreachable",
+    "the remote end hung up unexpectedly",
+    "early eof",
+    "rpc failed",
+    "broken pipe",
+    "too many requests",
+    "bad gateway",
+    "service unavailable",
+    "gateway timeout",
+    "internal server error",
+)
+
+# ...unless it also names a cause that retrying cannot fix
+PERMANENT_MARKERS = (
+    "certificate",
+    "no solution found",
+    "was not found in the package registry",
+    "unauthorized",
+    "forbidden",
+    "authentication failed",
+    "permission denied",
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Timeout and bounded retries for one network-bound command.
+
+    ``timeout`` replaces the command's own timeout only when set.
+    """
+
+    timeout: float | None = None
+    retries: int = 2
+    backoff: float = 1.0
+    max_backoff: float = 30.0
+
+    @property
+    def attempts(self) -> int:
+        return self.retries + 1
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed ``attempt`` (full jitter)."""
+        ceiling = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+@dataclass(frozen=True)
+class Command:
+    """One command for :func:`run_all`, with the options of ``run_async``."""
+
+    args: list[str]
+    cwd: Path | None = None
+    env: dict[str, str] | None = None
+    check: bool = True
+    capture_output: bool = False
+    timeout: float | None = DEFAULT_TIMEOUT
+    label: str | None = None
+    retry: RetryPolicy | None = None
+
+
+async def run_async(
+    cmd: Sequence[str],
+    *,
+    check: bool = False,
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    capture_output: bool = False,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    label: str | None = None,
+    retry: RetryPolicy | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run ``cmd`` and record each attempt as a subprocess span.
+
+    Without ``capture_output`` the output is streamed to the active
+    reporter line by line, labelled with ``label``. Standard input
+    is closed: nothing uv-start runs is interactive.
+
+    With ``retry`` a command that times out or (with ``check``) fails
+    with a network error is run again after a jittered backoff, up to
+    ``retry.retries`` more times; ``retry.timeout``, if set, replaces
+    ``timeout``.
+
+    Raises:
+        subprocess.CalledProcessError: If ``check`` and the exit status
+            of the last attempt is non-zero.
+        subprocess.TimeoutExpired: If the last attempt ran past the
+            timeout.
+    """
+    cmd = list(cmd)
+    if retry is None:
+        return await _run_once(
+            cmd, check, cwd, env, capture_output, timeout, label
+        )
+
+    if retry.timeout is not None:
+        timeout = retry.timeout
+    start = time.perf_counter()
+    attempt = 1
+    while True:
+        attempt_start = time.perf_counter()
+        try:
+            result = await _run_once(
+                cmd,
+                check,
+                cwd,
+                env,
+                capture_output,
+                timeout,
+                label,
+                attempt,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            if attempt == retry.attempts or not is_transient(e):
+                raise
+            delay = retry.delay(attempt)
+            _report(
+                f"{shlex.join(cmd)}: {_reason(e)} after "
+                f"{time.perf_counter() - attempt_start:.1f}s; retry "
+                f"{attempt}/{retry.retries} in {delay:.1f}s",
+                "yellow",
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        if attempt > 1:
+            _report(
+                f"{shlex.join(cmd)}: succeeded on attempt "
+                f"{attempt}/{retry.attempts} after "
+                f"{time.perf_counter() - start:.1f}s",
+                "green",
+            )
+        return result
+
+
+async def _run_once(
+    cmd: list[str],
+    check: bool,
+    cwd: Path | None,
+    env: dict[str, str] | None,
+    capture_output: bool,
+    timeout: float | None,
+    label: str | None,
+    attempt: int = 1,
+) -> subprocess.CompletedProcess[str]:
+    name = shlex.join(cmd)
+    if attempt > 1:
+        name += f" (attempt {attempt})"
+    with span(name, "subprocess", command=cmd, attempt=attempt) as details:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            limit=STREAM_LIMIT,
+        )
+        echo = None if capture_output else label or ""
+        try:
+            async with asyncio.timeout(timeout):
+                stdout, stderr, _ = await asyncio.gather(
+                    _read(process.stdout, echo, stderr=False),
+                    _read(process.stderr, echo, stderr=True),
+                    process.wait(),
+                )
+        except TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            details["exit_code"] = process.returncode
+
+    if check and process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode, cmd, stdout, stderr
+        )
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+
+
+def is_transient(
+    error: subprocess.CalledProcessError | subprocess.TimeoutExpired,
+) -> bool:
+    """Whether a failed attempt is worth retrying.
+
+    Timeouts are; a non-zero exit is when its output shows a network
+    error (:data:`TRANSIENT_MARKERS`) and no cause retrying cannot fix,
+    such as a TLS certificate problem (:data:`PERMANENT_MARKERS`).
+    """
+    if isinstance(error, subprocess.TimeoutExpired):
+        return True
+    output = f"{error.stdout or ''}\n{error.stderr or ''}".lower()
+    return any(marker in output for marker in TRANSIENT_MARKERS) and not any(
+        marker in output for marker in PERMANENT_MARKERS
+    )
+
+
+def _reason(
+    error: subprocess.CalledProcessError | subprocess.TimeoutExpired,
+) -> str:
+    if isinstance(error, subprocess.TimeoutExpired):
+        return f"timed out after {error.timeout:g}s"
+    return f"exit status {error.returncode}"
+
+
+def _report(message: str, style: str) -> None:
+    get_reporter().notice(message, style)
+
+
+async def _read(
+    stream: asyncio.StreamReader | None, echo: str | None, stderr: bool
+) -> str:
+    """Collect a pipe's output, reporting each line unless ``echo`` is None.
+
+    ``echo`` is the label of the lines; an empty one leaves them bare.
+    """
+    if stream is None:
+        return ""
+    reporter = get_reporter()
+    lines = []
+    async for raw in stream:
+        line = raw.decode(errors="replace")
+        lines.append(line)
+        if echo is not None:
+            reporter.output(line.rstrip("\r\n"), echo or None, stderr)
+    return "".join(lines)
+
+
+async def gather_commands(
+    commands: Sequence[Command], limit: int | None = None
+) -> list[subprocess.CompletedProcess[str]]:
+    """Run ``commands`` concurrently, at most ``limit`` at a time.
+
+    The first failure cancels every command still running or waiting.
+    """
+    semaphore = asyncio.Semaphore(limit or max(len(commands), 1))
+
+    async def run(command: Command) -> subprocess.CompletedProcess[str]:
+        async with semaphore:
+            return await run_async(
+                command.args,
+                check=command.check,
+                cwd=command.cwd,
+                env=command.env,
+                capture_output=command.capture_output,
+                timeout=command.timeout,
+                label=command.label,
+                retry=command.retry,
+            )
+
+    async with asyncio.TaskGroup() as group:
+        tasks = [group.create_task(run(command)) for command in commands]
+    return [task.result() for task in tasks]
+
+
+def run_command(
+    cmd: Sequence[str], **kwargs: object
+) -> subprocess.CompletedProcess[str]:
+    """Run one command from synchronous code (see :func:`run_async`)."""
+    return asyncio.run(run_async(cmd, **kwargs))  # type: ignore[arg-type]
+
+
+def run_all(
+    commands: Sequence[Command], limit: int | None = None
+) -> list[subprocess.CompletedProcess[str]]:
+    """Run independent commands concurrently from synchronous code.
+
+    Results are in the order of ``commands``.
+
+    Raises:
+        The error of the first command that failed; the others are
+        cancelled.
+    """
+    try:
+        return asyncio.run(gather_commands(commands, limit))
+    except ExceptionGroup as group:
+        raise group.exceptions[0] from None
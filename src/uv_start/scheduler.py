@@ -0,0 +1,135 @@
+"""Run project creation steps as a dependency graph.
+
+Each step names the steps it depends on. A step starts as soon as all of
+its dependencies have finished, so independent steps (template rendering,
+``.vscode`` setup) overlap with network-bound ones (``uv sync``).
+"""
+
+import contextvars
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+
+from uv_start.timings import span
+
+
+@dataclass(frozen=True)
+class Step:
+    """A named unit of work and the steps that must finish before it."""
+
+    name: str
+    func: Callable[[], None]
+    depends_on: tuple[str, ...] = ()
+
+
+def run_steps(steps: list[Step], max_workers: int = 4) -> None:
+    """Run steps concurrently, respecting their dependencies.
+
+    When a step raises, no further steps are started. Steps that are
+    already running are allowed to finish, so the caller can safely roll
+    back, and the first error is re-raised.
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle.
+    """
+    _check_graph(steps)
+    pending = {step.name: step for step in steps}
+    done: set[str] = set()
+    running: dict[Future[None], str] = {}
+    error: BaseException | None = None
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="uv-start-step"
+    ) as pool:
+        while pending or running:
+            if error is None:
+                ready = [
+                    step
+                    for step in pending.values()
+                    if all(dep in done for dep in step.depends_on)
+                ]
+                for step in ready:
+                    del pending[step.name]
+                    # Each step runs in a copy of the caller's context so
+                    # it records into the same timing recorder.
+                    ctx = contextvars.copy_context()
+                    future = pool.submit(ctx.run, _run_step, step)
+                    running[future] = step.name
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    done.add(name)
+                elif error is None:
+                    error = exc
+
+    if error is not None:
+        raise error
+
+
+def run_each[T](
+    func: Callable[[T], None],
+    items: Iterable[T],
+    max_workers: int = 8,
+    thread_name_prefix: str = "uv-start-each",
+) -> None:
+    """Call ``func`` on every item concurrently.
+
+    All calls are allowed to finish before the first error (in item
+    order) is re-raised, so nothing is left running during a rollback.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        for item in items:
+            func(item)
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=thread_name_prefix,
+    ) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, func, item)
+            for item in items
+        ]
+    for future in futures:
+        future.result()
+
+
+def _run_step(step: Step) -> None:
+    with span(step.name, "step"):
+        step.func()
+
+
+def _check_graph(steps: list[Step]) -> None:
+    """Reject unknown dependencies and cycles before running anything."""
+    names = {step.name for step in steps}
+    for step in steps:
+        unknown = set(step.depends_on) - names
+        if unknown:
+            raise ValueError(
+                f"Step '{step.name}' depends on unknown step(s): "
+                f"{', '.join(sorted(unknown))}"
+            )
+
+    resolved: set[str] = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [
+            step
+            for step in remaining
+            if all(dep in resolved for dep in step.depends_on)
+        ]
+        if not ready:
+            cycle = ", ".join(sorted(step.name for step in remaining))
+            raise ValueError(f"Dependency cycle between steps: {cycle}")
+        resolved.update(step.name for step in ready)
+        remaining = [step for step in remaining if step.name not in resolved]
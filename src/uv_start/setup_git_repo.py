@@ -1,96 +1,216 @@
+"""Commit a new project and publish it on GitHub.
+
+Publishing runs as three journaled steps (see ``pipeline.publish_project``)
+so ``--resume`` can pick up after any of them: :func:`initial_commit`,
+:func:`create_github_repo` and :func:`push`. Each one copes with the
+work an interrupted earlier attempt may have left behind.
+"""
+
 import os
 import subprocess
 from pathlib import Path
 
-from rich import print as rprint
-
-from uv_start.config import clean_env
+from uv_start.config import clean_env, load_retry_policy
 from uv_start.exceptions import GitSetupError
+from uv_start.reporting import report
+from uv_start.runner import run_command
+from uv_start.timings import span
 
+INITIAL_COMMIT_MESSAGE = "chore: initial commit"
 
-def setup_git_repo(
-    project_name: str,
-    project_path: Path,
-    private: bool = False,
-) -> None:
-    """Initialize git repo and optionally set up GitHub remote.
+# Makes git ask gh for HTTPS credentials, like ``gh repo create --push``
+# does, so a user logged in only through ``gh auth login`` can push. The
+# empty helper drops the ones configured for the user first.
+GH_CREDENTIALS = [
+    "-c",
+    "credential.helper=",
+    "-c",
+    "credential.helper=!gh auth git-credential",
+]
 
-    Authentication is handled by the gh CLI, which uses credentials
-    from `gh auth login`. If GH_TOKEN or GITHUB_TOKEN is set in the
-    shell environment, it will be passed through to gh automatically.
+
+def gh_env() -> dict[str, str]:
+    """Return the environment for ``gh`` commands.
+
+    Removes any stale GH_TOKEN/GITHUB_TOKEN that could override
+    ``gh auth login`` credentials. Only passes a token through if it is
+    explicitly set in the shell.
     """
-    repo_name = project_name
+    env = clean_env()
+    github_token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if github_token:
+        env["GH_TOKEN"] = github_token
+    else:
+        env.pop("GH_TOKEN", None)
+        env.pop("GITHUB_TOKEN", None)
+    return env
+
+
+def initial_commit(project_path: Path, verify: bool = True) -> None:
+    """Commit the whole project, unless it already has a commit.
+
+    With ``verify=False`` the git hooks are skipped (``--no-verify``).
+
+    Raises:
+        GitSetupError: If the commit fails.
+    """
+    if _succeeds(
+        ["git", "rev-parse", "--verify", "--quiet", "HEAD"], project_path
+    ):
+        report("[green]Initial commit already made[/green]")
+        return
+    commit = ["git", "commit", "-m", INITIAL_COMMIT_MESSAGE]
+    if not verify:
+        commit.append("--no-verify")
     try:
-        # Create initial commit.
         # Pre-commit hooks (e.g. end-of-file-fixer) may auto-fix
         # staged files and abort the first commit with exit code 1.
         # The fixes persist in the working tree, so we re-stage and
         # commit again — exactly like doing it manually.
-        subprocess.run(
-            ["git", "add", "."],
-            check=True,
-            cwd=project_path,
-            env=clean_env(),
-        )
-        first = subprocess.run(
-            ["git", "commit", "-m", "chore: initial commit"],
-            cwd=project_path,
-            env=clean_env(),
-        )
-        if first.returncode != 0:
-            subprocess.run(
+        with span("initial commit", "setup_git_repo"):
+            run_command(
                 ["git", "add", "."],
                 check=True,
                 cwd=project_path,
                 env=clean_env(),
             )
-            subprocess.run(
-                ["git", "commit", "-m", "chore: initial commit"],
-                check=True,
+            first = run_command(
+                commit,
                 cwd=project_path,
                 env=clean_env(),
             )
+            if first.returncode != 0:
+                run_command(
+                    ["git", "add", "."],
+                    check=True,
+                    cwd=project_path,
+                    env=clean_env(),
+                )
+                run_command(
+                    commit,
+                    check=True,
+                    cwd=project_path,
+                    env=clean_env(),
+                )
+    except subprocess.SubprocessError as e:
+        raise GitSetupError(f"Failed to create the initial commit: {e}") from e
+
+
+def create_github_repo(
+    repo_name: str,
+    project_path: Path,
+    private: bool = False,
+    resuming: bool = False,
+) -> None:
+    """Create the GitHub repository and add it as the ``origin`` remote.
+
+    Authentication is handled by the gh CLI, which uses credentials
+    from `gh auth login`. If GH_TOKEN or GITHUB_TOKEN is set in the
+    shell environment, it will be passed through to gh automatically.
+
+    ``gh repo create`` is not retried: an attempt that times out may
+    still have created the repository, and every retry would then fail
+    with "already exists". When ``resuming``, an earlier attempt may
+    have created the repository before failing, so an existing
+    ``origin`` remote or repository of that name is used instead of
+    creating another one.
+
+    Raises:
+        GitSetupError: If the repository could not be created.
+    """
+    env = gh_env()
+    try:
+        if resuming and _succeeds(
+            ["git", "remote", "get-url", "origin"], project_path
+        ):
+            report("[green]Using the existing 'origin' remote[/green]")
+            return
+        if resuming:
+            existing = run_command(
+                [
+                    "gh",
+                    "repo",
+                    "view",
+                    repo_name,
+                    "--json",
+                    "url",
+                    "--jq",
+                    ".url",
+                ],
+                capture_output=True,
+                cwd=project_path,
+                env=env,
+            )
+            if existing.returncode == 0 and existing.stdout.strip():
+                url = f"{existing.stdout.strip()}.git"
+                run_command(
+                    ["git", "remote", "add", "origin", url],
+                    check=True,
+                    cwd=project_path,
+                    env=clean_env(),
+                )
+                report(
+                    f"[green]Using the existing GitHub repository {url}"
+                    "[/green]"
+                )
+                return
 
-        # Prepare environment for gh command
-        # Remove any stale GH_TOKEN/GITHUB_TOKEN that could override
-        # gh auth login credentials. Only pass through if explicitly set.
-        env = clean_env()
-        github_token = os.environ.get("GH_TOKEN") or os.environ.get(
-            "GITHUB_TOKEN"
-        )
-        if github_token:
-            env["GH_TOKEN"] = github_token
-        else:
-            env.pop("GH_TOKEN", None)
-            env.pop("GITHUB_TOKEN", None)
-
-        # Create GitHub repository
-        # gh CLI uses stored credentials from 'gh auth login'
-        # unless GH_TOKEN is set in the environment
         visibility = "--private" if private else "--public"
-        create_repo_cmd = [
-            "gh",
-            "repo",
-            "create",
-            repo_name,
-            visibility,
-            "--source",
-            ".",
-            "--remote",
-            "origin",
-            "--push",
-        ]
-
-        subprocess.run(
-            create_repo_cmd,
-            check=True,
-            cwd=project_path,
-            env=env,
-        )
-
-        rprint(
-            f"[green]GitHub repository {repo_name} created and configured successfully[/green]"
-        )
-
-    except subprocess.CalledProcessError as e:
-        raise GitSetupError(f"Failed to set up git repository: {e}") from e
+        with span("create GitHub repository", "setup_git_repo"):
+            run_command(
+                [
+                    "gh",
+                    "repo",
+                    "create",
+                    repo_name,
+                    visibility,
+                    "--source",
+                    ".",
+                    "--remote",
+                    "origin",
+                ],
+                check=True,
+                cwd=project_path,
+                env=env,
+            )
+    except subprocess.SubprocessError as e:
+        raise GitSetupError(f"Failed to create GitHub repository: {e}") from e
+
+
+def push(project_path: Path) -> None:
+    """Push the current branch to ``origin`` and track it.
+
+    git gets its credentials from gh (see :data:`GH_CREDENTIALS`).
+    Pushing the same commit again is harmless, so the push is retried
+    with the ``[network]`` policy.
+
+    Raises:
+        GitSetupError: If the push fails.
+    """
+    try:
+        with span("push", "setup_git_repo"):
+            run_command(
+                [
+                    "git",
+                    *GH_CREDENTIALS,
+                    "push",
+                    "--set-upstream",
+                    "origin",
+                    "HEAD",
+                ],
+                check=True,
+                cwd=project_path,
+                env=gh_env(),
+                retry=load_retry_policy(),
+            )
+    except subprocess.SubprocessError as e:
+        raise GitSetupError(f"Failed to push to GitHub: {e}") from e
+
+
+def _succeeds(cmd: list[str], project_path: Path) -> bool:
+    return (
+        run_command(
+            cmd, capture_output=True, cwd=project_path, env=clean_env()
+        ).returncode
+        == 0
+    )
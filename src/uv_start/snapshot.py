@@ -0,0 +1,229 @@
+"""Golden project snapshots.
+
+For a given combination of project options the generated project is
+identical apart from its name, so uv-start can build a fully provisioned
+"golden" project once, keep it in a local cache and materialise new
+projects from it.
+
+A golden project is built under the placeholder name :data:`GOLDEN_NAME`.
+Materialising copies it (without ``.venv``), renames the package directory
+and re-renders every file that mentions the placeholder. The caller then
+builds the environment with ``uv sync --frozen`` (see
+:func:`uv_start.dev_deps.provision`), which installs straight from the
+cached ``uv.lock`` without resolving while uv hardlinks/reflinks the
+packages out of its own cache, so creation takes seconds.
+
+The cache key covers the project options, a hash of the template
+directory, the package indexes (``[uv]`` settings and ``UV_*INDEX*``
+variables), the uv version, the uv-start version and the author
+identity, so a stale snapshot is never used.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from argparse import Namespace
+from collections.abc import Callable
+from pathlib import Path
+
+from uv_start import __version__
+from uv_start.config import clean_env, get_user_config, load_uv_settings
+from uv_start.exceptions import ProjectCreationError
+from uv_start.parse_docs import TEMPLATE_DIR
+from uv_start.reporting import report
+from uv_start.runner import run_command
+from uv_start.timings import span
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "uv-start"
+    / "golden"
+)
+
+GOLDEN_NAME = "uv-start-golden"
+GOLDEN_MODULE = GOLDEN_NAME.replace("-", "_")
+
+# Project options that change the generated files
+KEY_OPTIONS = ("type", "python", "data", "workspace", "github")
+
+# Variables that change where packages are resolved from, and so the
+# lockfile (their values may hold credentials; the key only has a hash)
+INDEX_ENV = (
+    "UV_INDEX_URL",
+    "UV_EXTRA_INDEX_URL",
+    "UV_DEFAULT_INDEX",
+    "UV_INDEX",
+    "UV_FIND_LINKS",
+)
+
+
+def is_cacheable(args: Namespace) -> bool:
+    """Return whether a project can be created from a snapshot.
+
+    A snapshot only stands in for its one package: materialising renames
+    :data:`GOLDEN_NAME`, while the names and types of workspace members
+    (``--member`` or prompted) end up in their package directories, the
+    root pyproject.toml and the commitizen ``version_files``, and none of
+    them are in :data:`KEY_OPTIONS`. Workspaces are therefore always
+    built from scratch; ``workspace`` is part of the key so a workspace
+    can never match a single-package snapshot.
+    """
+    return not getattr(args, "workspace", False)
+
+
+def template_hash() -> str:
+    """Hash the names and contents of every file in the template dir."""
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATE_DIR.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(TEMPLATE_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def uv_version() -> str:
+    """Return the installed uv version string."""
+    try:
+        result = run_command(
+            ["uv", "--version"],
+            capture_output=True,
+            check=True,
+            env=clean_env(),
+        )
+    except (subprocess.SubprocessError, FileNotFoundError) as e:
+        raise ProjectCreationError(
+            f"Could not determine uv version: {e}"
+        ) from e
+    return result.stdout.strip()
+
+
+def snapshot_key(args: Namespace) -> dict[str, str]:
+    """Collect everything a golden project depends on."""
+    user = get_user_config()
+    key = {option: str(getattr(args, option, False)) for option in KEY_OPTIONS}
+    key.update(
+        templates=template_hash(),
+        indexes=index_hash(),
+        uv=uv_version(),
+        uv_start=__version__,
+        author=user.author_name,
+        email=user.author_email,
+    )
+    return key
+
+
+def index_hash() -> str:
+    """Hash the package indexes new projects resolve against.
+
+    The ``[uv]`` index URLs are written into the project and the
+    environment variables override them for uv, so both count.
+    """
+    settings = load_uv_settings()
+    env = clean_env()
+    indexes: dict[str, object] = {
+        "index_url": settings.index_url,
+        "extra_index_urls": settings.extra_index_urls,
+        **{name: env.get(name) for name in INDEX_ENV},
+    }
+    encoded = json.dumps(indexes, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def snapshot_path(key: dict[str, str]) -> Path:
+    """Return the cache directory for a snapshot key."""
+    encoded = json.dumps(key, sort_keys=True).encode()
+    return CACHE_DIR / hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def materialise(
+    args: Namespace,
+    project_path: Path,
+    build: Callable[[Namespace, Path], None],
+) -> None:
+    """Create ``project_path`` from the golden snapshot for ``args``.
+
+    Args:
+        args: The project options.
+        project_path: Where the new project should be created.
+        build: Builds a project for the given options inside the given
+            parent directory; used to create a missing snapshot.
+    """
+    key = snapshot_key(args)
+    golden_root = snapshot_path(key)
+    if (golden_root / GOLDEN_NAME).exists():
+        report(f"[green]Using cached project snapshot {golden_root}[/green]")
+    else:
+        with span("build golden snapshot", "snapshot"):
+            _build_snapshot(args, key, golden_root, build)
+
+    with span("materialise snapshot", "snapshot"):
+        _copy_snapshot(golden_root / GOLDEN_NAME, project_path)
+        _rename_project(project_path, args.project_name)
+    report(
+        f"[green]✓[/green] Created '[bold]{args.project_name}[/bold]' "
+        "from cached snapshot"
+    )
+
+
+def _build_snapshot(
+    args: Namespace,
+    key: dict[str, str],
+    golden_root: Path,
+    build: Callable[[Namespace, Path], None],
+) -> None:
+    """Build a golden project and move it into the cache atomically."""
+    report("[green]Building project snapshot (first run only)...[/green]")
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    build_root = Path(tempfile.mkdtemp(prefix=".build-", dir=CACHE_DIR))
+    golden_args = Namespace(**{**vars(args), "project_name": GOLDEN_NAME})
+    try:
+        build(golden_args, build_root)
+        (build_root / "snapshot.json").write_text(
+            json.dumps(key, indent=2, sort_keys=True)
+        )
+        try:
+            build_root.rename(golden_root)
+        except OSError:
+            # Another run populated the same key first
+            shutil.rmtree(build_root)
+    except BaseException:
+        shutil.rmtree(build_root, ignore_errors=True)
+        raise
+
+
+def _copy_snapshot(golden: Path, project_path: Path) -> None:
+    """Copy the golden project, leaving the environment to ``uv sync``."""
+    shutil.copytree(
+        golden,
+        project_path,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(".venv"),
+    )
+
+
+def _rename_project(project_path: Path, project_name: str) -> None:
+    """Replace the placeholder name throughout the copied project."""
+    module_name = project_name.replace("-", "_")
+    golden_src = project_path / "src" / GOLDEN_MODULE
+    if golden_src.exists():
+        golden_src.rename(project_path / "src" / module_name)
+
+    for path in project_path.rglob("*"):
+        if (
+            ".git" in path.relative_to(project_path).parts
+            or not path.is_file()
+        ):
+            continue
+        try:
+            content = path.read_text()
+        except UnicodeDecodeError:
+            continue
+        if GOLDEN_NAME in content or GOLDEN_MODULE in content:
+            path.write_text(
+                content.replace(GOLDEN_NAME, project_name).replace(
+                    GOLDEN_MODULE, module_name
+                )
+            )
@@ -0,0 +1,83 @@
+"""Build projects out of sight and move them into place atomically.
+
+Phase 1 runs in a hidden staging directory next to the final project, so
+both are on the same filesystem and :func:`promote` is a single
+``rename``: other tools never see a half-built project. Anything that
+has to be discarded is first renamed to a trash name and then deleted by
+a detached process, so a failed run returns immediately even when the
+tree is large or the filesystem is slow.
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+from uv_start.exceptions import ProjectCreationError
+
+STAGING_MARKER = ".uv-start-staging-"
+TRASH_MARKER = ".uv-start-trash-"
+
+# Run by a detached interpreter to delete a trashed directory
+_RMTREE = "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)"
+
+
+def create_staging(original_cwd: Path, project_name: str) -> Path:
+    """Create a hidden staging directory beside the final project.
+
+    The project itself is built in ``<staging>/<project_name>``, so every
+    file that derives a name from its directory sees the real one.
+    """
+    return Path(
+        tempfile.mkdtemp(
+            prefix=f".{project_name}{STAGING_MARKER}", dir=original_cwd
+        )
+    )
+
+
+def promote(staged: Path, destination: Path) -> None:
+    """Move a staged project to ``destination`` with one rename.
+
+    Raises:
+        ProjectCreationError: If ``destination`` appeared in the meantime.
+    """
+    if destination.exists():
+        raise ProjectCreationError(
+            f"Cannot move the new project into place: {destination} "
+            "already exists"
+        )
+    try:
+        staged.rename(destination)
+    except OSError as e:
+        raise ProjectCreationError(
+            f"Cannot move the new project into place: {e}"
+        ) from e
+    staged.parent.rmdir()
+
+
+def discard(path: Path) -> bool:
+    """Rename ``path`` out of the way and delete it in the background.
+
+    Returns:
+        bool: Whether there was anything to discard.
+    """
+    if not path.exists():
+        return False
+    trash = path.with_name(f".{path.name}{TRASH_MARKER}{uuid.uuid4().hex[:8]}")
+    try:
+        path.rename(trash)
+    except OSError:
+        trash = path
+    try:
+        subprocess.Popen(
+            [sys.executable, "-c", _RMTREE, str(trash)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        shutil.rmtree(trash, ignore_errors=True)
+    return True
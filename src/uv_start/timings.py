@@ -0,0 +1,184 @@
+"""Per-step timing for uv-start runs.
+
+Phases, pipeline steps and every subprocess call (see :mod:`uv_start.runner`)
+are recorded as spans on the active :class:`TimingRecorder`. ``--timings``
+prints a summary table at the end of a run and ``--trace FILE`` writes the
+spans as Chrome trace-event JSON (open it in ``chrome://tracing`` or https://ui.perfetto.dev).
+
+Every span is also reported to the active reporter (see
+:mod:`uv_start.reporting`) when it starts and ends, which is what
+``--events json`` streams. When no recorder is active, :func:`span` only
+reports.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from rich.table import Table
+
+from uv_start.reporting import get_reporter
+
+
+@dataclass(frozen=True)
+class Span:
+    """A timed section of a run, relative to the recorder's start."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: str
+
+
+class TimingRecorder:
+    """Collect spans from all threads taking part in one run."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase") -> Iterator[None]:
+        """Record the wall-clock time spent inside the block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append(
+                    Span(
+                        name=name,
+                        category=category,
+                        start=start - self._origin,
+                        duration=end - start,
+                        thread=threading.current_thread().name,
+                    )
+                )
+
+    def summary_table(self) -> Table:
+        """Render the recorded spans in start order."""
+        table = Table(title="uv-start timings", title_justify="left")
+        table.add_column("Step", style="bold")
+        table.add_column("Kind", style="cyan")
+        table.add_column("Start (s)", justify="right")
+        table.add_column("Duration (s)", justify="right", style="green")
+        for span in sorted(self.spans, key=lambda s: s.start):
+            table.add_row(
+                span.name,
+                span.category,
+                f"{span.start:.2f}",
+                f"{span.duration:.2f}",
+            )
+        total = time.perf_counter() - self._origin
+        table.add_section()
+        table.add_row("total", "", "", f"{total:.2f}", style="bold")
+        return table
+
+    def write_trace(self, path: Path) -> None:
+        """Write the spans as Chrome trace-event JSON."""
+        pid = os.getpid()
+        thread_ids: dict[str, int] = {}
+        events: list[dict[str, Any]] = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            tid = thread_ids.setdefault(span.thread, len(thread_ids) + 1)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start * 1_000_000),
+                    "dur": round(span.duration * 1_000_000),
+                    "pid": pid,
+                    "tid": tid,
+                }
+            )
+        events.extend(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread},
+            }
+            for thread, tid in thread_ids.items()
+        )
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+        )
+
+
+def step_durations(spans: Iterable[Span]) -> dict[str, float]:
+    """Seconds spent in each phase and pipeline step, in start order."""
+    return {
+        span.name: span.duration
+        for span in sorted(spans, key=lambda s: s.start)
+        if span.category in ("phase", "step")
+    }
+
+
+_active: ContextVar[TimingRecorder | None] = ContextVar(
+    "uv_start_timing_recorder", default=None
+)
+
+
+@contextmanager
+def recording(recorder: TimingRecorder) -> Iterator[TimingRecorder]:
+    """Make ``recorder`` the active recorder inside the block."""
+    token = _active.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active.reset(token)
+
+
+_parent: ContextVar[str | None] = ContextVar(
+    "uv_start_parent_span", default=None
+)
+
+
+def current_span() -> str | None:
+    """Return the name of the innermost span being run, if any."""
+    return _parent.get()
+
+
+@contextmanager
+def span(
+    name: str, category: str = "phase", **details: Any
+) -> Iterator[dict[str, Any]]:
+    """Record a span on the active recorder, if any, and report it.
+
+    ``details`` (such as the command of a subprocess) go to the
+    reporter with the name of the enclosing span. The block receives
+    them and may add more, such as an exit code, before the span ends.
+    """
+    details = {"parent": _parent.get(), **details}
+    reporter = get_reporter()
+    reporter.started(name, category, details)
+    token = _parent.set(name)
+    start = time.perf_counter()
+    error = None
+    try:
+        recorder = _active.get()
+        if recorder is None:
+            yield details
+        else:
+            with recorder.span(name, category):
+                yield details
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _parent.reset(token)
+        reporter.finished(
+            name, category, details, time.perf_counter() - start, error
+        )
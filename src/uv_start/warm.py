@@ -0,0 +1,161 @@
+"""Pre-populate the uv and pre-commit caches.
+
+``uv-start warm`` installs the supported interpreters, resolves and
+installs every package uv-start adds to new projects, and builds the
+pre-commit hook environments pinned in the template
+``.pre-commit-config.yaml``. It runs without prompts, so it can be baked
+into CI images; later project creation is then served from the caches.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+from rich import print as rprint
+from rich.panel import Panel
+
+from uv_start.config import clean_env, load_retry_policy
+from uv_start.dev_deps import (
+    DATA_DEPENDENCIES,
+    DEV_DEPENDENCIES,
+    RUNTIME_DEPENDENCIES,
+    TEMPLATE_DIR,
+    DependencyPlan,
+    install_dependencies,
+)
+from uv_start.exceptions import DependencyError
+from uv_start.interpreters import forget_installed
+from uv_start.runner import run_command
+from uv_start.scheduler import Step, run_steps
+
+
+def warm_caches(
+    pythons: list[str], data: bool = True, hooks: bool = True
+) -> None:
+    """Fetch interpreters, packages and hook environments.
+
+    Each interpreter gets a throwaway project in a temporary directory;
+    the per-interpreter work runs concurrently. The hook environments do
+    not depend on the project's Python, so they are built once, in the
+    project of the first interpreter.
+
+    Raises:
+        DependencyError: If any download or install fails.
+    """
+    plan = DependencyPlan(
+        runtime=RUNTIME_DEPENDENCIES + (DATA_DEPENDENCIES if data else []),
+        dev=list(DEV_DEPENDENCIES),
+    )
+    with tempfile.TemporaryDirectory(prefix="uv-start-warm-") as tmp:
+        steps = [Step("pythons", lambda: _install_pythons(pythons))]
+        for python in pythons:
+            steps.append(
+                Step(
+                    f"packages {python}",
+                    _packages_step(python, _project_path(tmp, python), plan),
+                    depends_on=("pythons",),
+                )
+            )
+        if hooks:
+            first = pythons[0]
+            steps.append(
+                Step(
+                    "hooks",
+                    _hooks_step(_project_path(tmp, first)),
+                    depends_on=(f"packages {first}",),
+                )
+            )
+        run_steps(steps)
+
+    rprint(
+        Panel.fit(
+            f"[green]Caches warmed[/green] for Python {', '.join(pythons)}",
+            title="uv-start warm",
+            border_style="green",
+        )
+    )
+
+
+def _project_path(tmp: str, python: str) -> Path:
+    return Path(tmp) / f"warm-{python.replace('.', '-')}"
+
+
+def _install_pythons(pythons: list[str]) -> None:
+    """Download every requested interpreter that is not yet available."""
+    missing = [
+        python
+        for python in pythons
+        if run_command(
+            ["uv", "python", "find", python],
+            capture_output=True,
+            env=clean_env(),
+        ).returncode
+        != 0
+    ]
+    if not missing:
+        rprint("[green]All requested interpreters already installed[/green]")
+        return
+    try:
+        run_command(
+            ["uv", "python", "install", *missing],
+            check=True,
+            env=clean_env(),
+            retry=load_retry_policy(),
+        )
+    except subprocess.SubprocessError as e:
+        raise DependencyError(f"Failed to install Python: {e}") from e
+    forget_installed()
+
+
+def _packages_step(
+    python: str, project_path: Path, plan: DependencyPlan
+) -> Callable[[], None]:
+    """Return a step that installs the full dependency stack."""
+
+    def warm_packages() -> None:
+        try:
+            run_command(
+                [
+                    "uv",
+                    "init",
+                    project_path.name,
+                    "--lib",
+                    "--python",
+                    python,
+                ],
+                check=True,
+                cwd=project_path.parent,
+                env=clean_env(),
+            )
+        except subprocess.SubprocessError as e:
+            raise DependencyError(
+                f"Failed to create warm-up project for Python {python}: {e}"
+            ) from e
+        install_dependencies(plan, project_path)
+
+    return warm_packages
+
+
+def _hooks_step(project_path: Path) -> Callable[[], None]:
+    """Return a step that builds the pre-commit hook environments."""
+
+    def warm_hooks() -> None:
+        shutil.copy(
+            TEMPLATE_DIR / ".pre-commit-config.yaml",
+            project_path / ".pre-commit-config.yaml",
+        )
+        try:
+            run_command(
+                ["uv", "run", "pre-commit", "install-hooks"],
+                check=True,
+                cwd=project_path,
+                env=clean_env(),
+            )
+        except subprocess.SubprocessError as e:
+            raise DependencyError(
+                f"Failed to build pre-commit hook environments: {e}"
+            ) from e
+
+    return warm_hooks
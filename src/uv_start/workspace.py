@@ -0,0 +1,76 @@
+"""The layout of a generated project and its workspace members.
+
+A :class:`Workspace` is scanned once, right after the scaffold exists,
+and then handed to every step that touches member files. Per-member work
+goes through :func:`for_each`, which runs it on a thread pool.
+A plain (non-workspace) project is a workspace without members.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from uv_start.scheduler import run_each
+
+# Threads used for per-member file work
+MEMBER_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class Member:
+    """One package under ``packages/``."""
+
+    name: str
+    path: Path
+
+    @property
+    def module_name(self) -> str:
+        return self.name.replace("-", "_")
+
+    @property
+    def pyproject(self) -> Path:
+        return self.path / "pyproject.toml"
+
+    @property
+    def version_file(self) -> Path:
+        return self.path / "src" / self.module_name / "__init__.py"
+
+
+@dataclass(frozen=True)
+class Workspace:
+    """The project root and its members, in name order."""
+
+    root: Path
+    members: tuple[Member, ...] = ()
+
+    @classmethod
+    def scan(cls, root: Path) -> "Workspace":
+        """List the members under ``root/packages`` with one directory read."""
+        try:
+            entries = list((root / "packages").iterdir())
+        except FileNotFoundError:
+            return cls(root)
+        members = sorted(
+            (Member(path.name, path) for path in entries if path.is_dir()),
+            key=lambda member: member.name,
+        )
+        return cls(root, tuple(members))
+
+    @property
+    def pyprojects(self) -> list[Path]:
+        """The root pyproject.toml followed by every member's."""
+        return self.files("pyproject.toml")
+
+    def files(self, name: str) -> list[Path]:
+        """Return ``name`` in the root and in every member directory."""
+        return [self.root / name, *(m.path / name for m in self.members)]
+
+
+def for_each[T](func: Callable[[T], None], items: list[T]) -> None:
+    """Run ``func`` over ``items`` (usually one per member) concurrently."""
+    run_each(
+        func,
+        items,
+        max_workers=MEMBER_WORKERS,
+        thread_name_prefix="uv-start-member",
+    )
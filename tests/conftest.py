@@ -0,0 +1,19 @@
+import pytest
+
+from uv_start.config import reload_config
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(tmp_path, monkeypatch):
+    """Keep test runs out of the real run history."""
+    history = tmp_path / "history.jsonl"
+    monkeypatch.setattr("uv_start.history.HISTORY_FILE", history)
+    return history
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Read the (usually monkeypatched) config file anew in every test."""
+    reload_config()
+    yield
+    reload_config()
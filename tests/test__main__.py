@@ -1,12 +1,18 @@
 import os
 import shutil
+import time
 from argparse import Namespace
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from uv_start.__main__ import initialize_uv_start
-from uv_start.exceptions import DependencyError, GitSetupError
+from uv_start.exceptions import (
+    DependencyError,
+    GitSetupError,
+    PreflightError,
+)
 
 
 @pytest.fixture
@@ -230,6 +236,34 @@ def test_workspace_project(temp_project_dir):
     )
 
 
+def test_workspace_with_members(temp_project_dir):
+    """Test creating a workspace from --member flags, without prompts"""
+    project_name = "test-members"
+    project_path = temp_project_dir / project_name
+
+    args = Namespace(
+        project_name=project_name,
+        type="lib",
+        python="3.12",
+        workspace=True,
+        members=[("core", "lib"), ("api", "app")],
+        github=False,
+    )
+
+    with patch("rich.prompt.Prompt.ask") as mock_ask:
+        initialize_uv_start(args)
+
+    mock_ask.assert_not_called()
+    for member in ["core", "api"]:
+        assert (project_path / "packages" / member / "src" / member).exists()
+        assert not (project_path / "packages" / member / ".git").exists()
+    pyproject_content = (project_path / "pyproject.toml").read_text()
+    assert '"packages/core"' in pyproject_content
+    assert "core = { workspace = true" in pyproject_content
+    assert "api = { workspace = true" in pyproject_content
+    assert (project_path / "uv.lock").exists()
+
+
 def test_project_with_different_python(temp_project_dir):
     """Test creating a project with different Python version"""
     project_name = "test-python"
@@ -250,6 +284,29 @@ def test_project_with_different_python(temp_project_dir):
     assert 'python = ">=3.11"' in pyproject_content
 
 
+def test_no_sync_project(temp_project_dir):
+    """Test that --no-sync writes the lockfile but no environment"""
+    project_name = "test-no-sync"
+    project_path = temp_project_dir / project_name
+
+    args = Namespace(
+        project_name=project_name,
+        type="lib",
+        python="3.12",
+        workspace=False,
+        github=False,
+        sync="none",
+    )
+
+    initialize_uv_start(args)
+
+    assert (project_path / "uv.lock").exists()
+    assert "ruff" in (project_path / "pyproject.toml").read_text()
+    assert not (project_path / ".venv").exists()
+    assert not (project_path / ".git" / "hooks" / "pre-commit").exists()
+    assert not (project_path / ".uv-start").exists()
+
+
 def test_rollback_on_phase1_failure(temp_project_dir):
     """Test that project directory is removed when Phase 1 fails."""
     project_name = "test-rollback"
@@ -264,7 +321,7 @@ def test_rollback_on_phase1_failure(temp_project_dir):
     )
 
     with patch(
-        "uv_start.__main__.add_dev_dependencies",
+        "uv_start.pipeline.install_dependencies",
         side_effect=DependencyError("mock dep failure"),
     ):
         with pytest.raises(SystemExit) as exc_info:
@@ -276,6 +333,55 @@ def test_rollback_on_phase1_failure(temp_project_dir):
     assert not project_path.exists(), (
         "Project directory should be removed after rollback"
     )
+    _wait_until_empty(temp_project_dir)
+
+
+def test_failure_after_move_into_place_is_resumable(temp_project_dir):
+    """Test that a provisioning failure keeps the project for --resume."""
+    project_name = "test-provision-fail"
+    project_path = temp_project_dir / project_name
+
+    args = Namespace(
+        project_name=project_name,
+        type="lib",
+        python="3.12",
+        workspace=False,
+        github=False,
+    )
+
+    with (
+        patch(
+            "uv_start.pipeline.provision",
+            side_effect=DependencyError("mock sync failure"),
+        ),
+        pytest.raises(SystemExit),
+    ):
+        initialize_uv_start(args)
+
+    journal = project_path / ".uv-start" / "journal.json"
+    assert journal.exists()
+    assert (project_path / "uv.lock").exists()
+    assert [p.name for p in temp_project_dir.iterdir()] == [project_name]
+
+    with (
+        patch("uv_start.pipeline.provision") as mock_provision,
+        patch(
+            "uv_start.pipeline.install_dependencies",
+            side_effect=AssertionError("dependencies installed twice"),
+        ),
+    ):
+        initialize_uv_start(Namespace(resume=project_name))
+
+    mock_provision.assert_called_once_with(project_path, hooks=True)
+    assert not journal.parent.exists()
+
+
+def _wait_until_empty(directory: Path, timeout: float = 10) -> None:
+    """Wait for the background rollback to delete the trashed tree."""
+    deadline = time.monotonic() + timeout
+    while any(directory.iterdir()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(directory.iterdir()), "staging or trash left behind"
 
 
 def test_github_failure_keeps_project(temp_project_dir):
@@ -292,9 +398,13 @@ def test_github_failure_keeps_project(temp_project_dir):
         private=False,
     )
 
-    with patch(
-        "uv_start.__main__.setup_git_repo",
-        side_effect=GitSetupError("mock gh failure"),
+    with (
+        # gh is neither installed nor authenticated here
+        patch("uv_start.pipeline.run_preflight"),
+        patch(
+            "uv_start.pipeline.create_github_repo",
+            side_effect=GitSetupError("mock gh failure"),
+        ),
     ):
         # Should NOT raise — just warn
         initialize_uv_start(args)
@@ -306,3 +416,27 @@ def test_github_failure_keeps_project(temp_project_dir):
     assert (project_path / "pyproject.toml").exists(), (
         "pyproject.toml should exist after GitHub failure"
     )
+
+
+def test_preflight_failure_creates_nothing(temp_project_dir):
+    """Test that a failed preflight check aborts before any work."""
+    args = Namespace(
+        project_name="test-preflight",
+        type="lib",
+        python="3.12",
+        workspace=False,
+        github=False,
+    )
+
+    with (
+        patch(
+            "uv_start.pipeline.run_preflight",
+            side_effect=PreflightError("gh is not authenticated"),
+        ),
+        patch("uv_start.pipeline.CommandDispatcher") as mock_dispatcher,
+        pytest.raises(SystemExit),
+    ):
+        initialize_uv_start(args)
+
+    mock_dispatcher.assert_not_called()
+    assert not any(temp_project_dir.iterdir())
@@ -0,0 +1,105 @@
+from unittest.mock import patch
+
+import pytest
+
+from uv_start import ProjectSpec, create_project, resume_project
+from uv_start.cli import parse_args
+from uv_start.exceptions import ConfigError, GitSetupError
+from uv_start.history import load_runs
+from uv_start.timings import span
+
+
+def test_spec_to_args_matches_command_line():
+    spec = ProjectSpec(
+        "my-lib",
+        python="3.12",
+        members=(("core", "lib"), ("api", "app")),
+        github=True,
+        private=True,
+        sync="none",
+    )
+
+    argv = "my-lib -p 3.12 -m core -m api:app -g --private --no-sync"
+    assert spec.to_args() == parse_args(argv.split())
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"name": "my_lib"},
+        {"name": "my-lib", "type": "service"},
+        {"name": "my-lib", "python": "2.7"},
+        {"name": "my-lib", "sync": "later"},
+        {"name": "my-lib", "members": (("core", "cli"),)},
+        {"name": "my-lib", "members": (("my-lib", "lib"),)},
+        {"name": "my-lib", "workspace": True},
+        {"name": "my-lib", "private": True},
+    ],
+)
+def test_spec_rejects_invalid_options(options):
+    with pytest.raises(ConfigError):
+        ProjectSpec(**options)
+
+
+def _fake_phase_1(args, original_cwd, journal):
+    with span("scaffold", "step"), span("uv init", "subprocess"):
+        pass
+    return original_cwd / args.project_name, journal
+
+
+def test_create_project_returns_steps(tmp_path):
+    with (
+        patch("uv_start.api.create_local_project", side_effect=_fake_phase_1),
+        patch("uv_start.api.publish_project") as mock_publish,
+    ):
+        result = create_project(ProjectSpec("my-lib"), tmp_path)
+
+    assert result.path == tmp_path / "my-lib"
+    assert list(result.steps) == ["scaffold"]
+    assert [span.name for span in result.spans] == ["uv init", "scaffold"]
+    assert result.publish_error is None
+    mock_publish.assert_called_once()
+
+
+def test_create_project_returns_publish_error(tmp_path):
+    error = GitSetupError("gh is down")
+    with (
+        patch("uv_start.api.create_local_project", side_effect=_fake_phase_1),
+        patch("uv_start.api.publish_project", side_effect=error),
+    ):
+        result = create_project(ProjectSpec("my-lib", github=True), tmp_path)
+
+    assert result.publish_error is error
+    assert result.path == tmp_path / "my-lib"
+
+
+def test_resume_project_without_journal(tmp_path):
+    with pytest.raises(ConfigError, match="Nothing to resume"):
+        resume_project("my-lib", tmp_path)
+
+
+def test_create_project_is_quiet(tmp_path, capsys):
+    """Test a real run prints nothing and times every step."""
+    result = create_project(
+        ProjectSpec("quiet-lib", python="3.12", sync="none"), tmp_path
+    )
+
+    assert (result.path / "uv.lock").exists()
+    assert {"preflight", "scaffold", "dependencies"} <= set(result.steps)
+    assert capsys.readouterr() == ("", "")
+
+
+def test_create_project_records_history(tmp_path, isolated_history):
+    with (
+        patch(
+            "uv_start.api.create_local_project",
+            side_effect=ConfigError("no space"),
+        ),
+        patch("uv_start.history._uv_version", return_value=None),
+        pytest.raises(ConfigError),
+    ):
+        create_project(ProjectSpec("my-lib", type="package"), tmp_path)
+
+    (run,) = load_runs(isolated_history)
+    assert (run.ok, run.error) == (False, "no space")
+    assert run.project_type == "package"
@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from uv_start.batch import load_manifest, run_batch, summary_table
+from uv_start.exceptions import ConfigError, DependencyError, GitSetupError
+
+MANIFEST = """
+[defaults]
+python = "3.12"
+
+[[project]]
+name = "study-utils"
+type = "package"
+
+[[project]]
+name = "study-analysis"
+data = true
+python = "3.13"
+"""
+
+
+def write_manifest(tmp_path, content: str):
+    path = tmp_path / "manifest.toml"
+    path.write_text(content)
+    return path
+
+
+def test_load_manifest_applies_defaults(tmp_path):
+    projects = load_manifest(write_manifest(tmp_path, MANIFEST))
+
+    utils, analysis = projects
+    assert utils.project_name == "study-utils"
+    assert utils.type == "package"
+    assert utils.python == "3.12"
+    assert utils.data is False
+    assert analysis.data is True
+    assert analysis.python == "3.13"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '[[project]]\nname = "a"\nworkspace = true\n',
+        '[[project]]\nname = "a"\ncolour = "red"\n',
+        '[[project]]\nname = "a"\npython = "2.7"\n',
+        '[[project]]\nname = "a"\nprivate = true\n',
+        '[[project]]\nname = "a"\n[[project]]\nname = "a"\n',
+        '[[project]]\ntype = "lib"\n',
+        "[defaults]\n",
+        "not toml",
+    ],
+)
+def test_load_manifest_rejects_invalid_entries(tmp_path, content):
+    with pytest.raises(ConfigError):
+        load_manifest(write_manifest(tmp_path, content))
+
+
+@pytest.mark.parametrize(
+    ("value", "key"),
+    [
+        ("python = 3.12", "python"),
+        ("python = 3", "python"),
+        ('python = ["3.12"]', "python"),
+        ("type = false", "type"),
+        ('github = "yes"', "github"),
+        ("data = 1", "data"),
+    ],
+)
+def test_load_manifest_rejects_wrong_value_types(tmp_path, value, key):
+    manifest = write_manifest(tmp_path, f'[[project]]\nname = "a"\n{value}\n')
+
+    with pytest.raises(ConfigError, match=f"Project 'a': '{key}' must be"):
+        load_manifest(manifest)
+
+
+def test_load_manifest_missing_file(tmp_path):
+    with pytest.raises(ConfigError):
+        load_manifest(tmp_path / "missing.toml")
+
+
+def test_run_batch_reports_each_project(tmp_path):
+    projects = load_manifest(
+        write_manifest(
+            tmp_path,
+            '[[project]]\nname = "ok"\n'
+            '[[project]]\nname = "broken"\n'
+            '[[project]]\nname = "no-github"\n',
+        )
+    )
+
+    def create(args):
+        if args.project_name == "broken":
+            raise DependencyError("uv sync failed")
+        if args.project_name == "no-github":
+            raise GitSetupError("gh not authenticated")
+
+    results = run_batch(projects, create, jobs=2)
+
+    assert [(r.name, r.ok) for r in results] == [
+        ("ok", True),
+        ("broken", False),
+        ("no-github", True),
+    ]
+    assert results[1].detail == "uv sync failed"
+    assert "GitHub setup failed" in results[2].detail
+    assert summary_table(results).row_count == 3
+
+
+def test_run_batch_caps_concurrency(tmp_path):
+    projects = load_manifest(
+        write_manifest(
+            tmp_path,
+            "".join(f'[[project]]\nname = "p{i}"\n' for i in range(6)),
+        )
+    )
+    lock = threading.Lock()
+    running = peak = 0
+
+    def create(args):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    run_batch(projects, create, jobs=2)
+
+    assert peak == 2
+
+
+def test_load_manifest_workspace_members(tmp_path):
+    (project,) = load_manifest(
+        write_manifest(
+            tmp_path,
+            '[[project]]\nname = "platform"\nmembers = ["core", "api:app"]\n',
+        )
+    )
+
+    assert project.workspace is True
+    assert project.members == [("core", "lib"), ("api", "app")]
@@ -1,9 +1,17 @@
 from argparse import ArgumentTypeError
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from uv_start.cli import parse_args, validate_project_name
+from uv_start.cli import (
+    PYTHON_VERSIONS,
+    parse_args,
+    parse_batch_args,
+    parse_stats_args,
+    parse_warm_args,
+    validate_project_name,
+)
 
 
 def test_validate_project_name_valid():
@@ -25,13 +33,48 @@ def test_validate_project_name_with_underscore():
 
 
 # Test argument parsing
+@pytest.mark.parametrize(
+    ("parse", "section"),
+    [
+        (parse_args, "Commands:"),
+        (parse_warm_args, "--no-hooks"),
+        (parse_batch_args, "--jobs"),
+        (parse_stats_args, "--last"),
+    ],
+)
+def test_help_is_rich(capsys, parse, section):
+    with (
+        patch("uv_start.cli.listed_versions", return_value=("3.13",)),
+        pytest.raises(SystemExit) as exc,
+    ):
+        parse(["--help"])
+
+    out = capsys.readouterr().out
+    assert exc.value.code == 0
+    assert "UV Init Help" in out
+    assert "Description:" in out
+    assert section in out
+    # argparse's own help starts with a lowercase "usage:"
+    assert "usage:" not in out
+
+
+def test_errors_are_rich(capsys):
+    with pytest.raises(SystemExit) as exc:
+        parse_args(["my-lib", "--type", "nope"])
+
+    out = capsys.readouterr().out
+    assert exc.value.code == 2
+    assert "Command Line Error" in out
+    assert "Usage:" in out
+
+
 def test_parse_args_defaults(capsys):
     """Test parsing arguments with defaults"""
     with patch("sys.argv", ["uv-start", "my-project"]):
         args = parse_args()
         assert args.project_name == "my-project"
         assert args.type == "lib"  # Default type should be lib
-        assert args.python == "3.13"
+        assert args.python == "auto"
         assert args.workspace is False
 
 
@@ -79,3 +122,121 @@ def test_parse_args_no_project_name_no_config():
     """Test that missing project_name without --config is an error"""
     with patch("sys.argv", ["uv-start"]), pytest.raises(SystemExit):
         parse_args()
+
+
+def test_parse_args_timings():
+    """Test --timings and --trace flags"""
+    with patch(
+        "sys.argv",
+        ["uv-start", "my-project", "--timings", "--trace", "trace.json"],
+    ):
+        args = parse_args()
+        assert args.timings is True
+        assert args.trace == Path("trace.json")
+
+
+def test_parse_warm_args_defaults():
+    """Test uv-start warm defaults to every supported interpreter"""
+    args = parse_warm_args([])
+    assert args.pythons == PYTHON_VERSIONS
+    assert args.data is True
+    assert args.hooks is True
+
+
+def test_parse_warm_args_options():
+    args = parse_warm_args(["-p", "3.13", "-p", "3.12", "--no-hooks"])
+    assert args.pythons == ["3.13", "3.12"]
+    assert args.hooks is False
+
+
+def test_parse_warm_args_invalid_python():
+    with pytest.raises(SystemExit):
+        parse_warm_args(["-p", "2.7"])
+
+
+def test_parse_batch_args():
+    args = parse_batch_args(["projects.toml", "--jobs", "4"])
+    assert args.manifest == Path("projects.toml")
+    assert args.jobs == 4
+
+
+def test_parse_batch_args_rejects_zero_jobs():
+    with pytest.raises(SystemExit):
+        parse_batch_args(["projects.toml", "-j", "0"])
+
+
+def test_parse_args_members_imply_workspace():
+    args = parse_args(["my-ws", "--member", "core", "-m", "api:app"])
+    assert args.workspace is True
+    assert args.members == [("core", "lib"), ("api", "app")]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["my-ws", "--member", "core:cli"],
+        ["my-ws", "--member", "my_core"],
+        ["my-ws", "--member", ":lib"],
+        ["my-ws", "-m", "core", "-m", "core:app"],
+        ["my-ws", "-m", "my-ws"],
+    ],
+)
+def test_parse_args_invalid_members(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_parse_args_resume():
+    args = parse_args(["--resume", "my-lib"])
+    assert args.resume == "my-lib"
+    assert args.project_name is None
+
+
+def test_parse_args_resume_rejects_project_name():
+    with pytest.raises(SystemExit):
+        parse_args(["my-lib", "--resume", "my-lib"])
+
+
+@pytest.mark.parametrize(
+    ("argv", "sync"),
+    [
+        ([], "full"),
+        (["--no-sync"], "none"),
+        (["--background-sync"], "background"),
+    ],
+)
+def test_parse_args_sync_modes(argv, sync):
+    assert parse_args(["my-lib", *argv]).sync == sync
+
+
+def test_parse_args_sync_modes_are_exclusive():
+    with pytest.raises(SystemExit):
+        parse_args(["my-lib", "--no-sync", "--background-sync"])
+
+
+def test_parse_args_events():
+    assert parse_args(["my-lib"]).events == "console"
+    assert parse_args(["my-lib", "--events", "json"]).events == "json"
+    assert parse_args(["my-lib", "--events", "live"]).events == "live"
+    assert parse_args(["my-lib", "--events", "live", "--timings"]).timings
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["my-lib", "--events", "xml"],
+        ["my-lib", "--events", "json", "--timings"],
+        ["my-ws", "--events", "json", "--workspace"],
+        ["my-ws", "--events", "live", "--workspace"],
+    ],
+)
+def test_parse_args_invalid_events(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_parse_stats_args():
+    assert parse_stats_args([]).last is None
+    assert parse_stats_args(["--last", "20"]).last == 20
+    with pytest.raises(SystemExit):
+        parse_stats_args(["--last", "0"])
@@ -0,0 +1,155 @@
+import io
+from argparse import Namespace
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from uv_start.history import (
+    Estimate,
+    Run,
+    estimate,
+    load_runs,
+    percentile,
+    record_run,
+    regressions,
+    step_table,
+    type_table,
+)
+from uv_start.timings import Span
+
+
+def _run(
+    steps: dict[str, float],
+    uv_start: str = "0.5.2",
+    ok: bool = True,
+    project_type: str = "lib",
+) -> Run:
+    return Run(
+        time=0.0,
+        uv_start=uv_start,
+        uv="uv 0.9.0",
+        project_type=project_type,
+        ok=ok,
+        duration=sum(steps.values()),
+        steps=steps,
+    )
+
+
+def test_record_run_appends_to_history(isolated_history):
+    args = Namespace(type="lib", python="3.13", data=False, workspace=False)
+    spans = [
+        Span("scaffold", "step", 0.1, 0.5, "main"),
+        Span("uv init", "subprocess", 0.1, 0.4, "main"),
+        Span("preflight", "phase", 0.0, 0.1, "main"),
+    ]
+    with patch("uv_start.history._uv_version", return_value="uv 0.9.0"):
+        record_run(args, spans, 0.6)
+        record_run(args, spans, 0.2, error=OSError("disk full"))
+
+    first, second = load_runs(isolated_history)
+    assert first.steps == {"preflight": 0.1, "scaffold": 0.5}
+    assert first.phases == ["preflight"]
+    assert first.options == {
+        "type": "lib",
+        "python": "3.13",
+        "workspace": False,
+        "data": False,
+    }
+    assert (first.ok, first.uv) == (True, "uv 0.9.0")
+    assert (second.ok, second.error) == (False, "disk full")
+
+
+def test_load_runs_skips_unreadable_lines(tmp_path):
+    history = tmp_path / "history.jsonl"
+    history.write_text('not json\n{"unknown": 1}\n')
+
+    assert load_runs(history) == []
+    assert load_runs(tmp_path / "missing.jsonl") == []
+
+
+@pytest.mark.parametrize(
+    ("q", "expected"), [(0.0, 1.0), (0.5, 2.5), (0.95, 3.85), (1.0, 4.0)]
+)
+def test_percentile(q, expected):
+    assert percentile([4.0, 1.0, 3.0, 2.0], q) == pytest.approx(expected)
+
+
+def test_regressions_after_upgrade():
+    runs = [
+        *(_run({"dependencies": 4.0, "scaffold": 0.2}, "0.5.1") for _ in "ab"),
+        _run({"dependencies": 9.0}, "0.5.1", ok=False),
+        *(_run({"dependencies": 6.0, "scaffold": 0.3}) for _ in "ab"),
+    ]
+
+    previous, current, slower = regressions(runs)
+
+    assert previous == "uv-start 0.5.1, uv 0.9.0"
+    assert current == "uv-start 0.5.2, uv 0.9.0"
+    # scaffold grew by half, but only by 0.1s
+    assert slower == [("lib", "dependencies", 4.0, 6.0)]
+
+
+def test_regressions_compare_like_with_like():
+    runs = [
+        *(_run({"dependencies": 4.0}, "0.5.1") for _ in "ab"),
+        *(_run({"dependencies": 9.0}, project_type="workspace") for _ in "ab"),
+        replace(_run({"dependencies": 20.0}), resumed=True),
+        _run({"dependencies": 4.0}),
+    ]
+
+    # Slower workspaces and a resumed run are no regression for libs
+    assert regressions(runs)[2] == []
+
+
+def test_no_regressions_without_upgrade():
+    assert regressions([_run({"scaffold": 0.2})]) is None
+    assert regressions([]) is None
+
+
+def test_estimate_uses_complete_runs_like_this_one():
+    args = Namespace(type="lib", sync="full", cache=False)
+    runs = [
+        _run({"preflight": 0.1, "dependencies": 2.0}),
+        replace(
+            _run({"preflight": 0.3, "dependencies": 4.0}),
+            phases=["preflight"],
+        ),
+        _run({"dependencies": 30.0}, ok=False),
+        _run({"dependencies": 30.0}, project_type="app"),
+        replace(_run({"dependencies": 30.0}), resumed=True),
+        replace(_run({"dependencies": 0.1}), options={"sync": "none"}),
+    ]
+
+    expected = estimate(args, runs)
+
+    assert expected.runs == 2
+    assert expected.total == pytest.approx(3.2)
+    assert expected.steps == pytest.approx(
+        {"preflight": 0.2, "dependencies": 3.0}
+    )
+    assert expected.phases == ("preflight",)
+    assert estimate(args, []) == Estimate(0, None, {})
+
+
+def _render(table) -> list[list[str]]:
+    console = Console(file=io.StringIO(), width=120)
+    console.print(table)
+    lines = console.file.getvalue().splitlines()
+    return [line.replace("│", " ").split() for line in lines if "│" in line]
+
+
+def test_tables_use_successful_runs():
+    runs = [
+        _run({"scaffold": 1.0}),
+        _run({"scaffold": 3.0}, project_type="data"),
+        _run({"scaffold": 9.0}, ok=False),
+        replace(_run({"scaffold": 0.1}), resumed=True),
+    ]
+
+    assert _render(step_table(runs)) == [["scaffold", "2", "2.00", "2.90"]]
+    assert _render(type_table(runs)) == [
+        ["data", "1", "3.00", "3.00", "0"],
+        ["lib", "1", "1.00", "1.00", "1"],
+    ]
@@ -0,0 +1,150 @@
+import json
+import subprocess
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from uv_start.exceptions import PreflightError
+from uv_start.interpreters import (
+    forget_installed,
+    installed_versions,
+    listed_versions,
+    resolve_python,
+)
+
+SUPPORTED = ["3.14", "3.13", "3.12", "3.11", "3.10"]
+
+
+def _entry(major, minor, patch=0, implementation="cpython", variant=None):
+    entry = {
+        "implementation": implementation,
+        "version_parts": {"major": major, "minor": minor, "patch": patch},
+        "path": f"/usr/bin/python{major}.{minor}",
+    }
+    if variant:
+        entry["variant"] = variant
+    return entry
+
+
+LISTING = [
+    _entry(3, 11, 2),
+    _entry(3, 13, 5),
+    _entry(3, 13, 0),
+    _entry(3, 14, 0, variant="freethreaded"),
+    _entry(3, 10, implementation="pypy"),
+]
+
+
+@pytest.fixture(autouse=True)
+def listing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "uv_start.interpreters.LISTING_FILE", tmp_path / "pythons.json"
+    )
+    installed_versions.cache_clear()
+    yield tmp_path / "pythons.json"
+    installed_versions.cache_clear()
+
+
+@pytest.fixture
+def mock_run():
+    with patch("uv_start.runner.run_command") as mock_run:
+        mock_run.return_value = Mock(stdout=json.dumps(LISTING))
+        yield mock_run
+
+
+def test_installed_versions_newest_first(mock_run):
+    assert installed_versions() == ("3.13", "3.11")
+    assert "--only-installed" in mock_run.call_args.args[0]
+
+
+def test_installed_versions_listed_once_per_ttl(mock_run, listing_file):
+    installed_versions()
+    installed_versions.cache_clear()  # a new run
+
+    assert installed_versions() == ("3.13", "3.11")
+    mock_run.assert_called_once()
+    assert json.loads(listing_file.read_text())["versions"] == [
+        "3.13",
+        "3.11",
+    ]
+
+
+def test_stale_listing_is_refreshed(mock_run, listing_file):
+    listing_file.write_text(
+        json.dumps({"created": time.time() - 7200, "versions": ["3.10"]})
+    )
+
+    assert installed_versions() == ("3.13", "3.11")
+
+
+def test_forget_installed(mock_run, listing_file):
+    installed_versions()
+
+    forget_installed()
+
+    assert not listing_file.exists()
+    installed_versions()
+    assert mock_run.call_count == 2
+
+
+def test_listed_versions_never_runs_uv(mock_run, listing_file):
+    assert listed_versions() is None
+
+    listing_file.write_text(
+        json.dumps({"created": time.time(), "versions": ["3.12"]})
+    )
+    assert listed_versions() == ("3.12",)
+    mock_run.assert_not_called()
+
+
+def test_listing_failure_is_not_cached(mock_run, listing_file):
+    mock_run.side_effect = subprocess.CalledProcessError(2, "uv")
+
+    with pytest.raises(subprocess.CalledProcessError):
+        installed_versions()
+    assert not listing_file.exists()
+    mock_run.side_effect = None
+    assert installed_versions() == ("3.13", "3.11")
+
+
+def test_listing_timeout_is_passed_to_uv(mock_run):
+    installed_versions(2.0)
+
+    assert mock_run.call_args.kwargs["timeout"] == 2.0
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        subprocess.CalledProcessError(2, "uv", stderr="error: broken\n"),
+        Mock(stdout="not json"),
+    ],
+)
+def test_resolve_python_reports_listing_failures(mock_run, failure):
+    if isinstance(failure, Exception):
+        mock_run.side_effect = failure
+    else:
+        mock_run.return_value = failure
+
+    with pytest.raises(PreflightError, match="could not") as excinfo:
+        resolve_python("auto", SUPPORTED)
+    assert "no installed Python" not in str(excinfo.value)
+
+
+def test_resolve_python_auto(mock_run):
+    assert resolve_python("auto", SUPPORTED) == "3.13"
+    assert resolve_python("3.12", SUPPORTED) == "3.12"
+
+
+def test_resolve_python_auto_without_interpreters(mock_run):
+    mock_run.return_value = Mock(stdout="[]")
+
+    with pytest.raises(PreflightError, match="--python"):
+        resolve_python("auto", SUPPORTED)
+
+
+def test_explicit_version_never_lists(mock_run):
+    resolve_python("3.10", SUPPORTED)
+
+    mock_run.assert_not_called()
@@ -0,0 +1,118 @@
+from argparse import Namespace
+
+import pytest
+
+from uv_start.exceptions import ConfigError
+from uv_start.journal import Journal, find_journal
+from uv_start.scheduler import Step, run_steps
+from uv_start.staging import create_staging
+
+
+def _args():
+    return Namespace(
+        project_name="my-lib",
+        type="lib",
+        python="3.13",
+        workspace=True,
+        members=[("core", "lib")],
+        github=False,
+        timings=True,
+    )
+
+
+def test_record_round_trips_project_options(tmp_path):
+    journal = Journal(tmp_path / "my-lib", _args())
+    (tmp_path / "my-lib").mkdir()
+
+    journal.record("scaffold")
+    loaded = Journal.load(tmp_path / "my-lib")
+
+    assert loaded.completed == ["scaffold"]
+    assert loaded.args.members == [("core", "lib")]
+    assert loaded.args.python == "3.13"
+    # Per-run options are not part of the project
+    assert not hasattr(loaded.args, "timings")
+
+
+def test_wrap_skips_finished_steps(tmp_path):
+    (tmp_path / "my-lib").mkdir()
+    journal = Journal(tmp_path / "my-lib", _args(), ["scaffold"])
+    ran = []
+    steps = [
+        Step("scaffold", lambda: ran.append("scaffold")),
+        Step(
+            "dependencies",
+            lambda: ran.append("dependencies"),
+            depends_on=("scaffold",),
+        ),
+    ]
+
+    run_steps(journal.wrap(steps))
+
+    assert ran == ["dependencies"]
+    assert Journal.load(tmp_path / "my-lib").completed == [
+        "scaffold",
+        "dependencies",
+    ]
+    assert journal.worth_keeping()
+
+
+def test_failed_step_is_not_recorded(tmp_path):
+    (tmp_path / "my-lib").mkdir()
+    journal = Journal(tmp_path / "my-lib", _args())
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        journal.run("dependencies", fail)
+
+    assert not journal.done("dependencies")
+    assert not journal.worth_keeping()
+
+
+def test_find_journal_prefers_project_then_staging(tmp_path):
+    staging = create_staging(tmp_path, "my-lib")
+    (staging / "my-lib").mkdir()
+    Journal(staging / "my-lib", _args()).record("scaffold")
+
+    assert find_journal(tmp_path, "my-lib").project_path == (
+        staging / "my-lib"
+    )
+
+    (tmp_path / "my-lib").mkdir()
+    Journal(tmp_path / "my-lib", _args()).record("promote")
+
+    assert find_journal(tmp_path, "my-lib").project_path == (
+        tmp_path / "my-lib"
+    )
+
+
+def test_find_journal_without_journal(tmp_path):
+    (tmp_path / "my-lib").mkdir()
+
+    with pytest.raises(ConfigError):
+        find_journal(tmp_path, "my-lib")
+
+
+def test_remove_deletes_journal_dir(tmp_path):
+    (tmp_path / "my-lib").mkdir()
+    journal = Journal(tmp_path / "my-lib", _args())
+    journal.record("scaffold")
+
+    journal.remove()
+
+    assert not (tmp_path / "my-lib" / ".uv-start").exists()
+    assert (tmp_path / "my-lib").exists()
+
+
+def test_remove_keeps_other_files(tmp_path):
+    (tmp_path / "my-lib").mkdir()
+    journal = Journal(tmp_path / "my-lib", _args())
+    journal.record("scaffold")
+    (journal.path.parent / "sync.log").write_text("")
+
+    journal.remove()
+
+    assert not journal.path.exists()
+    assert (journal.path.parent / "sync.log").exists()
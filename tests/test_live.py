@@ -0,0 +1,144 @@
+import io
+import subprocess
+import sys
+
+import pytest
+from rich.console import Console
+
+from uv_start.history import Estimate
+from uv_start.live import LiveReporter
+from uv_start.reporting import reporting
+from uv_start.runner import run_command
+from uv_start.timings import span
+
+
+def _live(estimate: Estimate | None = None) -> LiveReporter:
+    console = Console(file=io.StringIO(), width=100, highlight=False)
+    return LiveReporter(estimate or Estimate(0, None, {}), console)
+
+
+def _render(reporter: LiveReporter) -> str:
+    console = Console(file=io.StringIO(), width=100, highlight=False)
+    console.print(reporter._render())
+    return console.file.getvalue()
+
+
+def test_command_output_goes_to_the_pane_of_its_step():
+    reporter = _live()
+    cmd = [sys.executable, "-c", "print('resolved 3 packages')"]
+    with reporting(reporter), span("phase 1: local project"):
+        with span("dependencies", "step"):
+            run_command(cmd)
+            running = _render(reporter)
+        with span("templates", "step"):
+            pass
+
+    assert "dependencies" in running
+    assert "resolved 3 packages" in running
+    assert "(usually" not in running
+    # Finished steps collapse to their line count
+    done = _render(reporter)
+    assert "resolved 3 packages" not in done
+    assert "· 1 lines" in done
+    assert done.index("dependencies") < done.index("templates")
+    assert "  dependencies" in done
+    assert "no earlier runs like this one" in done
+
+
+def test_failed_step_keeps_its_output_expanded():
+    reporter = _live()
+    cmd = [sys.executable, "-c", "print('boom'); raise SystemExit(1)"]
+    with (
+        reporting(reporter),
+        span("phase 1: local project"),
+        pytest.raises(subprocess.CalledProcessError),
+        span("dependencies", "step"),
+    ):
+        run_command(cmd, check=True)
+
+    rendered = _render(reporter)
+    assert "✗" in rendered
+    assert "boom" in rendered
+
+
+def test_expected_steps_are_listed_with_the_eta():
+    expected = Estimate(
+        runs=4, total=600.0, steps={"preflight": 0.5, "dependencies": 3.0}
+    )
+    reporter = _live(expected)
+    with reporting(reporter), span("preflight"):
+        rendered = _render(reporter)
+
+    assert "dependencies" in rendered
+    assert "(usually 3.0s)" in rendered
+    assert "left (p50 600.0s of 4 earlier runs)" in rendered
+
+
+def test_eta_counts_the_phases_still_to_finish():
+    expected = Estimate(
+        runs=4,
+        total=600.0,
+        steps={
+            "preflight": 10.0,
+            "phase 1: local project": 40.0,
+            "dependencies": 30.0,
+            "phase 2: git/GitHub": 20.0,
+        },
+        phases=("preflight", "phase 1: local project", "phase 2: git/GitHub"),
+    )
+    reporter = _live(expected)
+    with reporting(reporter):
+        with span("preflight"):
+            preflight = _render(reporter)
+        with (
+            span("phase 1: local project"),
+            span("dependencies", "step"),
+        ):
+            dependencies = _render(reporter)
+        with span("phase 2: git/GitHub"):
+            reporter._rows["phase 2: git/GitHub"].started -= 25.0
+            overdue = _render(reporter)
+
+    # Nested steps are not counted on top of their phase
+    assert "about 70s left" in preflight
+    assert "about 60s left" in dependencies
+    assert "taking longer than usual" in overdue
+
+
+@pytest.mark.parametrize(
+    ("took", "pace"), [(1.0, "faster than usual"), (30.0, "slower than usual")]
+)
+def test_footer_once_every_phase_finished(took, pace):
+    expected = Estimate(
+        runs=3,
+        total=10.0,
+        steps={"preflight": 1.0, "phase 1: local project": 9.0},
+        phases=("preflight", "phase 1: local project"),
+    )
+    reporter = _live(expected)
+    with reporting(reporter):
+        with span("preflight"):
+            pass
+        with span("phase 1: local project"):
+            pass
+    reporter._start -= took
+
+    finished = _render(reporter)
+    with reporter:
+        reporter._start -= took
+    over = _render(reporter)
+
+    for rendered in (finished, over):
+        assert f"done in {took:.1f}s, {pace} (p50 10.0s" in rendered
+        assert "taking longer" not in rendered
+
+
+def test_exit_drops_steps_that_never_started():
+    expected = Estimate(runs=1, total=1.0, steps={"dependencies": 1.0})
+    reporter = _live(expected)
+    with reporter, reporting(reporter), span("preflight"):
+        pass
+
+    rendered = _render(reporter)
+    assert "preflight" in rendered
+    assert "dependencies" not in rendered
@@ -11,8 +11,10 @@ from uv_start.exceptions import TemplateError
 from uv_start.parse_docs import (
     _copy_template,
     _parse_replacement,
+    _render_template,
     _update_content,
 )
+from uv_start.workspace import Workspace
 
 
 @pytest.fixture
@@ -96,7 +98,9 @@ A project using Python {python_version}
     mock_config = UserConfig(
         author_name="Test Author", author_email="test@example.com"
     )
-    with patch("uv_start.parse_docs.load_config", return_value=mock_config):
+    with patch(
+        "uv_start.parse_docs.get_user_config", return_value=mock_config
+    ):
         _update_content(project_dir, args, "README.md")
 
     # Check README.md content
@@ -124,7 +128,9 @@ def test_python_version_matrix():
     mock_config = UserConfig(
         author_name="Test Author", author_email="test@example.com"
     )
-    with patch("uv_start.parse_docs.load_config", return_value=mock_config):
+    with patch(
+        "uv_start.parse_docs.get_user_config", return_value=mock_config
+    ):
         for python_version, expected in test_cases:
             args = Namespace(
                 python=python_version, project_name="test-project"
@@ -136,3 +142,38 @@ def test_python_version_matrix():
                 f"For Python {python_version}, expected {expected} "
                 f"but got {actual_matrix}"
             )
+
+
+def test_render_templates_into_workspace_members(tmp_path, monkeypatch):
+    """README.md is rendered per member straight from the template."""
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "README.md").write_text("# Title\n{author}\n")
+    monkeypatch.setattr(uv_start.parse_docs, "TEMPLATE_DIR", template_dir)
+    project_dir = tmp_path / "root"
+    (project_dir / "packages" / "member-a").mkdir(parents=True)
+    (project_dir / "packages" / "member-b").mkdir(parents=True)
+    args = Namespace(project_name="root", python="3.13")
+
+    mock_config = UserConfig(
+        author_name="Test Author", author_email="test@example.com"
+    )
+    with patch(
+        "uv_start.parse_docs.get_user_config", return_value=mock_config
+    ):
+        _render_template(
+            args, "README.md", Workspace.scan(project_dir).files("README.md")
+        )
+
+    assert (project_dir / "README.md").read_text() == ("# root\nTest Author\n")
+    for member in ["member-a", "member-b"]:
+        readme = project_dir / "packages" / member / "README.md"
+        assert readme.read_text() == f"# {member}\nTest Author\n"
+
+
+def test_render_template_not_found(tmp_path, monkeypatch):
+    monkeypatch.setattr(uv_start.parse_docs, "TEMPLATE_DIR", tmp_path)
+    args = Namespace(project_name="root", python="3.13")
+
+    with pytest.raises(TemplateError):
+        _render_template(args, "missing.md", [tmp_path / "out.md"])
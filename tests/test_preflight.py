@@ -0,0 +1,208 @@
+import asyncio
+import subprocess
+import time
+from argparse import Namespace
+from collections import namedtuple
+from unittest.mock import patch
+
+import pytest
+
+from uv_start.exceptions import PreflightError
+from uv_start.interpreters import installed_versions
+from uv_start.preflight import (
+    MIN_FREE_BYTES,
+    PREFLIGHT_TIMEOUT,
+    run_preflight,
+)
+
+DiskUsage = namedtuple("DiskUsage", "total used free")
+
+
+def _args(**overrides):
+    return Namespace(**{"python": "3.12", "github": False, **overrides})
+
+
+def _fake_run(outputs):
+    """Answer each command from ``outputs`` keyed by its first two words."""
+
+    async def run(cmd, **kwargs):
+        returncode, stdout = outputs.get(tuple(cmd[:2]), (0, ""))
+        return subprocess.CompletedProcess(cmd, returncode, stdout, "")
+
+    return run
+
+
+HEALTHY = {
+    ("uv", "--version"): (0, "uv 0.9.2 (abc 2025-10-01)\n"),
+    ("git", "config"): (0, "user.name Jane\nuser.email jane@example.com\n"),
+}
+
+
+def test_preflight_passes(tmp_path):
+    with patch("uv_start.preflight.run_async", _fake_run(HEALTHY)):
+        run_preflight(_args(github=True), tmp_path)
+
+
+def test_preflight_reports_every_problem(tmp_path):
+    outputs = {
+        **HEALTHY,
+        ("uv", "--version"): (0, "uv 0.4.1\n"),
+        ("gh", "auth"): (1, ""),
+        ("git", "config"): (0, "user.name Jane\n"),
+    }
+
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(outputs)),
+        pytest.raises(PreflightError) as excinfo,
+    ):
+        run_preflight(_args(github=True), tmp_path)
+
+    message = str(excinfo.value)
+    assert "uv 0.4.1 is too old" in message
+    assert "gh auth login" in message
+    assert "user.email" in message
+
+
+def test_preflight_skips_github_checks(tmp_path):
+    outputs = {**HEALTHY, ("gh", "auth"): (1, ""), ("git", "config"): (1, "")}
+
+    with patch("uv_start.preflight.run_async", _fake_run(outputs)):
+        run_preflight(_args(github=False), tmp_path)
+
+
+def test_preflight_python_downloads_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("UV_PYTHON_DOWNLOADS", "never")
+    outputs = {**HEALTHY, ("uv", "python"): (2, "")}
+
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(outputs)),
+        pytest.raises(PreflightError, match="uv python install 3.12"),
+    ):
+        run_preflight(_args(), tmp_path)
+
+
+def test_preflight_disk_space(tmp_path):
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(HEALTHY)),
+        patch(
+            "uv_start.preflight.shutil.disk_usage",
+            return_value=DiskUsage(0, 0, MIN_FREE_BYTES // 2),
+        ),
+        pytest.raises(PreflightError, match="MiB free"),
+    ):
+        run_preflight(_args(), tmp_path)
+
+
+def test_preflight_missing_tool_reported_once(tmp_path):
+    async def run(cmd, **kwargs):
+        raise FileNotFoundError(2, "No such file", cmd[0])
+
+    with (
+        patch("uv_start.preflight.run_async", run),
+        pytest.raises(PreflightError) as excinfo,
+    ):
+        run_preflight(_args(), tmp_path)
+
+    assert str(excinfo.value).count("'uv' is not installed") == 1
+
+
+def test_preflight_checks_run_concurrently(tmp_path):
+    async def slow(cmd, **kwargs):
+        await asyncio.sleep(0.5)
+        return subprocess.CompletedProcess(
+            cmd, 0, "uv 0.9.2\nuser.name a\nuser.email b\n", ""
+        )
+
+    start = time.perf_counter()
+    with patch("uv_start.preflight.run_async", slow):
+        run_preflight(_args(github=True), tmp_path)
+
+    assert time.perf_counter() - start < 1.5
+
+
+def test_preflight_hung_check_aborts_within_two_seconds(tmp_path):
+    timeouts = []
+
+    async def run(cmd, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        if cmd[0] == "gh":
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return subprocess.CompletedProcess(
+            cmd, 0, "uv 0.9.2\nuser.name a\nuser.email b\n", ""
+        )
+
+    with (
+        patch("uv_start.preflight.run_async", run),
+        pytest.raises(PreflightError) as excinfo,
+    ):
+        run_preflight(_args(github=True), tmp_path)
+
+    assert max(timeouts) <= 2
+    assert "'gh auth status' did not answer within 2s" in str(excinfo.value)
+
+
+def test_preflight_resolves_python_auto(tmp_path):
+    args = _args(python="auto")
+
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(HEALTHY)),
+        patch(
+            "uv_start.interpreters.installed_versions",
+            return_value=("3.13", "3.11"),
+        ),
+    ):
+        run_preflight(args, tmp_path)
+
+    assert args.python == "3.13"
+
+
+def test_preflight_python_auto_without_uv(tmp_path, monkeypatch):
+    async def run(cmd, **kwargs):
+        raise FileNotFoundError(2, "No such file", cmd[0])
+
+    monkeypatch.setattr(
+        "uv_start.interpreters.LISTING_FILE", tmp_path / "pythons.json"
+    )
+    installed_versions.cache_clear()
+    with (
+        patch("uv_start.runner.run_async", run),
+        patch("uv_start.preflight.run_async", run),
+        pytest.raises(PreflightError) as excinfo,
+    ):
+        run_preflight(_args(python="auto"), tmp_path)
+
+    assert str(excinfo.value).count("'uv' is not installed") == 1
+    assert "--python auto" not in str(excinfo.value)
+
+
+def test_preflight_python_auto_listing_fails(tmp_path):
+    failure = subprocess.CalledProcessError(
+        2, ["uv", "python", "list"], stderr="error: broken cache\n"
+    )
+
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(HEALTHY)),
+        patch(
+            "uv_start.interpreters.installed_versions", side_effect=failure
+        ) as listing,
+        pytest.raises(PreflightError, match="error: broken cache"),
+    ):
+        run_preflight(_args(python="auto"), tmp_path)
+
+    listing.assert_called_once_with(PREFLIGHT_TIMEOUT)
+
+
+def test_preflight_python_auto_listing_times_out(tmp_path, monkeypatch):
+    monkeypatch.setattr("uv_start.preflight.PREFLIGHT_TIMEOUT", 0.05)
+
+    with (
+        patch("uv_start.preflight.run_async", _fake_run(HEALTHY)),
+        patch(
+            "uv_start.interpreters.installed_versions",
+            side_effect=lambda timeout: time.sleep(0.3),
+        ),
+        pytest.raises(PreflightError) as excinfo,
+    ):
+        run_preflight(_args(python="auto"), tmp_path)
+
+    assert "'uv python list' did not answer within 0.05s" in str(excinfo.value)
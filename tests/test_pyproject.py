@@ -0,0 +1,96 @@
+import tomllib
+
+import pytest
+
+from uv_start.exceptions import ConfigError
+from uv_start.pyproject import (
+    has_table,
+    merge,
+    owned_table,
+    with_version_files,
+)
+
+RUFF = "# Ruff\n[tool.ruff]\nline-length = 79\n"
+PYTEST = '[tool.pytest.ini_options]\ntestpaths = ["tests"]\n'
+INDEX = '[[tool.uv.index]]\nname = "mirror"\nurl = "https://m.example"\n'
+COMMITIZEN = """[tool.commitizen]
+version = "0.1.0"
+version_files = [
+    "pyproject.toml:version",
+    "README.md:version-[0-9]+\\\\.[0-9]+"
+]
+major_version_zero = true
+"""
+
+
+@pytest.mark.parametrize(
+    ("fragment", "table"),
+    [
+        (RUFF, ("tool", "ruff")),
+        (PYTEST, ("tool", "pytest", "ini_options")),
+        (INDEX, ("tool", "uv", "index")),
+    ],
+)
+def test_owned_table(fragment, table):
+    assert owned_table(fragment) == table
+
+
+def test_has_table():
+    document = {"tool": {"uv": {"sources": {}}}}
+
+    assert has_table(document, ("tool", "uv"))
+    assert not has_table(document, ("tool", "uv", "index"))
+
+
+def test_merge_appends_missing_fragments_once(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "demo"\n\n[tool.uv.sources]\ncore = {}\n'
+    )
+
+    assert merge(pyproject, [RUFF, PYTEST, INDEX])
+    assert not merge(pyproject, [RUFF, PYTEST, INDEX])
+
+    text = pyproject.read_text()
+    assert text.count("[tool.ruff]") == 1
+    assert "# Ruff" in text, "fragment comments are kept"
+    document = tomllib.loads(text)
+    assert document["tool"]["uv"]["index"][0]["name"] == "mirror"
+    assert "sources" in document["tool"]["uv"]
+
+
+def test_merge_skips_existing_sections(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.ruff]\nline-length = 120\n")
+
+    merge(pyproject, [RUFF, PYTEST])
+
+    document = tomllib.loads(pyproject.read_text())
+    assert document["tool"]["ruff"]["line-length"] == 120
+    assert "pytest" in document["tool"]
+
+
+def test_merge_invalid_toml(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project\n")
+
+    with pytest.raises(ConfigError):
+        merge(pyproject, [RUFF])
+
+
+def test_merge_missing_file(tmp_path):
+    with pytest.raises(ConfigError):
+        merge(tmp_path / "pyproject.toml", [RUFF])
+
+
+def test_with_version_files():
+    fragment = with_version_files(COMMITIZEN, ["packages/a/pyproject.toml"])
+
+    commitizen = tomllib.loads(fragment)["tool"]["commitizen"]
+    assert commitizen["version_files"] == [
+        "pyproject.toml:version",
+        "README.md:version-[0-9]+\\.[0-9]+",
+        "packages/a/pyproject.toml",
+    ]
+    assert commitizen["major_version_zero"] is True
+    assert with_version_files(COMMITIZEN, []) == COMMITIZEN
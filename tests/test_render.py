@@ -0,0 +1,49 @@
+from uv_start.render import Renderer, compile_renderer
+
+
+def test_render_replaces_every_placeholder():
+    renderer = Renderer({"{author}": "Jane", "{email}": "jane@example.com"})
+
+    assert (
+        renderer.render("{author} <{email}> / {author}")
+        == "Jane <jane@example.com> / Jane"
+    )
+
+
+def test_render_prefers_longest_placeholder():
+    renderer = Renderer(
+        {
+            "{module_name}": "my_lib",
+            "src/{module_name}/__init__.py": "src/my_lib/__init__.py:v",
+        }
+    )
+
+    assert renderer.render("src/{module_name}/__init__.py") == (
+        "src/my_lib/__init__.py:v"
+    )
+
+
+def test_render_is_single_pass():
+    """A replacement value is never rendered again."""
+    renderer = Renderer({"{a}": "{b}", "{b}": "B"})
+
+    assert renderer.render("{a} {b}") == "{b} B"
+
+
+def test_render_without_placeholders():
+    assert Renderer({}).render("unchanged") == "unchanged"
+
+
+def test_render_file_in_place(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_text("# {project_name}\n")
+
+    Renderer({"{project_name}": "demo"}).render_file(path, path)
+
+    assert path.read_text() == "# demo\n"
+
+
+def test_compile_renderer_is_shared():
+    items = (("{author}", "Jane"),)
+
+    assert compile_renderer(items) is compile_renderer(items)
@@ -0,0 +1,56 @@
+import json
+import sys
+
+from uv_start.reporting import JsonReporter, report, reporting
+from uv_start.runner import run_command
+from uv_start.timings import span
+
+
+def _events(capsys) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_json_reporter_streams_steps_and_commands(capsys):
+    cmd = [sys.executable, "-c", "print('hi'); raise SystemExit(3)"]
+    with reporting(JsonReporter()), span("dependencies", "step"):
+        report("[green]Dependencies resolved[/green]")
+        run_command(cmd, label="core")
+
+    events = _events(capsys)
+    assert [(e["event"], e.get("name")) for e in events] == [
+        ("start", "dependencies"),
+        ("message", None),
+        ("start", events[2]["name"]),
+        ("output", None),
+        ("finish", events[2]["name"]),
+        ("finish", "dependencies"),
+    ]
+    assert events[1]["text"] == "Dependencies resolved"
+    command = events[4]
+    assert command["kind"] == "subprocess"
+    assert command["parent"] == "dependencies"
+    assert command["command"] == cmd
+    assert command["exit_code"] == 3
+    assert events[3] == {
+        "event": "output",
+        "time": events[3]["time"],
+        "label": "core",
+        "stream": "stdout",
+        "line": "hi",
+    }
+    times = [e["time"] for e in events]
+    assert times == sorted(times)
+
+
+def test_json_reporter_reports_failures(capsys):
+    try:
+        with reporting(JsonReporter()), span("templates", "step"):
+            raise OSError("disk full")
+    except OSError:
+        pass
+
+    (start, fail) = _events(capsys)
+    assert start["event"] == "start"
+    assert fail["event"] == "fail"
+    assert fail["error"] == "disk full"
+    assert fail["duration"] >= 0
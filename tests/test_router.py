@@ -22,15 +22,15 @@ def temp_cwd(tmp_path):
 @pytest.fixture
 def mock_subprocess():
     """Mock subprocess calls"""
-    with patch("subprocess.run") as mock_run:
+    with patch("uv_start.runner.run_async") as mock_run:
         mock_run.return_value = Mock(returncode=0)
         yield mock_run
 
 
 @pytest.fixture
-def mock_rprint():
-    """Mock rich.print"""
-    with patch("uv_start.router.rprint") as mock_print:
+def mock_report():
+    """Mock the progress report"""
+    with patch("uv_start.router.report") as mock_print:
         yield mock_print
 
 
@@ -78,6 +78,7 @@ def test_lib_project(mock_subprocess, dispatcher, base_args, mock_fs):
         check=True,
         cwd=dispatcher.original_cwd,
         env=ANY,
+        retry=ANY,
     )
 
 
@@ -91,6 +92,7 @@ def test_package_project(mock_subprocess, dispatcher, base_args, mock_fs):
         check=True,
         cwd=dispatcher.original_cwd,
         env=ANY,
+        retry=ANY,
     )
 
 
@@ -115,3 +117,64 @@ def test_subprocess_error(mock_subprocess, base_args, temp_cwd, mock_fs):
     dispatcher = CommandDispatcher(args, temp_cwd)
     with pytest.raises(ProjectCreationError):
         dispatcher.dispatch()
+
+
+def test_workspace_members_created_without_prompts(
+    mock_subprocess, base_args, temp_cwd
+):
+    """--member skips the prompts and registers all members at once"""
+    args = base_args
+    args.type = "lib"
+    args.workspace = True
+    args.members = [("core", "lib"), ("api", "app"), ("cli", "app")]
+    (temp_cwd / "test-project" / "pyproject.toml").write_text(
+        '[project]\nname = "test-project"\n'
+    )
+
+    with patch("uv_start.router.Prompt.ask") as mock_ask:
+        CommandDispatcher(args, temp_cwd).dispatch()
+
+    mock_ask.assert_not_called()
+    commands = [c.args[0] for c in mock_subprocess.call_args_list]
+    inits = [c for c in commands if c[:2] == ["uv", "init"]][1:]
+    assert sorted(c[2] for c in inits) == ["api", "cli", "core"]
+    assert all("--no-workspace" in c for c in inits)
+    assert ["uv", "init", "api", "--package", "--app", "--no-workspace",
+            "--vcs", "none"] in inits  # fmt: skip
+    adds = [c for c in commands if c[:2] == ["uv", "add"]]
+    assert adds == [
+        [
+            "uv",
+            "add",
+            "--frozen",
+            "--editable",
+            "./packages/core",
+            "./packages/api",
+            "./packages/cli",
+        ]
+    ]
+    pyproject = (temp_cwd / "test-project" / "pyproject.toml").read_text()
+    assert (
+        '[tool.uv.workspace]\nmembers = [\n    "packages/core",' in pyproject
+    )
+
+
+def test_workspace_member_failure(mock_subprocess, base_args, temp_cwd):
+    """A failing member aborts before anything is registered"""
+    args = base_args
+    args.type = "lib"
+    args.workspace = True
+    args.members = [("core", "lib"), ("api", "app")]
+
+    def run(cmd, **kwargs):
+        if cmd[:3] == ["uv", "init", "api"]:
+            raise subprocess.CalledProcessError(1, cmd)
+        return Mock(returncode=0)
+
+    mock_subprocess.side_effect = run
+
+    with pytest.raises(ProjectCreationError, match="api"):
+        CommandDispatcher(args, temp_cwd).dispatch()
+
+    commands = [c.args[0] for c in mock_subprocess.call_args_list]
+    assert not any(c[:2] == ["uv", "add"] for c in commands)
@@ -0,0 +1,201 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from uv_start.reporting import Reporter, reporting
+from uv_start.runner import (
+    Command,
+    RetryPolicy,
+    is_transient,
+    run_all,
+    run_command,
+)
+from uv_start.timings import TimingRecorder, recording
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_records_subprocess_span():
+    recorder = TimingRecorder()
+    with recording(recorder):
+        run_command(_python("pass"), check=True)
+
+    assert recorder.spans[0].name.endswith("-c pass")
+    assert recorder.spans[0].category == "subprocess"
+
+
+def test_run_command_captures_output():
+    result = run_command(
+        _python("import sys; print('out'); print('err', file=sys.stderr)"),
+        capture_output=True,
+    )
+
+    assert result.returncode == 0
+    assert result.stdout == "out\n"
+    assert result.stderr == "err\n"
+
+
+def test_run_command_streams_labelled_lines(capsys):
+    result = run_command(_python("print('one'); print('two')"), label="core")
+
+    assert capsys.readouterr().out.splitlines() == ["core | one", "core | two"]
+    assert result.stdout == "one\ntwo\n"
+
+
+def test_run_command_reports_to_active_reporter(capsys):
+    with reporting(Reporter()):
+        result = run_command(_python("print('one')"), label="core")
+
+    assert capsys.readouterr().out == ""
+    assert result.stdout == "one\n"
+
+
+def test_run_command_check_raises_with_output():
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        run_command(
+            _python("import sys; print('boom'); sys.exit(3)"),
+            check=True,
+            capture_output=True,
+        )
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stdout == "boom\n"
+
+
+def test_run_command_timeout_kills_process():
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_command(_python("import time; time.sleep(30)"), timeout=0.5)
+
+    assert time.perf_counter() - start < 10
+
+
+def test_run_command_missing_executable():
+    with pytest.raises(FileNotFoundError):
+        run_command(["uv-start-no-such-command"])
+
+
+def test_run_all_runs_concurrently_in_order():
+    commands = [
+        Command(
+            _python(f"import time; time.sleep(0.5); print({i})"),
+            capture_output=True,
+        )
+        for i in range(4)
+    ]
+
+    start = time.perf_counter()
+    results = run_all(commands)
+
+    assert [r.stdout for r in results] == ["0\n", "1\n", "2\n", "3\n"]
+    assert time.perf_counter() - start < 1.9
+
+
+def test_run_all_cancels_siblings_on_failure():
+    commands = [
+        Command(_python("import time; time.sleep(30)"), capture_output=True),
+        Command(_python("import sys; sys.exit(1)"), capture_output=True),
+    ]
+
+    start = time.perf_counter()
+    with pytest.raises(subprocess.CalledProcessError):
+        run_all(commands)
+
+    assert time.perf_counter() - start < 10
+
+
+def test_retry_until_success(tmp_path, capsys):
+    counter = tmp_path / "attempts"
+    flaky = _python(
+        "import pathlib, sys; p = pathlib.Path(sys.argv[1]); "
+        "n = int(p.read_text()) if p.exists() else 0; "
+        "p.write_text(str(n + 1)); "
+        "n < 2 and sys.exit('error: error sending request for url')"
+    ) + [str(counter)]
+    recorder = TimingRecorder()
+
+    with recording(recorder):
+        result = run_command(
+            flaky,
+            check=True,
+            retry=RetryPolicy(retries=3, backoff=0.01),
+        )
+
+    assert result.returncode == 0
+    assert counter.read_text() == "3"
+    err = capsys.readouterr().err
+    assert "retry 1/3" in err
+    assert "retry 2/3" in err
+    assert "succeeded on attempt 3/4" in err
+    assert [s.name.endswith("(attempt 3)") for s in recorder.spans] == [
+        False,
+        False,
+        True,
+    ]
+
+
+def test_retry_gives_up_after_timeouts():
+    start = time.perf_counter()
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_command(
+            _python("import time; time.sleep(30)"),
+            retry=RetryPolicy(timeout=0.3, retries=1, backoff=0),
+        )
+
+    assert time.perf_counter() - start < 10
+
+
+def test_permanent_failures_are_not_retried(tmp_path):
+    counter = tmp_path / "attempts"
+    tls = _python(
+        "import pathlib, sys; p = pathlib.Path(sys.argv[1]); "
+        "p.write_text(p.read_text() + 'x' if p.exists() else 'x'); "
+        "sys.exit('error: error sending request for url\\n"
+        "  cause: invalid peer certificate: UnknownIssuer')"
+    ) + [str(counter)]
+
+    with pytest.raises(subprocess.CalledProcessError):
+        run_command(tls, check=True, retry=RetryPolicy(backoff=0))
+
+    assert counter.read_text() == "x"
+
+
+@pytest.mark.parametrize(
+    ("stderr", "transient"),
+    [
+        ("Failed to fetch: https://pypi.org/simple/x/ (dns error)", True),
+        ("fatal: unable to access: Could not resolve host: github.com", True),
+        ("HTTP 503: Service Unavailable", True),
+        ("× No solution found when resolving dependencies", False),
+        ("Because nope was not found in the package registry", False),
+        ("error sending request: invalid peer certificate", False),
+        ("error: pyproject.toml is invalid", False),
+    ],
+)  # fmt: skip
+def test_is_transient(stderr, transient):
+    error = subprocess.CalledProcessError(1, ["uv"], "", stderr)
+
+    assert is_transient(error) is transient
+    assert is_transient(subprocess.TimeoutExpired(["uv"], 1))
+
+
+def test_retry_keeps_the_command_timeout():
+    with pytest.raises(subprocess.TimeoutExpired) as exc:
+        run_command(
+            _python("import time; time.sleep(30)"),
+            timeout=0.3,
+            retry=RetryPolicy(retries=0),
+        )
+
+    assert exc.value.timeout == 0.3
+
+
+def test_retry_delay_is_bounded():
+    policy = RetryPolicy(backoff=1.0, max_backoff=3.0)
+
+    assert all(0 <= policy.delay(1) <= 1.0 for _ in range(50))
+    assert all(0 <= policy.delay(10) <= 3.0 for _ in range(50))
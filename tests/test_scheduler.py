@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from uv_start.exceptions import DependencyError
+from uv_start.scheduler import Step, run_each, run_steps
+
+
+def test_run_steps_respects_dependencies():
+    """Test that a step only starts after its dependencies finish"""
+    order = []
+    steps = [
+        Step("configs", lambda: order.append("configs"), ("dependencies",)),
+        Step(
+            "dependencies", lambda: order.append("dependencies"), ("scaffold",)
+        ),
+        Step("scaffold", lambda: order.append("scaffold")),
+    ]
+
+    run_steps(steps)
+
+    assert order == ["scaffold", "dependencies", "configs"]
+
+
+def test_run_steps_overlaps_independent_steps():
+    """Test that independent steps run at the same time"""
+    # Both steps must be inside the barrier together or it times out
+    barrier = threading.Barrier(2, timeout=5)
+    steps = [
+        Step("scaffold", lambda: None),
+        Step("dependencies", barrier.wait, ("scaffold",)),
+        Step("templates", barrier.wait, ("scaffold",)),
+    ]
+
+    run_steps(steps)
+
+
+def test_run_steps_stops_after_failure():
+    """Test that a failing step re-raises and blocks its dependents"""
+    ran = []
+
+    def fail() -> None:
+        raise DependencyError("mock dep failure")
+
+    steps = [
+        Step("scaffold", lambda: ran.append("scaffold")),
+        Step("dependencies", fail, ("scaffold",)),
+        Step("configs", lambda: ran.append("configs"), ("dependencies",)),
+    ]
+
+    with pytest.raises(DependencyError, match="mock dep failure"):
+        run_steps(steps)
+
+    assert ran == ["scaffold"]
+
+
+def test_run_steps_waits_for_running_siblings():
+    """Test that a failure still lets already running steps finish"""
+    finished = threading.Event()
+    started = threading.Event()
+
+    def slow() -> None:
+        started.set()
+        finished.wait(timeout=0.2)
+        finished.set()
+
+    def fail() -> None:
+        started.wait(timeout=5)
+        raise DependencyError("mock dep failure")
+
+    steps = [Step("templates", slow), Step("dependencies", fail)]
+
+    with pytest.raises(DependencyError):
+        run_steps(steps)
+
+    assert finished.is_set()
+
+
+def test_run_steps_unknown_dependency():
+    steps = [Step("configs", lambda: None, ("missing",))]
+
+    with pytest.raises(ValueError, match="unknown step"):
+        run_steps(steps)
+
+
+def test_run_steps_cycle():
+    steps = [
+        Step("a", lambda: None, ("b",)),
+        Step("b", lambda: None, ("a",)),
+    ]
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_steps(steps)
+
+
+def test_run_each_uses_worker_threads():
+    """Test that items are spread over the pool and errors surface"""
+    threads = set()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def work(item):
+        threads.add(threading.current_thread().name)
+        barrier.wait()
+
+    run_each(work, [1, 2, 3], max_workers=3)
+
+    assert len(threads) == 3
+
+    with pytest.raises(DependencyError):
+        run_each(
+            lambda item: (_ for _ in ()).throw(DependencyError(item)),
+            [1, 2],
+        )
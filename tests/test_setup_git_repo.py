@@ -0,0 +1,224 @@
+import subprocess
+from argparse import Namespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from uv_start.exceptions import GitSetupError
+from uv_start.journal import Journal
+from uv_start.pipeline import publish_project
+from uv_start.setup_git_repo import (
+    GH_CREDENTIALS,
+    create_github_repo,
+    initial_commit,
+    push,
+)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A git repository with one file and a throwaway identity."""
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".gitconfig").write_text(
+        "[user]\n\tname = Test\n\temail = test@example.com\n"
+    )
+    monkeypatch.setenv("HOME", str(home))
+    project = tmp_path / "my-lib"
+    project.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+    (project / "README.md").write_text("# my-lib\n")
+    return project
+
+
+def _commits(project) -> list[str]:
+    return subprocess.run(
+        ["git", "log", "--format=%s"],
+        cwd=project,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+
+def test_initial_commit_is_made_once(repo):
+    initial_commit(repo)
+    initial_commit(repo)  # e.g. resuming after a failed gh repo create
+
+    assert _commits(repo) == ["chore: initial commit"]
+
+
+def test_initial_commit_can_skip_hooks(repo):
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    hook.chmod(0o755)
+
+    with pytest.raises(GitSetupError):
+        initial_commit(repo)
+    initial_commit(repo, verify=False)
+
+    assert _commits(repo) == ["chore: initial commit"]
+
+
+class FakeGit:
+    """Stand-in for ``run_command`` that answers git/gh like a server."""
+
+    def __init__(self, head=False, remote=False, repo_url=None):
+        self.head = head
+        self.remote = remote
+        self.repo_url = repo_url
+        self.fail = set()
+        self.commands = []
+
+    def __call__(self, cmd, check=False, **kwargs):
+        self.commands.append(cmd)
+        ok = True
+        stdout = ""
+        match cmd[:3]:
+            case ["git", "rev-parse", _]:
+                ok = self.head
+            case ["git", "remote", "get-url"]:
+                ok = self.remote
+            case ["git", "commit", _]:
+                self.head = True
+            case ["gh", "repo", "view"]:
+                ok = self.repo_url is not None
+                stdout = f"{self.repo_url}\n" if ok else ""
+            case ["gh", "repo", "create"] if "create" not in self.fail:
+                self.repo_url = f"https://github.com/me/{cmd[3]}"
+                self.remote = True
+        if self.fail & set(cmd[:3]):
+            ok = False
+        if check and not ok:
+            raise subprocess.CalledProcessError(1, cmd)
+        return Mock(returncode=0 if ok else 1, stdout=stdout)
+
+    def ran(self, *prefix) -> int:
+        return sum(cmd[: len(prefix)] == list(prefix) for cmd in self.commands)
+
+
+def _publish(fake, journal, project_path):
+    args = Namespace(project_name="my-lib", github=True, private=False)
+    with (
+        patch("uv_start.setup_git_repo.run_command", fake),
+        patch("uv_start.setup_git_repo.load_retry_policy"),
+    ):
+        publish_project(args, project_path, journal)
+
+
+def test_resume_after_failed_repo_creation(tmp_path):
+    project_path = tmp_path / "my-lib"
+    project_path.mkdir()
+    journal = Journal(project_path, Namespace(project_name="my-lib"))
+    fake = FakeGit()
+    fake.fail = {"create"}
+
+    with pytest.raises(GitSetupError):
+        _publish(fake, journal, project_path)
+    assert journal.completed == ["commit"]
+
+    fake.fail = set()
+    fake.commands.clear()
+    resumed = Journal.load(project_path)
+    _publish(fake, resumed, project_path)
+
+    assert fake.ran("git", "commit") == 0
+    assert fake.ran("gh", "repo", "create") == 1
+    assert fake.ran("git", *GH_CREDENTIALS, "push") == 1
+    assert not resumed.path.exists()
+
+
+def test_resume_uses_repository_created_before_a_failure(tmp_path):
+    project_path = tmp_path / "my-lib"
+    fake = FakeGit(head=True, repo_url="https://github.com/me/my-lib")
+
+    with patch("uv_start.setup_git_repo.run_command", fake):
+        create_github_repo("my-lib", project_path, resuming=True)
+
+    assert fake.ran("gh", "repo", "create") == 0
+    assert [
+        "git",
+        "remote",
+        "add",
+        "origin",
+        "https://github.com/me/my-lib.git",
+    ] in fake.commands
+
+
+def test_resume_keeps_existing_remote(tmp_path):
+    fake = FakeGit(head=True, remote=True)
+
+    with patch("uv_start.setup_git_repo.run_command", fake):
+        create_github_repo("my-lib", tmp_path, resuming=True)
+
+    assert fake.ran("gh") == 0
+
+
+def test_new_project_never_reuses_a_repository(tmp_path):
+    fake = FakeGit(repo_url="https://github.com/me/my-lib")
+    fake.fail = {"create"}
+
+    with (
+        patch("uv_start.setup_git_repo.run_command", fake),
+        patch("uv_start.setup_git_repo.load_retry_policy"),
+        pytest.raises(GitSetupError),
+    ):
+        create_github_repo("my-lib", tmp_path)
+
+    assert fake.ran("gh", "repo", "view") == 0
+
+
+def test_only_the_push_is_retried(tmp_path):
+    fake = Mock(side_effect=FakeGit())
+    args = Namespace(project_name="my-lib", github=True, private=False)
+    journal = Journal(tmp_path, args)
+
+    with (
+        patch("uv_start.setup_git_repo.run_command", fake),
+        patch("uv_start.setup_git_repo.load_retry_policy") as policy,
+    ):
+        publish_project(args, tmp_path, journal)
+
+    retried = [c.args[0] for c in fake.call_args_list if "retry" in c.kwargs]
+    assert len(retried) == 1
+    assert "push" in retried[0]
+    assert policy.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("sync", "verify"), [("full", True), ("background", False)]
+)
+def test_background_sync_commits_without_hooks(tmp_path, sync, verify):
+    fake = FakeGit()
+    args = Namespace(
+        project_name="my-lib", github=True, private=False, sync=sync
+    )
+
+    with (
+        patch("uv_start.setup_git_repo.run_command", fake),
+        patch("uv_start.setup_git_repo.load_retry_policy"),
+    ):
+        publish_project(args, tmp_path, Journal(tmp_path, args))
+
+    (commit,) = [cmd for cmd in fake.commands if cmd[:2] == ["git", "commit"]]
+    assert ("--no-verify" not in commit) is verify
+
+
+def test_push_authenticates_through_gh(tmp_path):
+    fake = FakeGit()
+
+    with (
+        patch("uv_start.setup_git_repo.run_command", fake),
+        patch("uv_start.setup_git_repo.load_retry_policy"),
+    ):
+        push(tmp_path)
+
+    (cmd,) = fake.commands
+    assert cmd[:5] == [
+        "git",
+        "-c",
+        "credential.helper=",
+        "-c",
+        "credential.helper=!gh auth git-credential",
+    ]
+    assert cmd[5:] == ["push", "--set-upstream", "origin", "HEAD"]
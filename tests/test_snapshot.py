@@ -0,0 +1,145 @@
+import json
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+import uv_start.snapshot
+from uv_start.config import UserConfig, reload_config
+from uv_start.snapshot import (
+    GOLDEN_MODULE,
+    GOLDEN_NAME,
+    INDEX_ENV,
+    is_cacheable,
+    materialise,
+    snapshot_key,
+    snapshot_path,
+)
+
+
+@pytest.fixture
+def snapshot_env(tmp_path, monkeypatch):
+    """Point the snapshot cache and templates at temporary directories."""
+    cache_dir = tmp_path / "cache"
+    template_dir = tmp_path / "template"
+    template_dir.mkdir()
+    (template_dir / "README.md").write_text("# Title\n")
+    monkeypatch.setattr(uv_start.snapshot, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(uv_start.snapshot, "TEMPLATE_DIR", template_dir)
+    mock_config = UserConfig(
+        author_name="Test Author", author_email="test@example.com"
+    )
+    with (
+        patch("uv_start.snapshot.get_user_config", return_value=mock_config),
+        patch("uv_start.snapshot.uv_version", return_value="uv 0.13.0"),
+        patch("uv_start.snapshot.run_command") as mock_run,
+    ):
+        yield tmp_path, template_dir, mock_run
+
+
+@pytest.fixture
+def args():
+    return Namespace(
+        project_name="my-lib",
+        type="lib",
+        python="3.12",
+        workspace=False,
+        github=False,
+        data=False,
+    )
+
+
+def fake_build(args: Namespace, original_cwd) -> None:
+    """Stand-in for phase 1 that writes a minimal project."""
+    project = original_cwd / args.project_name
+    module = args.project_name.replace("-", "_")
+    (project / "src" / module).mkdir(parents=True)
+    (project / "src" / module / "__init__.py").write_text(
+        '__version__ = "0.1.0"\n'
+    )
+    (project / "pyproject.toml").write_text(
+        f'[project]\nname = "{args.project_name}"\n'
+        f'version_files = ["src/{module}/__init__.py:__version__"]\n'
+    )
+    (project / ".venv").mkdir()
+
+
+def test_materialise_builds_once_and_renames(snapshot_env, args):
+    tmp_path, _, mock_run = snapshot_env
+    build_calls = []
+
+    def build(golden_args, original_cwd):
+        build_calls.append(golden_args.project_name)
+        fake_build(golden_args, original_cwd)
+
+    materialise(args, tmp_path / "my-lib", build)
+    args.project_name = "other-lib"
+    materialise(args, tmp_path / "other-lib", build)
+
+    assert build_calls == [GOLDEN_NAME]
+    project = tmp_path / "other-lib"
+    assert (project / "src" / "other_lib" / "__init__.py").exists()
+    assert not (project / "src" / GOLDEN_MODULE).exists()
+    assert not (project / ".venv").exists(), ".venv is built by provision"
+    pyproject = (project / "pyproject.toml").read_text()
+    assert 'name = "other-lib"' in pyproject
+    assert "src/other_lib/__init__.py" in pyproject
+    assert GOLDEN_NAME not in pyproject
+    commands = [c.args[0] for c in mock_run.call_args_list]
+    assert not any(c[:2] == ["uv", "sync"] for c in commands)
+
+
+def test_failed_build_leaves_no_snapshot(snapshot_env, args):
+    tmp_path, _, _ = snapshot_env
+
+    def build(golden_args, original_cwd):
+        raise RuntimeError("mock build failure")
+
+    with pytest.raises(RuntimeError):
+        materialise(args, tmp_path / "my-lib", build)
+
+    cache_dir = uv_start.snapshot.CACHE_DIR
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_snapshot_key_changes_with_templates(snapshot_env, args):
+    _, template_dir, _ = snapshot_env
+    before = snapshot_path(snapshot_key(args))
+
+    (template_dir / "README.md").write_text("# Title\nchanged\n")
+
+    assert snapshot_path(snapshot_key(args)) != before
+
+
+def test_snapshot_key_changes_with_options(snapshot_env, args):
+    before = snapshot_path(snapshot_key(args))
+    args.python = "3.13"
+
+    assert snapshot_path(snapshot_key(args)) != before
+
+
+def test_snapshot_key_changes_with_indexes(
+    snapshot_env, args, tmp_path, monkeypatch
+):
+    for name in INDEX_ENV:
+        monkeypatch.delenv(name, raising=False)
+    config_file = tmp_path / "config.toml"
+    monkeypatch.setattr("uv_start.config.CONFIG_FILE", config_file)
+    before = snapshot_path(snapshot_key(args))
+
+    config_file.write_text(
+        '[uv]\nindex_url = "https://mirror.example/simple"\n'
+    )
+    reload_config()
+    with_mirror = snapshot_path(snapshot_key(args))
+    monkeypatch.setenv("UV_INDEX", "https://wheels.example/simple")
+    with_extra = snapshot_path(snapshot_key(args))
+
+    assert len({before, with_mirror, with_extra}) == 3
+    assert "mirror.example" not in json.dumps(snapshot_key(args))
+
+
+def test_workspace_is_not_cacheable(args):
+    assert is_cacheable(args)
+    args.workspace = True
+    assert not is_cacheable(args)
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from uv_start.exceptions import ProjectCreationError
+from uv_start.staging import (
+    STAGING_MARKER,
+    TRASH_MARKER,
+    create_staging,
+    discard,
+    promote,
+)
+
+
+def test_promote_moves_project_and_removes_staging(tmp_path):
+    staging = create_staging(tmp_path, "my-lib")
+    assert staging.parent == tmp_path
+    assert staging.name.startswith(f".my-lib{STAGING_MARKER}")
+    (staging / "my-lib").mkdir()
+    (staging / "my-lib" / "pyproject.toml").write_text("")
+
+    promote(staging / "my-lib", tmp_path / "my-lib")
+
+    assert (tmp_path / "my-lib" / "pyproject.toml").exists()
+    assert not staging.exists()
+
+
+def test_promote_refuses_existing_destination(tmp_path):
+    staging = create_staging(tmp_path, "my-lib")
+    (staging / "my-lib").mkdir()
+    (tmp_path / "my-lib").mkdir()
+
+    with pytest.raises(ProjectCreationError):
+        promote(staging / "my-lib", tmp_path / "my-lib")
+
+    assert (staging / "my-lib").exists()
+
+
+def test_discard_renames_then_deletes_in_background(tmp_path):
+    victim = tmp_path / "half-built"
+    (victim / ".venv" / "lib").mkdir(parents=True)
+    (victim / ".venv" / "lib" / "big.bin").write_bytes(b"0" * 1024)
+
+    assert discard(victim)
+
+    assert not victim.exists(), "renamed away before returning"
+    deadline = time.monotonic() + 10
+    while any(tmp_path.iterdir()) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(tmp_path.iterdir())
+
+
+def test_discard_missing_path(tmp_path):
+    assert not discard(tmp_path / "missing")
+
+
+def test_trash_name_is_hidden(tmp_path, monkeypatch):
+    launched = []
+    monkeypatch.setattr(
+        "uv_start.staging.subprocess.Popen",
+        lambda cmd, **kwargs: launched.append((cmd, kwargs)),
+    )
+    (tmp_path / "victim").mkdir()
+
+    discard(tmp_path / "victim")
+
+    (trash,) = tmp_path.iterdir()
+    assert trash.name.startswith(f".victim{TRASH_MARKER}")
+    cmd, kwargs = launched[0]
+    assert cmd[-1] == str(trash)
+    assert kwargs["start_new_session"] is True
@@ -0,0 +1,109 @@
+"""Tests that ``uv-start --help`` only imports what it needs."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Microseconds ``--help`` may spend importing, about 1.5 times what rich
+# and argparse take on their own; importing the project pipeline with it
+# took 250ms
+IMPORT_BUDGET_US = 200_000
+
+# Modules only the commands that create projects need
+HEAVY_MODULES = [
+    "asyncio",
+    "uv_start.config",
+    "uv_start.dev_deps",
+    "uv_start.pipeline",
+    "uv_start.preflight",
+    "uv_start.router",
+    "uv_start.runner",
+    "uv_start.setup_git_repo",
+    "uv_start.timings",
+]
+
+
+def _import_times(
+    tmp_path, *args: str, listing: bool = True
+) -> dict[str, tuple[int, bool]]:
+    """Run uv-start under ``-X importtime``.
+
+    Returns each module with its cumulative time (us) and whether it was
+    imported at the top level. Without ``listing`` the interpreter cache
+    is cold. ``uv`` is replaced by a script that leaves ``uv-called``
+    in ``tmp_path``.
+
+    Only modules imported once uv-start starts are returned; interpreter
+    start-up (site, encodings) is not ours to budget.
+    """
+    if listing:
+        saved = tmp_path / "uv-start" / "pythons.json"
+        saved.parent.mkdir()
+        saved.write_text(
+            json.dumps({"created": time.time(), "versions": ["3.13", "3.12"]})
+        )
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    uv = bin_dir / "uv"
+    uv.write_text(f"#!/bin/sh\ntouch {tmp_path / 'uv-called'}\n")
+    uv.chmod(0o755)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "uv_start", *args],
+        capture_output=True,
+        text=True,
+        env={
+            **os.environ,
+            "HOME": str(tmp_path),
+            "XDG_CACHE_HOME": str(tmp_path),
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+        },
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = (int(cumulative), not name.startswith("  "))
+        if name.strip() == "uv_start":
+            times.clear()
+            times["uv_start"] = (int(cumulative), True)
+    return times
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--no-such-option"]])
+def test_startup_skips_heavy_modules(tmp_path, args):
+    times = _import_times(tmp_path, *args)
+
+    assert "uv_start.cli" in times
+    loaded = [module for module in HEAVY_MODULES if module in times]
+    assert loaded == []
+
+
+def test_config_skips_the_runner(tmp_path):
+    times = _import_times(tmp_path, "--config", "Ada", "ada@example.com")
+
+    assert "uv_start.config" in times
+    assert "asyncio" not in times
+    assert "uv_start.runner" not in times
+
+
+def test_help_with_cold_cache_runs_nothing(tmp_path):
+    times = _import_times(tmp_path, "--help", listing=False)
+
+    assert not (tmp_path / "uv-called").exists()
+    loaded = [module for module in HEAVY_MODULES if module in times]
+    assert loaded == []
+
+
+@pytest.mark.parametrize("listing", [True, False])
+def test_help_import_budget(tmp_path, listing):
+    times = _import_times(tmp_path, "--help", listing=listing)
+
+    ours = sum(
+        cumulative for cumulative, top_level in times.values() if top_level
+    )
+    assert ours < IMPORT_BUDGET_US, f"imports took {ours / 1000:.0f}ms"
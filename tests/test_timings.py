@@ -0,0 +1,101 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from uv_start.reporting import Reporter, reporting
+from uv_start.scheduler import Step, run_steps
+from uv_start.timings import TimingRecorder, recording, span
+
+
+def test_span_without_recorder_is_noop():
+    """Test that span works when timings are not enabled"""
+    with span("nothing to record"):
+        pass
+
+
+def test_recorder_collects_spans():
+    recorder = TimingRecorder()
+    with (
+        recording(recorder),
+        span("phase 1: local project"),
+        span("render README.md", "parse_docs"),
+    ):
+        pass
+
+    names = [s.name for s in recorder.spans]
+    assert names == ["render README.md", "phase 1: local project"]
+    assert recorder.spans[0].category == "parse_docs"
+    assert all(s.duration >= 0 for s in recorder.spans)
+
+
+def test_scheduler_steps_record_into_active_recorder():
+    """Test that steps on worker threads record into the caller's recorder"""
+    recorder = TimingRecorder()
+    with recording(recorder):
+        run_steps(
+            [
+                Step("scaffold", lambda: None),
+                Step("templates", lambda: None, ("scaffold",)),
+            ]
+        )
+
+    steps = {s.name: s for s in recorder.spans if s.category == "step"}
+    assert set(steps) == {"scaffold", "templates"}
+    assert steps["scaffold"].thread.startswith("uv-start-step")
+
+
+def test_write_trace(tmp_path):
+    recorder = TimingRecorder()
+    with recording(recorder), span("phase 1: local project"):
+        pass
+
+    trace_file = tmp_path / "trace.json"
+    recorder.write_trace(trace_file)
+
+    trace = json.loads(trace_file.read_text())
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert complete[0]["name"] == "phase 1: local project"
+    assert complete[0]["dur"] >= 0
+    assert any(e["ph"] == "M" for e in trace["traceEvents"])
+
+
+def test_summary_table_lists_spans():
+    recorder = TimingRecorder()
+    with recording(recorder), span("phase 2: git/GitHub"):
+        pass
+
+    table = recorder.summary_table()
+    assert table.row_count == 2  # the span plus the total row
+
+
+def test_span_reports_start_and_finish():
+    reporter = Mock(spec=Reporter)
+    with (
+        reporting(reporter),
+        span("scaffold", "step"),
+        span("uv init", "subprocess", command=["uv", "init"]) as details,
+    ):
+        details["exit_code"] = 0
+
+    started = [c.args[:2] for c in reporter.started.call_args_list]
+    assert started == [("scaffold", "step"), ("uv init", "subprocess")]
+    first = reporter.finished.call_args_list[0]
+    name, _, details, duration, error = first.args
+    assert name == "uv init"
+    assert details == {
+        "parent": "scaffold",
+        "command": ["uv", "init"],
+        "exit_code": 0,
+    }
+    assert error is None
+    assert duration >= 0
+
+
+def test_span_reports_failure():
+    reporter = Mock(spec=Reporter)
+    error = ValueError("boom")
+    with pytest.raises(ValueError), reporting(reporter), span("templates"):
+        raise error
+
+    assert reporter.finished.call_args.args[4] is error
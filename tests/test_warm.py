@@ -0,0 +1,80 @@
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from uv_start.exceptions import DependencyError
+from uv_start.warm import warm_caches
+
+
+def _commands(mock_run) -> list[list[str]]:
+    return [c.args[0] for c in mock_run.call_args_list]
+
+
+@pytest.fixture
+def mock_run():
+    with (
+        patch("uv_start.warm.run_command") as warm_run,
+        patch("uv_start.dev_deps.run_command") as deps_run,
+        patch("uv_start.warm.shutil.copy"),
+    ):
+        warm_run.return_value = Mock(returncode=1)
+        yield warm_run, deps_run
+
+
+def test_warm_caches_installs_missing_pythons(mock_run):
+    warm_run, _ = mock_run
+
+    warm_caches(["3.13", "3.12"], hooks=False)
+
+    commands = _commands(warm_run)
+    assert ["uv", "python", "install", "3.13", "3.12"] in commands
+
+
+def test_warm_caches_skips_installed_pythons(mock_run):
+    warm_run, _ = mock_run
+    warm_run.return_value = Mock(returncode=0)
+
+    warm_caches(["3.13"], hooks=False)
+
+    assert not any(
+        c[:3] == ["uv", "python", "install"] for c in _commands(warm_run)
+    )
+
+
+def test_warm_caches_installs_full_stack(mock_run):
+    warm_run, deps_run = mock_run
+
+    warm_caches(["3.13"])
+
+    deps = _commands(deps_run)
+    assert ["uv", "add", "--frozen", "python-dotenv", "jupyter", "pandas",
+            "matplotlib", "seaborn"] in deps  # fmt: skip
+    assert ["uv", "sync"] in deps
+    assert ["uv", "run", "pre-commit", "install-hooks"] in _commands(warm_run)
+
+
+def test_warm_caches_builds_hooks_once(mock_run):
+    warm_run, deps_run = mock_run
+
+    warm_caches(["3.13", "3.12"])
+
+    hooks = [c for c in _commands(warm_run) if c[-1:] == ["install-hooks"]]
+    assert len(hooks) == 1
+    assert _commands(deps_run).count(["uv", "sync"]) == 2
+
+
+def test_warm_caches_without_data_stack(mock_run):
+    _, deps_run = mock_run
+
+    warm_caches(["3.13"], data=False, hooks=False)
+
+    assert ["uv", "add", "--frozen", "python-dotenv"] in _commands(deps_run)
+
+
+def test_warm_caches_failure(mock_run):
+    _, deps_run = mock_run
+    deps_run.side_effect = subprocess.CalledProcessError(1, "uv sync")
+
+    with pytest.raises(DependencyError):
+        warm_caches(["3.13"], hooks=False)
@@ -0,0 +1,56 @@
+import pytest
+
+from uv_start.workspace import Member, Workspace, for_each
+
+
+def test_scan_lists_members_in_order(tmp_path):
+    for name in ["zeta-api", "alpha-core"]:
+        (tmp_path / "packages" / name).mkdir(parents=True)
+    (tmp_path / "packages" / "notes.txt").write_text("not a member")
+
+    workspace = Workspace.scan(tmp_path)
+
+    assert [m.name for m in workspace.members] == ["alpha-core", "zeta-api"]
+    assert workspace.pyprojects == [
+        tmp_path / "pyproject.toml",
+        tmp_path / "packages" / "alpha-core" / "pyproject.toml",
+        tmp_path / "packages" / "zeta-api" / "pyproject.toml",
+    ]
+
+
+def test_scan_without_packages(tmp_path):
+    workspace = Workspace.scan(tmp_path)
+
+    assert workspace.members == ()
+    assert workspace.files("README.md") == [tmp_path / "README.md"]
+
+
+def test_member_paths(tmp_path):
+    member = Member("alpha-core", tmp_path / "packages" / "alpha-core")
+
+    assert member.module_name == "alpha_core"
+    assert member.version_file == (
+        tmp_path / "packages/alpha-core/src/alpha_core/__init__.py"
+    )
+
+
+def test_for_each_runs_every_item():
+    seen = []
+
+    for_each(seen.append, list(range(20)))
+
+    assert sorted(seen) == list(range(20))
+
+
+def test_for_each_reraises_after_all_items():
+    seen = []
+
+    def work(item):
+        seen.append(item)
+        if item == 3:
+            raise ValueError(item)
+
+    with pytest.raises(ValueError):
+        for_each(work, list(range(10)))
+
+    assert sorted(seen) == list(range(10))